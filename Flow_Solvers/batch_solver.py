@@ -0,0 +1,124 @@
+"""
+Batched Mach Number Solver
+Vectorized inverse engine for the flow relations
+"""
+
+
+
+# Imports =========================================================================================
+# Local Imports -----------------------------------------------------------------------------------
+import time
+
+import numpy as np
+
+
+# Global Imports ----------------------------------------------------------------------------------
+from Flow_Solvers.instrumentation import active_recorder
+
+
+
+# Newton-Bisection Hybrid =========================================================================
+def newton_bisect(solver, derivative, target, mach_lower, mach_upper, args = (), tol = 1e-12, max_iter = 100,
+                  log_step = False):
+    """
+    Solves 'solver(M, target, *args) = 0' for every target at once.
+    Each element keeps its own bracket. A Newton step with the analytic derivative is taken when it
+    lands inside the bracket, otherwise the bracket is bisected (geometrically across wide brackets).
+    Only the unconverged elements are evaluated on each iteration.
+    With instrumentation enabled, the call reports its iterations and element-wise residual evaluations.
+
+    Parameters:
+    - solver (callable)     : Residual function 'SOLVE_M_from_*(M, target, *args)'
+    - derivative (callable) : Analytic derivative of the residual, 'd(M, *args)'
+    - target (float)        : Target value, or a NumPy array of target values
+    - mach_lower (float)    : Lower Mach bracket, scalar or broadcastable to 'target'
+    - mach_upper (float)    : Upper Mach bracket, scalar or broadcastable to 'target'
+    - args (tuple)          : Extra arguments after the target, scalars or broadcastable arrays
+    - tol (float)           : Relative Mach tolerance, default at 1e-12
+    - max_iter (int)        : Maximum number of iterations, default at 100
+    - log_step (bool)       : Takes the Newton step on ln(f) against ln(M), which converges much faster
+                              for the positive power-law ratios (A/A*, P/Pt, ...), default at False
+
+    Returns:
+    - (float) | (np.ndarray) : Mach number(s) with the shape of 'target'. Targets outside the bracket are NaN.
+
+    Raises:
+    - ValueError : If a scalar target is not bracketed by [mach_lower, mach_upper]
+
+    Example:
+    >>> newton_bisect(SOLVE_M_from_A_Astar, dA_Astar_dM, np.array([1.5, 2.0]), 1.000001, 1e6, args = (1.4,))
+    """
+
+    recorder  = active_recorder()
+    start     = time.perf_counter() if (recorder is not None) else 0.0
+    is_scalar = (np.ndim(target) == 0)
+    target    = np.asarray(target, dtype = float)
+    shape     = target.shape
+    target    = target.ravel()
+    args      = [np.broadcast_to(arg, shape).ravel() if (np.ndim(arg) > 0) else arg for arg in args]
+    lower     = np.broadcast_to(np.asarray(mach_lower, dtype = float), shape).ravel().copy()
+    upper     = np.broadcast_to(np.asarray(mach_upper, dtype = float), shape).ravel().copy()
+
+
+    # Bracketing ----------------------------------------------------------------------------------
+    bracket   = (np.nanmin(lower, initial = np.inf), np.nanmax(upper, initial = -np.inf))
+    f_lower   = solver(lower, target, *args)
+    f_upper   = solver(upper, target, *args)
+    bracketed = (np.sign(f_lower) * np.sign(f_upper) <= 0)
+
+    if (is_scalar and (not bracketed[0])):
+        if (recorder is not None):
+            recorder.record('newton_bisect', solver, 0, 2, 1, time.perf_counter() - start, bracket, False)
+        raise ValueError("f(a) and f(b) must have different signs")
+
+    lower_sign = np.sign(f_lower)
+    mach       = np.where(f_lower == 0, lower, np.where(f_upper == 0, upper, np.sqrt(lower * upper)))
+    active     = bracketed & (f_lower != 0) & (f_upper != 0)
+
+
+    # Iteration -----------------------------------------------------------------------------------
+    iterations = 0
+    fevals     = 2 * target.size
+    with np.errstate(divide = 'ignore', invalid = 'ignore', over = 'ignore'):
+        for _ in range(max_iter):
+            index = np.flatnonzero(active)
+            if (index.size == 0):
+                break
+
+            iterations += 1
+            fevals     += index.size
+            sub_args  = [arg[index] if (np.ndim(arg) > 0) else arg for arg in args]
+            M         = mach[index]
+            residual  = solver(M, target[index], *sub_args)
+
+            # Shrink the bracket around the root
+            move_lower = (np.sign(residual) == lower_sign[index])
+            lo = np.where(move_lower, M, lower[index])
+            hi = np.where(move_lower, upper[index], M)
+            lower[index] = lo
+            upper[index] = hi
+
+            # Newton step, falling back to bisection outside the bracket
+            slope  = derivative(M, *sub_args)
+            if (log_step):
+                value = residual + target[index]
+                M_new = M * np.exp(-np.log(value / target[index]) * value / (M * slope))
+            else:
+                M_new = M - residual / slope
+            midway = np.where(hi > 4 * lo, np.sqrt(lo * hi), 0.5 * (lo + hi))
+            M_new  = np.where((M_new >= lo) & (M_new <= hi), M_new, midway)
+
+            mach[index] = M_new
+            converged = (residual == 0) | (np.abs(M_new - M) <= tol * M_new) | ((hi - lo) <= tol * hi)
+            active[index[converged]] = False
+
+    mach[~bracketed] = np.nan
+
+    if (recorder is not None):
+        converged = bool(np.all(bracketed) and (not np.any(active)))
+        recorder.record('newton_bisect', solver, iterations, fevals, target.size, time.perf_counter() - start, bracket, converged)
+    
+    if (is_scalar):
+        return float(mach[0])
+
+    return mach.reshape(shape)
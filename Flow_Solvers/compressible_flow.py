@@ -5,6 +5,298 @@ CompressibleFlow Superclass
 
 
 
+# Imports =========================================================================================
+# Local Imports -----------------------------------------------------------------------------------
+from collections import OrderedDict
+
+import numpy as np
+
+
+# Global Imports ----------------------------------------------------------------------------------
+from Flow_Solvers.instrumentation import active_recorder, solver_context
+
+
+
+# Result Cache ====================================================================================
+class ResultCache:
+    """
+    Bounded least recently used cache of computed flow results.
+    
+    Attributes:
+    - maxsize (int) : Maximum number of cached results
+    - hits (int)    : Number of lookups answered from the cache
+    - misses (int)  : Number of lookups that had to run 'computation()'
+    
+    Methods:
+    - get()   : Returns a cached entry or None, and moves it to the most recently used position
+    - put()   : Stores an entry, evicting the least recently used one when full
+    - clear() : Removes all entries, or only the entries of one class
+    - info()  : Cache statistics as a dictionary
+    """
+    
+    def __init__(self, maxsize: int = 1024) -> None:
+        """
+        Constructor to initialize the cache.
+        
+        Parameters:
+        - maxsize (int) : Maximum number of cached results, default at 1024
+        
+        Raises:
+        - ValueError : If maxsize is not positive
+        """
+        
+        if (maxsize <= 0):
+            raise ValueError("maxsize must be positive")
+        
+        self.maxsize : int = maxsize
+        self.hits    : int = 0
+        self.misses  : int = 0
+        self._data   : OrderedDict = OrderedDict()
+        
+        
+    def __len__(self) -> int:
+        return len(self._data)
+        
+        
+    def get(self, key: tuple) -> tuple | None:
+        """
+        Looks up a cached entry.
+        
+        Parameters:
+        - key (tuple) : (class, input_var, input_val, gamma, ...)
+        
+        Returns:
+        - (tuple) | (None) : The cached (mach, results) pair or 'None' on a miss.
+        """
+        
+        entry = self._data.get(key)
+        if (entry is None):
+            self.misses += 1
+            return None
+        
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry
+    
+    
+    def put(self, key: tuple, entry: tuple) -> None:
+        """
+        Stores an entry as the most recently used one.
+        
+        Parameters:
+        - key (tuple)   : (class, input_var, input_val, gamma, ...)
+        - entry (tuple) : (mach, results) pair
+        """
+        
+        self._data[key] = entry
+        self._data.move_to_end(key)
+        while (len(self._data) > self.maxsize):
+            self._data.popitem(last = False)
+            
+            
+    def clear(self, flow_class: type | None = None) -> None:
+        """
+        Invalidates cached entries.
+        
+        Parameters:
+        - flow_class (type) : Only entries of this class (and its subclasses) are removed, all if None
+        """
+        
+        if (flow_class is None):
+            self._data.clear()
+            return
+        
+        for key in [key for key in self._data if issubclass(key[0], flow_class)]:
+            del self._data[key]
+            
+            
+    def info(self) -> dict[str, int]:
+        """
+        Cache statistics.
+        
+        Returns:
+        - (dict[str, int]) : 'hits', 'misses', 'size', and 'maxsize'
+        """
+        
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._data), 'maxsize': self.maxsize}
+
+
+
+# Flow Results ====================================================================================
+class FlowResults:
+    """
+    Struct-of-arrays container of the flow properties computed from array inputs.
+    Every field is one float64 array over (regimes, *shape), and the merged value of each field
+    (first regime first, NaN entries filled from the following regimes) is built once, so attribute
+    access on the flow classes is a single lookup. Fields can be added later with 'add_field()'.
+    Scalar flows keep the plain '{regime: {field: float}}' dictionaries and never build the container.
+    
+    Indexing by regime name still returns a '{field: value}' dictionary, so 'results[regime][field]',
+    'keys()', 'items()', and 'values()' behave like the nested dictionaries computed by the subclasses.
+    
+    Attributes:
+    - regimes (tuple[str, ...]) : Regime names in order
+    - fields (tuple[str, ...])  : Field names in order
+    - columns (dict)            : Field name to its (regimes, *shape) float64 array, NaN where a regime has no value
+    - block (np.ndarray)        : (regimes, fields, *shape) stack of the columns, built on request
+    - present (np.ndarray)      : (regimes, fields) True where a regime computed the field
+    - masks (np.ndarray)        : (regimes, *shape) True where a regime holds the entry (first field not NaN)
+    - merged (dict)             : Field name to merged array
+    - shape (tuple[int, ...])   : Broadcast shape of the inputs
+    
+    Methods:
+    - holds_arrays() : Whether regime dictionaries were computed from array inputs
+    - add_field()    : Adds one field computed for some of the regimes
+    - mask()         : Regime mask of one regime
+    - to_dict()      : Nested '{regime: {field: value}}' dictionary
+    
+    Example:
+    >>> IF = IsentropicFlow('M', np.linspace(0.1, 3.0, 1000))
+    >>> IF.results.mask('Supersonic')
+    >>> IF.results.merged['P_Pt']
+    """
+    
+    __slots__ = ('regimes', 'fields', 'merged', 'shape', 'columns', '_present', 'masks')
+    
+    def __init__(self, data: dict[str, dict[str, np.ndarray]]) -> None:
+        """
+        Constructor to pack the nested regime dictionaries.
+        
+        Parameters:
+        - data (dict[str, dict[str, np.ndarray]]) : '{regime: {field: value}}' with NumPy arrays
+        """
+        
+        self.regimes  : tuple[str, ...] = tuple(data)
+        self.fields   : tuple[str, ...] = ()
+        self.merged   : dict[str, np.ndarray] = {}
+        self.shape    : tuple[int, ...] = np.broadcast_shapes(*[np.shape(value) for regime in data.values() for value in regime.values()])
+        self.columns  : dict[str, np.ndarray] = {}
+        self._present : dict[str, tuple[bool, ...]] = {}
+        
+        for field in dict.fromkeys(field for regime in data.values() for field in regime):
+            self.add_field(field, {regime: values[field] for regime, values in data.items() if (field in values)})
+        
+        # A regime holds an entry where its first computed field is defined
+        self.masks : np.ndarray = np.zeros((len(self.regimes),) + self.shape, dtype = bool)
+        for r, values in enumerate(data.values()):
+            if (values):
+                self.masks[r] = ~np.isnan(self.columns[next(iter(values))][r])
+    
+    
+    @staticmethod
+    def holds_arrays(data: dict[str, dict[str, float | np.ndarray]]) -> bool:
+        """
+        Whether the regime dictionaries hold arrays, from the first field of each regime.
+        
+        Parameters:
+        - data (dict[str, dict[str, float]]) : '{regime: {field: value}}'
+        
+        Returns:
+        - (bool) : True if any regime holds a NumPy array of at least one dimension
+        """
+        
+        for values in data.values():
+            for value in values.values():
+                if (isinstance(value, np.ndarray) and (value.ndim > 0)):
+                    return True
+                break
+        
+        return False
+    
+    
+    def add_field(self, field: str, values: dict[str, float | np.ndarray]) -> None:
+        """
+        Adds or replaces one field and merges it.
+        
+        Parameters:
+        - field (str)                              : Field name
+        - values (dict[str, float | np.ndarray]) : Regime name to the value of that regime
+        """
+        
+        if (field not in self.fields):
+            self.fields = self.fields + (field,)
+        
+        column = np.full((len(self.regimes),) + self.shape, np.nan)
+        merged = np.full(self.shape, np.nan)
+        for r, regime in enumerate(self.regimes):
+            if (regime in values):
+                column[r] = values[regime]
+                np.copyto(merged, column[r], where = np.isnan(merged))
+        
+        self.columns[field]  = column
+        self._present[field] = tuple(regime in values for regime in self.regimes)
+        self.merged[field]   = merged
+    
+    
+    @property
+    def block(self) -> np.ndarray:
+        return np.stack([self.columns[field] for field in self.fields], axis = 1)
+    
+    
+    @property
+    def present(self) -> np.ndarray:
+        return np.array([self._present[field] for field in self.fields], dtype = bool).reshape(len(self.fields), len(self.regimes)).T
+    
+    
+    def mask(self, regime: str) -> np.ndarray:
+        """
+        Regime mask.
+        
+        Parameters:
+        - regime (str) : Regime name
+        
+        Returns:
+        - (np.ndarray) : True where the regime holds the entry
+        """
+        
+        return self.masks[self.regimes.index(regime)]
+    
+    
+    def __getitem__(self, regime: str) -> dict[str, np.ndarray]:
+        if (regime not in self.regimes):
+            raise KeyError(regime)
+        
+        r = self.regimes.index(regime)
+        return {field: self.columns[field][r] for field in self.fields if (self._present[field][r])}
+    
+    
+    def __contains__(self, regime: str) -> bool:
+        return regime in self.regimes
+    
+    
+    def __iter__(self):
+        return iter(self.regimes)
+    
+    
+    def __len__(self) -> int:
+        return len(self.regimes)
+    
+    
+    def keys(self) -> tuple[str, ...]:
+        return self.regimes
+    
+    
+    def values(self) -> list[dict[str, np.ndarray]]:
+        return [self[regime] for regime in self.regimes]
+    
+    
+    def items(self) -> list[tuple[str, dict[str, np.ndarray]]]:
+        return [(regime, self[regime]) for regime in self.regimes]
+    
+    
+    def to_dict(self) -> dict[str, dict[str, np.ndarray]]:
+        """
+        Unpacks the container.
+        
+        Returns:
+        - (dict[str, dict[str, np.ndarray]]) : '{regime: {field: value}}', with the layout computed by the subclass
+        """
+        
+        return dict(self.items())
+
+
+
+# Compressible Flow Superclass ====================================================================
 class CompressibleFlow:
     """
     CompressibleFlow is the superclass that handles the following flow regimes:
@@ -16,18 +308,38 @@ class CompressibleFlow:
     
     Attributes:
     - input_var (str)   : Name of the input variable
-    - input_val (float) : The value of the input variable
+    - input_val (float) : The value of the input variable, or a NumPy array of values
     - gamma (float)     : Heat capacity ratio, default at 1.4
     - _mach (float)     : Private Mach number
-    - results (dict)    : Flow result summary
+    - lazy (bool)       : Only the Mach number is solved at construction, the properties on first access
+    - results (dict)    : '{regime: {field: float}}' of 'computation()', packed into FlowResults for array inputs
+    - _cache (ResultCache) : Shared result cache, 'None' until enabled
+    - PROPERTIES (dict) : Class-level property name to 'relation(M, gamma)', evaluated from the regime Mach numbers
+    - MACH_FIELD (str)  : Name of the Mach number field the 'PROPERTIES' are evaluated from
     
     Methods:
-    - computation() : Child class placeholder method
-    - summary       : Shows all flow results as a dictionary
-    - __str__()     : Fancy formatter of the values
+    - computation()   : Child class placeholder method
+    - summary         : Shows all flow results as a dictionary
+    - __str__()       : Fancy formatter of the values
+    - __getattr__()   : Direct read of the merged flow properties, lazy ones are evaluated on first access
+    - enable_cache()  : Turns on the shared result cache
+    - disable_cache() : Turns off and drops the shared result cache
+    - clear_cache()   : Invalidates the cached results of a class
+    - cache_info()    : Cache hit and miss counters
+    
+    Example:
+    >>> CompressibleFlow.enable_cache(maxsize = 4096)
+    >>> IsentropicFlow('M', 2.0)
+    >>> IsentropicFlow('M', 2.0)       # Served from the cache
+    >>> CompressibleFlow.cache_info()  # {'hits': 1, 'misses': 1, 'size': 1, 'maxsize': 4096}
+    >>> IsentropicFlow('P_Pt', 0.5, lazy = True).T_Tt  # Only T_Tt is evaluated
     """
     
-    def __init__(self, input_var: str, input_val: float, gamma: float = 1.4) -> None:
+    _cache     : ResultCache | None = None
+    PROPERTIES : dict = {}
+    MACH_FIELD : str = 'M'
+    
+    def __init__(self, input_var: str, input_val: float, gamma: float = 1.4, lazy: bool = False) -> None:
         """
         Constructor to initialize the compressible flow. 
         
@@ -35,15 +347,39 @@ class CompressibleFlow:
         - input_var (str)   : Name of the input variable
         - input_val (float) : The value of the input variable
         - gamma (float)     : Heat capacity ratio, default at 1.4
+        - lazy (bool)       : Evaluates each property on first access instead of at construction, default at False
         """
         
         self.input_var : str = input_var
         self.input_val : float = input_val
         self.gamma     : float = gamma
+        self.lazy      : bool = lazy
         self._mach     : float | None = None
         self.results   : dict = {}
         
-        self.computation()
+        cache = CompressibleFlow._cache
+        key   = self._cache_key() if (cache is not None) else None
+        if (key is not None):
+            entry = cache.get(key)
+            if (entry is not None):
+                self._mach, self.results = entry
+                return
+        
+        if (active_recorder() is None):
+            self.computation()
+        else:
+            with solver_context(self.__class__.__name__, self.input_var):
+                self.computation()
+        
+        if (not lazy):
+            self._evaluate(self.results, self.PROPERTIES)
+        
+        # Only array results are packed, scalar ones stay plain float dictionaries
+        if (FlowResults.holds_arrays(self.results)):
+            self.results = FlowResults(self.results)
+        
+        if (key is not None):
+            cache.put(key, (self._mach, self.results))
         
         
     def __str__(self) -> str:
@@ -61,7 +397,10 @@ class CompressibleFlow:
             
             lines.append(f"{regime} Flow:")
             for key, value in variables.items():
-                lines.append(f"    {key:12s} = {value:.6f}")
+                if (np.ndim(value) > 0):
+                    lines.append(f"    {key:12s} = {np.array2string(np.asarray(value), precision = 6)}")
+                else:
+                    lines.append(f"    {key:12s} = {value:.6f}")
             lines.append("")
             
         return "\n".join(lines)
@@ -85,13 +424,14 @@ class CompressibleFlow:
         Setter for the Mach number. Validation checker before it is assigned.
         
         Parameters:
-        - value (float) : Mach number assigning.
+        - value (float) : Mach number assigning, or a NumPy array of Mach numbers.
         
         Raises:
-        - ValueError : If the Mach number is not positive.
+        - ValueError : If any Mach number is not positive.
         """
         
-        if (value <= 0):
+        invalid = np.any(np.asarray(value) <= 0) if (isinstance(value, np.ndarray)) else (value <= 0)
+        if (invalid):
             raise ValueError("Mach number must be positive")
         
         self._mach = value
@@ -110,10 +450,136 @@ class CompressibleFlow:
         """
         
         if (hasattr(self, "results")):
-            return self.results
+            for name in self.PROPERTIES:
+                getattr(self, name)
+            return self.results.to_dict() if (isinstance(self.results, FlowResults)) else self.results
         else:
             raise AttributeError("Computation has not been run yet.")
+    
+    
+    def __getattr__(self, attribute_title: str) -> float | np.ndarray:
+        """
+        Creates attributes for each flow property. The merged value is read directly from the results:
+        the first regime for scalars, and for arrays the NaN entries of the first regime filled from the following ones.
+        
+        Parameter:
+        - attribute_title (str) : Attribute title
+        
+        Raises:
+        - AttributeError if name not found in any regime.
         
+        Examples:
+        >>> IF.P_Pt
+        >>> NS.Pt2_Pt1
+        """
+        
+        results = self.__dict__.get('results')
+        if (isinstance(results, FlowResults)):
+            if (attribute_title in results.merged):
+                return results.merged[attribute_title]
+            
+            # Lazy Evaluation, from the Mach number of every regime that has one
+            if ((attribute_title in self.PROPERTIES) and (self.MACH_FIELD in results.merged)):
+                data = {regime: {self.MACH_FIELD: values[self.MACH_FIELD]} for regime, values in results.items() if (self.MACH_FIELD in values)}
+                self._evaluate(data, [attribute_title])
+                results.add_field(attribute_title, {regime: values[attribute_title] for regime, values in data.items()})
+                return results.merged[attribute_title]
+        
+        elif (results is not None):
+            for values in results.values():
+                if (attribute_title in values):
+                    return values[attribute_title]
+            
+            # Lazy Evaluation, into the regime dictionaries
+            if (attribute_title in self.PROPERTIES):
+                self._evaluate(results, [attribute_title])
+                for values in results.values():
+                    if (attribute_title in values):
+                        return values[attribute_title]
+        
+        raise AttributeError(f"'{self.__class__.__name__}' has no attribute '{attribute_title}'")
+        
+    
+    def _evaluate(self, data: dict[str, dict[str, float]], names) -> None:
+        """
+        Evaluates flow properties from the Mach number of each regime, in place.
+        
+        Parameters:
+        - data (dict[str, dict[str, float]]) : '{regime: {field: value}}' holding 'MACH_FIELD'
+        - names (iterable[str])              : Names in 'PROPERTIES' to evaluate
+        """
+        
+        for values in data.values():
+            if (self.MACH_FIELD not in values):
+                continue
+            
+            M       = values[self.MACH_FIELD]
+            convert = np.asarray if (isinstance(M, np.ndarray) and (M.ndim > 0)) else float
+            for name in names:
+                values[name] = convert(self.PROPERTIES[name](M, self.gamma))
+    
+    
+    def _cache_key(self) -> tuple | None:
+        """
+        Key of this flow in the result cache. Subclasses with extra inputs extend the key.
+        
+        Returns:
+        - (tuple) | (None) : (class, input_var, input_val, gamma, lazy) or 'None' for array inputs, which are not cached.
+                             Lazy results are partial, so they never answer an eager construction.
+        """
+        
+        if ((np.ndim(self.input_val) > 0) or (np.ndim(self.gamma) > 0)):
+            return None
+        
+        return (self.__class__, self.input_var, float(self.input_val), float(self.gamma), bool(self.lazy))
+    
+    
+    @classmethod
+    def enable_cache(cls, maxsize: int = 1024) -> None:
+        """
+        Turns on the result cache shared by all flow classes. Repeated constructions with identical
+        arguments then reuse the cached results instead of running 'computation()' again.
+        
+        Parameters:
+        - maxsize (int) : Maximum number of cached results, default at 1024
+        """
+        
+        CompressibleFlow._cache = ResultCache(maxsize)
+        
+        
+    @classmethod
+    def disable_cache(cls) -> None:
+        """
+        Turns off the result cache and drops its entries.
+        """
+        
+        CompressibleFlow._cache = None
+        
+        
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Invalidates the cached results of the calling class. 'CompressibleFlow.clear_cache()' clears every entry.
+        """
+        
+        if (CompressibleFlow._cache is not None):
+            CompressibleFlow._cache.clear(None if (cls is CompressibleFlow) else cls)
+            
+            
+    @classmethod
+    def cache_info(cls) -> dict[str, int] | None:
+        """
+        Statistics of the result cache.
+        
+        Returns:
+        - (dict[str, int]) | (None) : 'hits', 'misses', 'size', and 'maxsize', or 'None' if the cache is off
+        """
+        
+        if (CompressibleFlow._cache is None):
+            return None
+        
+        return CompressibleFlow._cache.info()
+    
     
     def computation(self) -> None:
         """
@@ -9,44 +9,54 @@ Subclass of CompressibleFlow
 # Imports =========================================================================================
 # Local Imports -----------------------------------------------------------------------------------
 import numpy as np
-from scipy.optimize import brentq
 
 
 # Global Imports ----------------------------------------------------------------------------------
 from Flow_Solvers.compressible_flow import CompressibleFlow
+from Flow_Solvers.batch_solver import newton_bisect
+from Flow_Solvers.gas_constants import gas_constants
+from Flow_Solvers.instrumentation import brentq
 
 
 
 # Fanno Flow Relations ===========================================================================
+# Every ratio is a power of T*/T = 2 / (gamma + 1) (1 + (gamma - 1) / 2 M^2), built from the cached gas constants
 # Pressure Ratios ---------------------------------------------------------------------------------
 def P_Pstar(M, gamma):
-    return (1 / M) * (1 / np.sqrt((2 / (gamma + 1)) * (1 + ((gamma - 1) / 2) * M**2)))
+    c = gas_constants(gamma)
+    return (1 / M) * (1 / np.sqrt(c.two_gp1 * (1 + c.gm1_2 * M**2)))
 
 def Pt_Ptstar(M, gamma):
-    return (1 / M) * ((2 / (gamma + 1)) * (1 + ((gamma - 1) / 2) * M**2))**((gamma + 1) / (2 * (gamma - 1)))
+    c = gas_constants(gamma)
+    return (1 / M) * (c.two_gp1 * (1 + c.gm1_2 * M**2))**c.gp1_2gm1
 
 # Density Ratios ----------------------------------------------------------------------------------
 def rho_rhostar(M, gamma):
-    return np.sqrt((2 / (gamma + 1)) * (1 + ((gamma - 1) / 2) * M**2)) / M
+    c = gas_constants(gamma)
+    return np.sqrt(c.two_gp1 * (1 + c.gm1_2 * M**2)) / M
 
 def rhot_rhotstar(M, gamma):
-    return (1 / M) * ((2 / (gamma + 1)) * (1 + ((gamma - 1) / 2) * M**2))**((gamma + 1) / (2 * (gamma - 1)))
+    c = gas_constants(gamma)
+    return (1 / M) * (c.two_gp1 * (1 + c.gm1_2 * M**2))**c.gp1_2gm1
 
 # Temperature Ratios ------------------------------------------------------------------------------
 def T_Tstar(M, gamma):
-    return 1 / ((2 / (gamma + 1)) * (1 + ((gamma - 1) / 2) * M**2))
+    c = gas_constants(gamma)
+    return 1 / (c.two_gp1 * (1 + c.gm1_2 * M**2))
 
 def Tt_Ttstar(M, gamma):
     return 1.0  
 
 # Velocity and Length -----------------------------------------------------------------------------
 def u_ustar(M, gamma):
-    return M / np.sqrt((2 / (gamma + 1)) * (1 + ((gamma - 1) / 2) * M**2))
+    c = gas_constants(gamma)
+    return M / np.sqrt(c.two_gp1 * (1 + c.gm1_2 * M**2))
 
 def cfLstar_D(M, gamma):
+    c = gas_constants(gamma)
     term_1 = ((1 - M**2) / (gamma * M**2))
-    term_2 = ((gamma + 1) / (2 * gamma))
-    term_3 = np.log(M**2 / ((2 / (gamma + 1)) * (1 + ((gamma - 1) / 2) * M**2)))
+    term_2 = c.gp1_2g
+    term_3 = np.log(M**2 / (c.two_gp1 * (1 + c.gm1_2 * M**2)))
     return term_1 + term_2 * term_3
 
 
@@ -82,6 +92,35 @@ def SOLVE_M_from_cfLstar_D(M, target, gamma):
 
 
 
+# Batched Friction Length Inverse =================================================================
+def dcfLstar_D_dM(M, gamma):
+    return 4 * (M**2 - 1) / (gamma * M**3 * (2 + gas_constants(gamma).gm1 * M**2))
+
+def M_from_cfLstar_D(cfLstar_D_val, gamma, supersonic):
+    """
+    Inverts cf L*/D on the subsonic or supersonic branch for an array of targets.
+    
+    Parameters:
+    - cfLstar_D_val (float) : Friction length parameter, or a NumPy array
+    - gamma (float)         : Heat capacity ratio
+    - supersonic (bool)     : Supersonic branch if True, subsonic branch if False
+    
+    Returns:
+    - (float) | (np.ndarray) : Mach number(s). A zero friction length gives M = 1, out of range values are NaN.
+    """
+    
+    mach_lower, mach_upper = (1.000001, 1e6) if (supersonic) else (1e-6, 0.999999)
+    target = np.asarray(cfLstar_D_val, dtype = float)
+    mach   = newton_bisect(SOLVE_M_from_cfLstar_D, dcfLstar_D_dM, target.ravel(), mach_lower, mach_upper, args = (gamma,))
+    mach   = np.where(target.ravel() == 0, 1.0, mach).reshape(target.shape)
+    
+    if (mach.ndim == 0):
+        return float(mach)
+    
+    return mach
+
+
+
 # Fanno Flow Subclass of Compressible Flow ========================================================
 class FannoFlow(CompressibleFlow):
     """
@@ -93,8 +132,19 @@ class FannoFlow(CompressibleFlow):
     
     Methods:
     - computation() : Computes all Fanno flow values. 
-    - __getattr__() : Creates attributes to any given variable. 
+    - __getattr__() : Inherited, reads the flow properties from the packed results.
     """
+    
+    PROPERTIES = {
+        'P_Pstar'       : P_Pstar,
+        'rho_rhostar'   : rho_rhostar,
+        'T_Tstar'       : T_Tstar,
+        'u_ustar'       : u_ustar,
+        'Pt_Ptstar'     : Pt_Ptstar,
+        'Tt_Ttstar'     : Tt_Ttstar,
+        'rhot_rhotstar' : rhot_rhotstar,
+        'cfLstar_D'     : cfLstar_D,
+    }
 
     def computation(self) -> None:
         """
@@ -203,50 +253,123 @@ class FannoFlow(CompressibleFlow):
         
         
         # Data Organiztion ------------------------------------------------------------------------
+        # Only the Mach number is stored, the superclass evaluates the 'PROPERTIES' from it
         for flow_regime in ['Subsonic', 'Supersonic']:
             if ('M' in data[flow_regime]):
-                data[flow_regime]['M'] = float(self.mach)
-                data[flow_regime]['P_Pstar'] = float(P_Pstar(self.mach, gamma))
-                data[flow_regime]['rho_rhostar'] = float(rho_rhostar(self.mach, gamma))
-                data[flow_regime]['T_Tstar'] = float(T_Tstar(self.mach, gamma))
-                data[flow_regime]['u_ustar'] = float(u_ustar(self.mach, gamma))
-                data[flow_regime]['Pt_Ptstar'] = float(Pt_Ptstar(self.mach, gamma))
-                data[flow_regime]['Tt_Ttstar'] = float(Tt_Ttstar(self.mach, gamma))
-                data[flow_regime]['rhot_rhotstar'] = float(rhot_rhotstar(self.mach, gamma))
-                data[flow_regime]['cfLstar_D'] = float(cfLstar_D(self.mach, gamma))
+                data[flow_regime]['M'] = float(data[flow_regime]['M'])
                 
         self.results = data
+
+
+
+# Fanno Duct Marching =============================================================================
+class FannoDuct:
+    """
+    FannoDuct marches adiabatic, frictional flow through a constant-area duct described by axial stations.
+    The friction parameter cf dx / D is integrated with the trapezoid rule, and the remaining cf L*/D is
+    inverted at every station in one vectorized call.
+    
+    Attributes:
+    - M1 (float)              : Inlet Mach number, or a NumPy array of inlet Mach numbers (one case each)
+    - x (np.ndarray)          : Axial stations, starting at the inlet
+    - D (np.ndarray)          : Hydraulic diameter at each station (or a scalar)
+    - cf (np.ndarray)         : Friction coefficient at each station (or a scalar), same convention as 'cfLstar_D'
+    - gamma (float)           : Heat capacity ratio, default at 1.4
+    - cfL_D (np.ndarray)      : Integrated friction parameter from the inlet to each station
+    - cfLstar_D (np.ndarray)  : Remaining friction length to the sonic point at each station
+    - M (np.ndarray)          : Mach number at each station, NaN past the choking point
+    - P_Pstar, T_Tstar, Pt_Ptstar, rho_rhostar, u_ustar (np.ndarray) : Fanno ratios at each station
+    - P_P1, T_T1, Pt_Pt1 (np.ndarray) : Ratios to the inlet station
+    - choked (bool)           : True where the duct is longer than the inlet L*
+    - choking_length (float)  : Axial position where the flow reaches M = 1, NaN if not choked
+    
+    Example:
+    >>> x = np.linspace(0.0, 2.0, 20001)
+    >>> FD = FannoDuct(0.3, x, D = 0.05, cf = 0.02)
+    >>> FD.M[-1], FD.choked, FD.choking_length
+    """
+    
+    def __init__(self, M1: float, x: np.ndarray, D: float | np.ndarray, cf: float | np.ndarray, gamma: float = 1.4) -> None:
+        """
+        Constructor to march the duct.
         
+        Parameters:
+        - M1 (float)        : Inlet Mach number, or a NumPy array of inlet Mach numbers
+        - x (np.ndarray)    : Axial stations, strictly increasing
+        - D (float)         : Hydraulic diameter, scalar or one value per station
+        - cf (float)        : Friction coefficient, scalar or one value per station
+        - gamma (float)     : Heat capacity ratio, default at 1.4
         
-        
-    def __getattr__(self, attribute_title: str) -> float:
+        Raises:
+        - ValueError : If the stations are not increasing or an inlet Mach number is not positive
         """
-        Creates decorators for each flow property. 
         
-        Parameter:
-        - attribute_title (str) : Attribute title
-
-        Raises:
-        - AttributeError if name not found in any regime.
+        x = np.asarray(x, dtype = float)
+        if ((x.ndim != 1) or np.any(np.diff(x) <= 0)):
+            raise ValueError('x must be a strictly increasing 1D array of stations')
+        
+        if (np.any(np.asarray(M1) <= 0)):
+            raise ValueError('M1 must be greater than 0')
         
-        Examples:
-        >>> FF.P_Pstar
-        >>> FF.cfLstar_D
+        self.M1    = M1
+        self.x     = x
+        self.D     = D
+        self.cf    = cf
+        self.gamma = gamma
+        
+        self.computation()
+        
+        
+    def computation(self) -> None:
         """
+        Integrates the friction parameter and inverts cf L*/D at every station.
+        """
+        
+        gamma = self.gamma
+        x     = self.x
+        M1    = np.asarray(self.M1, dtype = float)[..., None]
+        
+        
+        # Friction Integration --------------------------------------------------------------------
+        cf_D  = np.broadcast_to(np.asarray(self.cf, dtype = float) / np.asarray(self.D, dtype = float), x.shape)
+        cfL_D = np.concatenate(([0.0], np.cumsum(0.5 * (cf_D[1:] + cf_D[:-1]) * np.diff(x))))
+        
+        inlet_cfLstar_D = cfLstar_D(M1, gamma)
+        remaining       = inlet_cfLstar_D - cfL_D
+        
+        
+        # Station Mach Numbers --------------------------------------------------------------------
+        supersonic = np.broadcast_to(M1 > 1, remaining.shape)
+        flowing    = (remaining >= 0)
+        M          = np.full(remaining.shape, np.nan)
+        for branch in [False, True]:
+            mask = flowing & (supersonic == branch)
+            if (np.any(mask)):
+                M[mask] = M_from_cfLstar_D(remaining[mask], gamma, supersonic = branch)
+                
+        M[..., 0] = M1[..., 0]
+        
         
-        for regime in self.results.values():
-            if (attribute_title in regime):
-                return regime[attribute_title]
+        # Choking ---------------------------------------------------------------------------------
+        inlet_L = inlet_cfLstar_D[..., 0]
+        choked  = (inlet_L < cfL_D[-1])
+        self.choking_length = np.where(choked, np.interp(inlet_L, cfL_D, x), np.nan)
+        self.choked         = choked
+        
+        if (self.choking_length.ndim == 0):
+            self.choking_length = float(self.choking_length)
+            self.choked         = bool(self.choked)
             
-        raise AttributeError(f"'{self.__class__.__name__}' has no attribute '{attribute_title}'")
-
-
-
-
-
-
-
-
-
-
-
+            
+        # Data Organization -----------------------------------------------------------------------
+        self.cfL_D       = cfL_D
+        self.cfLstar_D   = np.where(np.isnan(M), np.nan, remaining)
+        self.M           = M
+        self.P_Pstar     = P_Pstar(M, gamma)
+        self.T_Tstar     = T_Tstar(M, gamma)
+        self.Pt_Ptstar   = Pt_Ptstar(M, gamma)
+        self.rho_rhostar = rho_rhostar(M, gamma)
+        self.u_ustar     = u_ustar(M, gamma)
+        self.P_P1        = self.P_Pstar / P_Pstar(M1, gamma)
+        self.T_T1        = self.T_Tstar / T_Tstar(M1, gamma)
+        self.Pt_Pt1      = self.Pt_Ptstar / Pt_Ptstar(M1, gamma)
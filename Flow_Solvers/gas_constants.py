@@ -0,0 +1,104 @@
+"""
+Gas Constants
+Cached gamma-only coefficients shared by the flow relations
+"""
+
+
+
+# Imports =========================================================================================
+# Local Imports -----------------------------------------------------------------------------------
+import numpy as np
+
+
+
+# Gas Constants ===================================================================================
+GAS_CACHE_MAX : int = 16
+
+class GasConstants:
+    """
+    Coefficients of the flow relations that depend on gamma only.
+    Names read left to right, e.g. 'gm1_2' is (gamma - 1) / 2 and 'gp1_2gm1' is (gamma + 1) / (2 (gamma - 1)).
+
+    Attributes:
+    - gamma (float)         : Heat capacity ratio
+    - gm1 (float)           : gamma - 1
+    - gp1 (float)           : gamma + 1
+    - gm1_2 (float)         : (gamma - 1) / 2
+    - gp1_2 (float)         : (gamma + 1) / 2
+    - two_gp1 (float)       : 2 / (gamma + 1)
+    - two_gm1 (float)       : 2 / (gamma - 1)
+    - one_gm1 (float)       : 1 / (gamma - 1)
+    - g_gm1 (float)         : gamma / (gamma - 1)
+    - gm1_g (float)         : (gamma - 1) / gamma
+    - gp1_2gm1 (float)      : (gamma + 1) / (2 (gamma - 1)), the A/A* exponent
+    - gp1_2g (float)        : (gamma + 1) / (2 gamma)
+    - two_g_gp1 (float)     : 2 gamma / (gamma + 1)
+    - gm1_gp1 (float)       : (gamma - 1) / (gamma + 1)
+    - sqrt_gp1_gm1 (float)  : sqrt((gamma + 1) / (gamma - 1))
+    - Tstar_T0 (float)      : T* / T0 = 2 / (gamma + 1)
+    - Pstar_P0 (float)      : P* / P0 = (2 / (gamma + 1))^(gamma / (gamma - 1))
+    - rhostar_rho0 (float)  : rho* / rho0 = (2 / (gamma + 1))^(1 / (gamma - 1))
+
+    Every attribute is a NumPy array instead when gamma is an array.
+    """
+
+    __slots__ = ('gamma', 'gm1', 'gp1', 'gm1_2', 'gp1_2', 'two_gp1', 'two_gm1', 'one_gm1', 'g_gm1', 'gm1_g',
+                 'gp1_2gm1', 'gp1_2g', 'two_g_gp1', 'gm1_gp1', 'sqrt_gp1_gm1', 'Tstar_T0', 'Pstar_P0', 'rhostar_rho0')
+
+    def __init__(self, gamma: float) -> None:
+        """
+        Constructor to evaluate the coefficients once.
+
+        Parameters:
+        - gamma (float) : Heat capacity ratio, or a NumPy array
+        """
+
+        self.gamma        = gamma
+        self.gm1          = gamma - 1
+        self.gp1          = gamma + 1
+        self.gm1_2        = (gamma - 1) / 2
+        self.gp1_2        = (gamma + 1) / 2
+        self.two_gp1      = 2 / (gamma + 1)
+        self.two_gm1      = 2 / (gamma - 1)
+        self.one_gm1      = 1 / (gamma - 1)
+        self.g_gm1        = gamma / (gamma - 1)
+        self.gm1_g        = (gamma - 1) / gamma
+        self.gp1_2gm1     = (gamma + 1) / (2 * (gamma - 1))
+        self.gp1_2g       = (gamma + 1) / (2 * gamma)
+        self.two_g_gp1    = 2 * gamma / (gamma + 1)
+        self.gm1_gp1      = (gamma - 1) / (gamma + 1)
+        self.sqrt_gp1_gm1 = np.sqrt((gamma + 1) / (gamma - 1))
+        self.Tstar_T0     = self.two_gp1
+        self.Pstar_P0     = self.two_gp1 ** self.g_gm1
+        self.rhostar_rho0 = self.two_gp1 ** self.one_gm1
+
+
+_CONSTANTS : dict[float, GasConstants] = {}
+
+def gas_constants(gamma: float) -> GasConstants:
+    """
+    Gas constants of one gamma. Scalar gamma values are cached in a plain dictionary, which is cheaper
+    to query than 'lru_cache' inside root-finding loops. Once 'GAS_CACHE_MAX' values are stored, the
+    oldest one is evicted. Array gamma values are evaluated on every call.
+
+    Parameters:
+    - gamma (float) : Heat capacity ratio, or a NumPy array
+
+    Returns:
+    - (GasConstants) : The shared coefficients
+
+    Example:
+    >>> c = gas_constants(1.4)
+    >>> c.gm1_2    # 0.2
+    """
+
+    try:
+        return _CONSTANTS[gamma]
+    except KeyError:
+        if (len(_CONSTANTS) >= GAS_CACHE_MAX):
+            del _CONSTANTS[next(iter(_CONSTANTS))]
+        constants = _CONSTANTS[gamma] = GasConstants(float(gamma))
+        return constants
+    except TypeError:
+        # Arrays are unhashable
+        return GasConstants(np.asarray(gamma, dtype = float))
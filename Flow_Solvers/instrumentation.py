@@ -0,0 +1,227 @@
+"""
+Solver Instrumentation
+Opt-in counters of the root finder iterations, function evaluations, and wall time
+"""
+
+
+
+# Imports =========================================================================================
+# Local Imports -----------------------------------------------------------------------------------
+import json
+import time
+from contextlib import contextmanager
+
+from scipy.optimize import brentq as _brentq
+
+
+
+# Solver Recorder =================================================================================
+NO_CONTEXT : str = '-'
+
+class SolverRecorder:
+    """
+    Collects one record per root finder call, grouped by the (class, input_var) of the flow being computed.
+    Calls made outside of a flow class are grouped under ('-', residual function name).
+    
+    Attributes:
+    - max_records (int)  : Number of per-call records kept, the aggregates keep counting past it
+    - records (list)     : Per-call records, 'key', 'solver', 'residual', 'iterations', 'fevals', 'points',
+                           'seconds', 'bracket', and 'converged'
+    - dropped (int)      : Number of per-call records beyond 'max_records'
+    
+    Methods:
+    - record()  : Adds one root finder call
+    - stats()   : Aggregate statistics of every (class, input_var)
+    - export()  : Writes the statistics and the records to JSON
+    """
+    
+    def __init__(self, max_records: int = 100000) -> None:
+        """
+        Constructor to start an empty recorder.
+        
+        Parameters:
+        - max_records (int) : Number of per-call records kept, default at 100000
+        """
+        
+        self.max_records : int = max_records
+        self.records     : list[dict] = []
+        self.dropped     : int = 0
+        self._totals     : dict[tuple[str, str], dict] = {}
+        self._context    : list[tuple[str, str]] = []
+    
+    
+    def record(self, solver: str, residual, iterations: int, fevals: int, points: int, seconds: float,
+               bracket: tuple[float, float], converged: bool) -> None:
+        """
+        Adds one root finder call to the current (class, input_var) group.
+        
+        Parameters:
+        - solver (str)        : Root finder name
+        - residual (callable) : Residual function 'SOLVE_*'
+        - iterations (int)    : Iterations taken
+        - fevals (int)        : Residual evaluations, summed over every element of a batched call
+        - points (int)        : Number of roots solved by the call
+        - seconds (float)     : Wall time
+        - bracket (tuple)     : (lower, upper) bracket, the widest one of a batched call
+        - converged (bool)    : False when the call raised or left unbracketed entries
+        """
+        
+        name = getattr(residual, '__name__', str(residual))
+        key  = self._context[-1] if (self._context) else (NO_CONTEXT, name)
+        
+        totals = self._totals.get(key)
+        if (totals is None):
+            totals = self._totals[key] = {'calls': 0, 'failures': 0, 'points': 0, 'iterations': 0, 'fevals': 0,
+                                          'seconds': 0.0, 'max_iterations': 0, 'solvers': {}}
+        
+        totals['calls']          += 1
+        totals['failures']       += (not converged)
+        totals['points']         += points
+        totals['iterations']     += iterations
+        totals['fevals']         += fevals
+        totals['seconds']        += seconds
+        totals['max_iterations']  = max(totals['max_iterations'], iterations)
+        totals['solvers'][f'{solver}:{name}'] = totals['solvers'].get(f'{solver}:{name}', 0) + 1
+        
+        if (len(self.records) < self.max_records):
+            self.records.append({
+                'key'        : key,
+                'solver'     : solver,
+                'residual'   : name,
+                'iterations' : iterations,
+                'fevals'     : fevals,
+                'points'     : points,
+                'seconds'    : seconds,
+                'bracket'    : (float(bracket[0]), float(bracket[1])),
+                'converged'  : converged,
+            })
+        else:
+            self.dropped += 1
+    
+    
+    def stats(self) -> dict[tuple[str, str], dict]:
+        """
+        Aggregate statistics of every (class, input_var), sorted by the total wall time.
+        
+        Returns:
+        - (dict[tuple[str, str], dict]) : 'calls', 'failures', 'points', 'iterations', 'fevals', 'seconds',
+                                          'max_iterations', 'solvers' (call count of each solver:residual pair),
+                                          and the per-call means 'mean_iterations', 'mean_fevals', 'mean_us'
+        """
+        
+        stats = {}
+        for key, totals in sorted(self._totals.items(), key = lambda item: -item[1]['seconds']):
+            calls = totals['calls']
+            stats[key] = {
+                **totals,
+                'solvers'         : dict(totals['solvers']),
+                'mean_iterations' : totals['iterations'] / calls,
+                'mean_fevals'     : totals['fevals'] / calls,
+                'mean_us'         : 1e6 * totals['seconds'] / calls,
+            }
+        
+        return stats
+    
+    
+    def export(self, path: str, records: bool = True) -> None:
+        """
+        Writes the statistics, and optionally the per-call records, to a JSON file.
+        Keys are written as 'class.input_var'.
+        
+        Parameters:
+        - path (str)     : Output file
+        - records (bool) : Includes the per-call records, default at True
+        """
+        
+        output = {'stats': {'.'.join(key): value for key, value in self.stats().items()}, 'dropped': self.dropped}
+        if (records):
+            output['records'] = [{**record, 'key': '.'.join(record['key'])} for record in self.records]
+        
+        with open(path, 'w') as file:
+            json.dump(output, file, indent = 2)
+
+
+
+# Recorder Switch =================================================================================
+# Solvers check 'active_recorder()' once per call, so a disabled recorder costs a single lookup.
+_recorder : SolverRecorder | None = None
+
+def enable_instrumentation(max_records: int = 100000) -> SolverRecorder:
+    """
+    Starts recording the root finder calls of every flow solver.
+    
+    Parameters:
+    - max_records (int) : Number of per-call records kept, default at 100000
+    
+    Returns:
+    - (SolverRecorder) : The new recorder
+    
+    Example:
+    >>> recorder = enable_instrumentation()
+    >>> FannoFlow('Pt_Ptstar', 1.5)
+    >>> recorder.stats()[('FannoFlow', 'Pt_Ptstar')]['failures']    # The unbracketed supersonic branch
+    >>> disable_instrumentation()
+    """
+    
+    global _recorder
+    _recorder = SolverRecorder(max_records)
+    return _recorder
+
+
+def disable_instrumentation() -> SolverRecorder | None:
+    """
+    Stops recording.
+    
+    Returns:
+    - (SolverRecorder) | (None) : The recorder that was active, its statistics stay queryable
+    """
+    
+    global _recorder
+    recorder, _recorder = _recorder, None
+    return recorder
+
+
+def active_recorder() -> SolverRecorder | None:
+    return _recorder
+
+
+@contextmanager
+def solver_context(class_name: str, input_var: str):
+    """
+    Groups the root finder calls made inside the block under (class_name, input_var).
+    """
+    
+    recorder = _recorder
+    if (recorder is None):
+        yield
+        return
+    
+    recorder._context.append((class_name, input_var))
+    try:
+        yield
+    finally:
+        recorder._context.pop()
+
+
+
+# Instrumented Root Finders =======================================================================
+def brentq(f, a, b, args = (), **kwargs):
+    """
+    'scipy.optimize.brentq' that reports to the active recorder. Without one it is a direct call.
+    Calls that raise (unbracketed roots) are recorded as failures before the error is re-raised.
+    """
+    
+    recorder = _recorder
+    if (recorder is None):
+        return _brentq(f, a, b, args = args, **kwargs)
+    
+    kwargs.pop('full_output', None)
+    start = time.perf_counter()
+    try:
+        root, result = _brentq(f, a, b, args = args, full_output = True, **kwargs)
+    except ValueError:
+        recorder.record('brentq', f, 0, 2, 1, time.perf_counter() - start, (a, b), False)
+        raise
+    
+    recorder.record('brentq', f, result.iterations, result.function_calls, 1, time.perf_counter() - start, (a, b), result.converged)
+    return root
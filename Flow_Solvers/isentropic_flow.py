@@ -8,72 +8,88 @@ Subclass of CompressibleFlow
 
 # Imports =========================================================================================
 # Local Imports -----------------------------------------------------------------------------------
+import math
+import time
+from functools import lru_cache
+
 import numpy as np
-from scipy.optimize import brentq
+from scipy.interpolate import PchipInterpolator
 
 
 # Global Imports ----------------------------------------------------------------------------------
 from Flow_Solvers.compressible_flow import CompressibleFlow
+from Flow_Solvers.batch_solver import newton_bisect
+from Flow_Solvers.instrumentation import active_recorder
+from Flow_Solvers.gas_constants import gas_constants
+from Flow_Solvers.thermally_perfect import ThermallyPerfectGas, isentropic_state
 
 
 
 # Isentropic Flow Relations ======================================================================
+# The gamma-only coefficients come from the cached 'gas_constants(gamma)'
 def A_Astar(M, gamma):
-    term = (2 / (gamma + 1)) * (1 + ((gamma - 1) / 2) * (M ** 2))
-    return (1 / M) * (term ** ((gamma + 1) / (2 * (gamma - 1))))
+    c = gas_constants(gamma)
+    return (1 / M) * ((c.two_gp1 * (1 + c.gm1_2 * (M ** 2))) ** c.gp1_2gm1)
 
 # Pressure Ratios ---------------------------------------------------------------------------------
 def P_Pt(M, gamma):
-    return (1 + ((gamma - 1) / 2) * (M ** 2)) ** (-gamma / (gamma - 1))
+    c = gas_constants(gamma)
+    return (1 + c.gm1_2 * (M ** 2)) ** (-c.g_gm1)
 
 def P_Pstar(M, gamma):
-    term_1 = 1 + ((gamma - 1) / 2) * (M ** 2)
-    term_2 = 1 + ((gamma - 1) / 2)  
-    return (term_2 / term_1) ** (gamma / (gamma - 1))  
+    c = gas_constants(gamma)
+    return (c.gp1_2 / (1 + c.gm1_2 * (M ** 2))) ** c.g_gm1
 
 def Pstar_P0(gamma):
-    return (2 / (gamma + 1)) ** (1 / (gamma - 1))
+    return gas_constants(gamma).Pstar_P0
 
 # Density Ratios ----------------------------------------------------------------------------------
 def rho_rhot(M, gamma):
-    return (1 + ((gamma - 1) / 2) * (M ** 2)) ** (-1 / (gamma - 1))
+    c = gas_constants(gamma)
+    return (1 + c.gm1_2 * (M ** 2)) ** (-c.one_gm1)
 
 def rho_rhostar(M, gamma):
-    term_1 = 1 + ((gamma - 1) / 2) * (M ** 2)
-    term_2 = 1 + ((gamma - 1) / 2) 
-    return (term_2 / term_1) ** (1 / (gamma - 1))  
+    c = gas_constants(gamma)
+    return (c.gp1_2 / (1 + c.gm1_2 * (M ** 2))) ** c.one_gm1
 
 def rhostar_rho0(gamma):
-    return (2 / (gamma + 1)) ** (1 / (gamma - 1))
+    return gas_constants(gamma).rhostar_rho0
 
 # Temperature Ratios ------------------------------------------------------------------------------
 def T_Tt(M, gamma):
-    return (1 + ((gamma - 1) / 2) * (M ** 2)) ** (-1)
+    return 1 / (1 + gas_constants(gamma).gm1_2 * (M ** 2))
 
 def T_Tstar(M, gamma):
-    term_1 = 1 + ((gamma - 1) / 2) * (M ** 2)
-    term_2 = 1 + ((gamma - 1) / 2)  
-    return term_2 / term_1
+    c = gas_constants(gamma)
+    return c.gp1_2 / (1 + c.gm1_2 * (M ** 2))
 
 def Tstar_T0(gamma):
-    return 2 / (gamma + 1)
+    return gas_constants(gamma).Tstar_T0
 
 # Angles ------------------------------------------------------------------------------------------
 def nu(M, gamma):
-    if M < 1:
-        return 0
+    # Scalar gamma values are cached as floats, array ones as arrays
+    c = gas_constants(gamma)
+    if ((np.ndim(M) == 0) and isinstance(c.gamma, float)):
+        if (M < 1):
+            return 0.0
+        
+        return c.sqrt_gp1_gm1 * math.atan(math.sqrt(c.gm1_gp1 * ((M ** 2) - 1))) - math.atan(math.sqrt((M ** 2) - 1))
     
-    term_1 = np.sqrt((gamma + 1) / (gamma - 1))
-    term_2 = np.arctan(np.sqrt(((gamma - 1) / (gamma + 1)) * ((M ** 2) - 1)))
-    term_3 = np.arctan(np.sqrt((M ** 2) - 1))
+    # Clipping M^2 - 1 at zero returns nu = 0 for subsonic Mach numbers without branching on arrays
+    M2_minus_1 = np.maximum((M ** 2) - 1, 0)
+    term_1 = c.sqrt_gp1_gm1
+    term_2 = np.arctan(np.sqrt(c.gm1_gp1 * M2_minus_1))
+    term_3 = np.arctan(np.sqrt(M2_minus_1))
     
     return term_1 * term_2 - term_3
 
 def mu(M):
-    if M < 1:
-        return 0
+    if (np.ndim(M) == 0):
+        return 0.0 if (M < 1) else math.asin(1 / M)
     
-    return np.arcsin(1 / M)
+    M = np.asarray(M, dtype = float)
+    return np.where(M < 1, 0.0, np.arcsin(np.minimum(1 / M, 1)))
 
 
 
@@ -111,6 +127,208 @@ def SOLVE_M_from_mu(M, target):
 
 
 
+# Analytic Derivatives (d/dM) =====================================================================
+def dA_Astar_dM(M, gamma):
+    return A_Astar(M, gamma) * ((M ** 2) - 1) / (M * (1 + gas_constants(gamma).gm1_2 * (M ** 2)))
+
+# Pressure Ratios ---------------------------------------------------------------------------------
+def dP_Pt_dM(M, gamma):
+    return -gamma * M * P_Pt(M, gamma) / (1 + gas_constants(gamma).gm1_2 * (M ** 2))
+
+def dP_Pstar_dM(M, gamma):
+    return -gamma * M * P_Pstar(M, gamma) / (1 + gas_constants(gamma).gm1_2 * (M ** 2))
+
+# Density Ratios ----------------------------------------------------------------------------------
+def drho_rhot_dM(M, gamma):
+    return -M * rho_rhot(M, gamma) / (1 + gas_constants(gamma).gm1_2 * (M ** 2))
+
+def drho_rhostar_dM(M, gamma):
+    return -M * rho_rhostar(M, gamma) / (1 + gas_constants(gamma).gm1_2 * (M ** 2))
+
+# Temperature Ratios ------------------------------------------------------------------------------
+def dT_Tt_dM(M, gamma):
+    c = gas_constants(gamma)
+    return -c.gm1 * M * T_Tt(M, gamma) / (1 + c.gm1_2 * (M ** 2))
+
+def dT_Tstar_dM(M, gamma):
+    c = gas_constants(gamma)
+    return -c.gm1 * M * T_Tstar(M, gamma) / (1 + c.gm1_2 * (M ** 2))
+
+# Angles ------------------------------------------------------------------------------------------
+def dnu_dM(M, gamma):
+    return np.sqrt(np.maximum((M ** 2) - 1, 0)) / (M * (1 + gas_constants(gamma).gm1_2 * (M ** 2)))
+
+def dmu_dM(M):
+    return -1 / (M * np.sqrt((M ** 2) - 1))
+
+
+
+# Closed-Form Inverses ============================================================================
+# Out of range ratios return NaN
+def M_from_T_Tt(T_Tt, gamma):
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        M_squared = gas_constants(gamma).two_gm1 * ((1 / T_Tt) - 1)
+        return np.sqrt(np.where((M_squared > 0) & (T_Tt <= 1), M_squared, np.nan))
+
+def M_from_T_Tstar(T_Tstar, gamma):
+    return M_from_T_Tt(T_Tstar * Tstar_T0(gamma), gamma)
+
+# Pressure Ratios ---------------------------------------------------------------------------------
+def M_from_P_Pt(P_Pt, gamma):
+    with np.errstate(invalid = 'ignore'):
+        return M_from_T_Tt(P_Pt ** gas_constants(gamma).gm1_g, gamma)
+
+def M_from_P_Pstar(P_Pstar, gamma):
+    with np.errstate(invalid = 'ignore'):
+        return M_from_T_Tstar(P_Pstar ** gas_constants(gamma).gm1_g, gamma)
+
+# Density Ratios ----------------------------------------------------------------------------------
+def M_from_rho_rhot(rho_rhot, gamma):
+    with np.errstate(invalid = 'ignore'):
+        return M_from_T_Tt(rho_rhot ** gas_constants(gamma).gm1, gamma)
+
+def M_from_rho_rhostar(rho_rhostar, gamma):
+    with np.errstate(invalid = 'ignore'):
+        return M_from_T_Tstar(rho_rhostar ** gas_constants(gamma).gm1, gamma)
+
+# Angles ------------------------------------------------------------------------------------------
+def M_from_mu(mu):
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        return np.where((mu > 0) & (mu <= np.pi / 2), 1 / np.sin(mu), np.nan)
+
+
+
+# Tabulated Inverses ==============================================================================
+# A/A* and nu have no closed-form inverse. A per-gamma table seeds Newton's method instead.
+# Near M = 1, A/A* - 1 ~ (M - 1)^2 and nu ~ (M - 1)^(3/2), so the tables are interpolated against
+# sqrt(ln(A/A*)) and nu^(2/3), which are smooth in M.
+TABLE_POINTS    : int = 1024
+TABLE_CACHE_MAX : int = 8
+
+@lru_cache(maxsize = TABLE_CACHE_MAX)
+def inverse_tables(gamma: float) -> dict[str, PchipInterpolator]:
+    """
+    Builds the inverse lookup tables for one gamma. The 'TABLE_CACHE_MAX' most recently used gamma
+    values are kept, older ones are evicted.
+    
+    Parameters:
+    - gamma (float) : Heat capacity ratio
+    
+    Returns:
+    - (dict[str, PchipInterpolator]) : 'A_Astar_sub', 'A_Astar_sup', and 'nu' interpolators returning M
+    """
+    
+    M_sub = np.geomspace(1e-4, 1, TABLE_POINTS)[::-1]
+    M_sup = np.geomspace(1, 1e3, TABLE_POINTS)
+    
+    return {
+        'A_Astar_sub' : PchipInterpolator(np.sqrt(np.log(A_Astar(M_sub, gamma))), M_sub, extrapolate = False),
+        'A_Astar_sup' : PchipInterpolator(np.sqrt(np.log(A_Astar(M_sup, gamma))), M_sup, extrapolate = False),
+        'nu'          : PchipInterpolator(nu(M_sup, gamma) ** (2 / 3), M_sup, extrapolate = False),
+    }
+
+
+def M_from_A_Astar(A_Astar_val, gamma, supersonic, newton_steps = 2):
+    """
+    Inverts A/A* on the subsonic or supersonic branch.
+    
+    Parameters:
+    - A_Astar_val (float) : Area ratio, or a NumPy array of area ratios
+    - gamma (float)       : Heat capacity ratio
+    - supersonic (bool)   : Supersonic branch if True, subsonic branch if False
+    - newton_steps (int)  : Newton polishing steps after the table lookup, default at 2
+    
+    Returns:
+    - (float) | (np.ndarray) : Mach number(s), NaN where A/A* < 1
+    """
+    
+    mach_lower, mach_upper = (1.000001, 1e6) if (supersonic) else (1e-6, 0.999999)
+    if (np.ndim(gamma) > 0):
+        return newton_bisect(SOLVE_M_from_A_Astar, dA_Astar_dM, A_Astar_val, mach_lower, mach_upper, args = (gamma,), log_step = True)
+    
+    # A scalar off the table is never bracketed, so it is rejected before the lookup
+    if ((np.ndim(A_Astar_val) == 0) and (not (A_Astar_val >= 1))):
+        return np.nan
+    
+    table = inverse_tables(float(gamma))['A_Astar_sup' if (supersonic) else 'A_Astar_sub']
+    with np.errstate(invalid = 'ignore'):
+        seed = table(np.sqrt(np.log(A_Astar_val)))
+    
+    return _polish(seed, A_Astar_val, gamma, SOLVE_M_from_A_Astar, dA_Astar_dM, mach_lower, mach_upper, newton_steps, True)
+
+
+def M_from_nu(nu_val, gamma, newton_steps = 2):
+    """
+    Inverts the Prandtl-Meyer function.
+    
+    Parameters:
+    - nu_val (float)     : Prandtl-Meyer angle [rad], or a NumPy array of angles
+    - gamma (float)      : Heat capacity ratio
+    - newton_steps (int) : Newton polishing steps after the table lookup, default at 2
+    
+    Returns:
+    - (float) | (np.ndarray) : Mach number(s), NaN outside of 0 <= nu < nu_max
+    """
+    
+    if (np.ndim(gamma) > 0):
+        return newton_bisect(SOLVE_M_from_nu, dnu_dM, nu_val, 1, 1e6, args = (gamma,))
+    
+    # nu_max = (sqrt((gamma + 1) / (gamma - 1)) - 1) pi / 2, the limit of M -> infinity
+    nu_max = (gas_constants(gamma).sqrt_gp1_gm1 - 1) * (np.pi / 2)
+    if ((np.ndim(nu_val) == 0) and (not (0 <= nu_val < nu_max))):
+        return np.nan
+    
+    with np.errstate(invalid = 'ignore'):
+        seed = inverse_tables(float(gamma))['nu'](np.asarray(nu_val, dtype = float) ** (2 / 3))
+    
+    return _polish(seed, nu_val, gamma, SOLVE_M_from_nu, dnu_dM, 1, 1e6, newton_steps, False)
+
+
+def _polish(seed, target, gamma, solver, derivative, mach_lower, mach_upper, newton_steps, log_step):
+    """
+    Newton polishing of the table seeds. Entries that are off the table or still unconverged are
+    handed to 'newton_bisect'. With instrumentation enabled, the polish reports its Newton steps and
+    element-wise residual evaluations, and the fallback reports separately.
+    """
+    
+    recorder  = active_recorder()
+    start     = time.perf_counter() if (recorder is not None) else 0.0
+    is_scalar = (np.ndim(target) == 0)
+    target    = np.asarray(target, dtype = float)
+    M         = np.asarray(seed, dtype = float).copy()
+    
+    with np.errstate(divide = 'ignore', invalid = 'ignore', over = 'ignore'):
+        for _ in range(newton_steps):
+            residual = solver(M, target, gamma)
+            slope    = derivative(M, gamma)
+            if (log_step):
+                value = residual + target
+                M_new = M * np.exp(-np.log(value / target) * value / (M * slope))
+            else:
+                M_new = M - residual / slope
+            
+            M = np.where(np.isfinite(M_new) & (M_new > 0), M_new, M)
+        
+        unconverged = ~(np.abs(solver(M, target, gamma)) <= 1e-12 * np.maximum(np.abs(target), 1))
+    
+    if (recorder is not None):
+        recorder.record('newton_polish', solver, newton_steps, (newton_steps + 1) * target.size, target.size,
+                        time.perf_counter() - start, (mach_lower, mach_upper), not np.any(unconverged))
+    
+    if (np.any(unconverged)):
+        M = np.where(unconverged, np.nan, M)
+        if (is_scalar):
+            return newton_bisect(solver, derivative, float(target), mach_lower, mach_upper, args = (gamma,), log_step = log_step)
+        
+        M[unconverged] = newton_bisect(solver, derivative, target[unconverged], mach_lower, mach_upper, args = (gamma,), log_step = log_step)
+    
+    if (is_scalar):
+        return float(M)
+    
+    return M
+
+
+
 # Isentropic Flow Subclass of Compressible Flow ===================================================
 class IsentropicFlow(CompressibleFlow):
     """
@@ -119,124 +337,228 @@ class IsentropicFlow(CompressibleFlow):
     
     Attributes:
     - Inherits from CompressibleFlow superclass.
+    - gas (ThermallyPerfectGas) : Optional thermally perfect gas model, replaces the constant 'gamma'
+    - Tt (float)                : Stagnation temperature [K] of the thermally perfect gas
     
     Methods:
     - computation() : Computes all isentropic flow values. 
-    - __getattr__() : Creates attributes to any given variable. 
+    - __getattr__() : Inherited, reads the flow properties from the packed results.
+    
+    Example:
+    >>> IF = IsentropicFlow('A_Astar', 2.0, lazy = True)
+    >>> IF.P_Pt    # Evaluated on first access, then cached
+    >>> gas = ThermallyPerfectGas(np.array([[300, 1000, 2000, 3000], [1005, 1142, 1249, 1287]]))
+    >>> IsentropicFlow('M', 3.0, gas = gas, Tt = 2000).T_Tt
     """
     
+    PROPERTIES = {
+        'A_Astar'     : A_Astar,
+        'P_Pt'        : P_Pt,
+        'P_Pstar'     : P_Pstar,
+        'rho_rhot'    : rho_rhot,
+        'rho_rhostar' : rho_rhostar,
+        'T_Tt'        : T_Tt,
+        'T_Tstar'     : T_Tstar,
+        'nu'          : nu,
+        'mu'          : lambda M, gamma: mu(M),
+    }
+    THERMALLY_PERFECT_INPUTS : tuple[str, ...] = ('M', 'T_Tt', 'P_Pt', 'rho_rhot', 'A_Astar')
+    
+    def __init__(self, input_var: str, input_val: float, gamma: float = 1.4, lazy: bool = False,
+                 gas: ThermallyPerfectGas | None = None, Tt: float | None = None) -> None:
+        """
+        Constructor to initialize the isentropic flow.
+        
+        Parameters:
+        - input_var (str)           : Name of the input variable
+        - input_val (float)         : The value of the input variable
+        - gamma (float)             : Heat capacity ratio, default at 1.4
+        - lazy (bool)               : Evaluates each property on first access, default at False
+        - gas (ThermallyPerfectGas) : Thermally perfect gas model, default at None (calorically perfect)
+        - Tt (float)                : Stagnation temperature [K], required with 'gas', or a NumPy array
+        
+        Raises:
+        - ValueError : 'gas' without a stagnation temperature
+        """
+        
+        self.gas = gas
+        self.Tt  = Tt
+        if (gas is not None):
+            if (Tt is None):
+                raise ValueError('A thermally perfect gas needs the stagnation temperature Tt')
+            
+            # The properties depend on the temperature, so they are all evaluated by 'computation'
+            self.PROPERTIES = {}
+        
+        super().__init__(input_var, input_val, gamma, lazy)
+    
+    
+    def _cache_key(self) -> tuple | None:
+        """
+        Extends the cache key with the thermally perfect gas and its stagnation temperature.
+        
+        Returns:
+        - (tuple) | (None) : (class, input_var, input_val, gamma, lazy[, gas, Tt]) or 'None' for array inputs
+        """
+        
+        key = super()._cache_key()
+        if ((key is None) or (self.gas is None)):
+            return key
+        
+        if (np.ndim(self.Tt) > 0):
+            return None
+        
+        return key + (self.gas, float(self.Tt))
+    
+    
     def computation(self) -> None:
         """
         Computes flow properties from the 'input_var' and 'input_val'.
         Data is stored in the 'self.results' attribute.
         
+        When 'input_val' is a NumPy array, every property is returned as an array of the same shape.
+        Entries that do not belong to a flow regime are NaN in that regime's arrays.
+        
+        Pressure, density, temperature, and Mach angle inputs are inverted in closed form.
+        'A_Astar' and 'nu' are seeded from the cached per-gamma tables and polished with Newton steps.
+        With a thermally perfect 'gas', the 'THERMALLY_PERFECT_INPUTS' are solved for the static temperature
+        from its enthalpy and entropy tables, and the static 'T' and local 'gamma_T' are stored as well.
+        
         Raises:
         - ValueError : Unknown input_var
+        - ValueError : Scalar input_val outside of the physical range
         """
         
+        if (self.gas is not None):
+            self._thermally_perfect_computation()
+            return
+        
         gamma     : float = self.gamma
         input_var : str = self.input_var
-        input_val : float = self.input_val
-        mach_min  : float = 1e-6
-        mach_max  : float = 1e6
+        input_val : float | np.ndarray = self.input_val
+        is_array  : bool = (np.ndim(input_val) > 0) or (np.ndim(gamma) > 0)
         data      : dict[str, dict[str, float]] = {'Subsonic': {}, 'Supersonic': {}}
+        
+        # An array gamma spreads a scalar input_val over its shape
+        if (is_array):
+            input_val = np.asarray(input_val, dtype = float)
+            input_val = np.broadcast_to(input_val, np.broadcast_shapes(input_val.shape, np.shape(gamma)))
                 
         
         # Flow Solvers ----------------------------------------------------------------------------
         # Mach ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
         if (input_var == 'M'):
-            self.mach: float = input_val
-            flow_regime: str = 'Subsonic' if (self.mach < 1) else 'Supersonic'
-            data[flow_regime]['M'] = self.mach
+            self.mach = input_val
         
         # Area ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
         elif (input_var == 'A_Astar'):
-            M_sub: float = brentq(SOLVE_M_from_A_Astar, mach_min, 0.999999, args = (input_val, gamma))
-            M_sup: float = brentq(SOLVE_M_from_A_Astar, 1.000001, mach_max, args = (input_val, gamma))
+            M_sub = M_from_A_Astar(input_val, gamma, supersonic = False)
+            M_sup = M_from_A_Astar(input_val, gamma, supersonic = True)
+            if ((not is_array) and np.isnan(M_sub)):
+                raise ValueError(f'{input_var} = {input_val} is outside of the physical range')
             data['Subsonic']['M'] = M_sub
             data['Supersonic']['M'] = M_sup
 
         # Pressure ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
         elif (input_var == 'P_Pt'):
-            self.mach: float = brentq(SOLVE_M_from_P_Pt, mach_min, mach_max, args = (input_val, gamma))
-            flow_regime: str = 'Subsonic' if (self.mach < 1) else 'Supersonic'
-            data[flow_regime]['M'] = self.mach
+            self.mach = M_from_P_Pt(input_val, gamma)
 
         elif (input_var == 'P_Pstar'):
-            self.mach: float = brentq(SOLVE_M_from_P_Pstar, mach_min, mach_max, args = (input_val, gamma))
-            flow_regime: str = 'Subsonic' if (self.mach < 1) else 'Supersonic'
-            data[flow_regime]['M'] = self.mach
+            self.mach = M_from_P_Pstar(input_val, gamma)
 
         # Density +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
         elif (input_var == 'rho_rhot'):
-            self.mach: float = brentq(SOLVE_M_from_rho_rhot, mach_min, mach_max, args = (input_val, gamma))
-            flow_regime: str = 'Subsonic' if (self.mach < 1) else 'Supersonic'
-            data[flow_regime]['M'] = self.mach
+            self.mach = M_from_rho_rhot(input_val, gamma)
 
         elif (input_var == 'rho_rhostar'):
-            self.mach: float = brentq(SOLVE_M_from_rho_rhostar, mach_min, mach_max, args = (input_val, gamma))
-            flow_regime: str = 'Subsonic' if (self.mach < 1) else 'Supersonic'
-            data[flow_regime]['M'] = self.mach
+            self.mach = M_from_rho_rhostar(input_val, gamma)
 
         # Temperature +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
         elif (input_var == 'T_Tt'):
-            self.mach: float = brentq(SOLVE_M_from_T_Tt, mach_min, mach_max, args = (input_val, gamma))
-            flow_regime: str = 'Subsonic' if (self.mach < 1) else 'Supersonic'
-            data[flow_regime]['M'] = self.mach
+            self.mach = M_from_T_Tt(input_val, gamma)
 
         elif (input_var == 'T_Tstar'):
-            self.mach: float = brentq(SOLVE_M_from_T_Tstar, mach_min, mach_max, args = (input_val, gamma))
-            flow_regime: str = 'Subsonic' if (self.mach < 1) else 'Supersonic'
-            data[flow_regime]['M'] = self.mach
+            self.mach = M_from_T_Tstar(input_val, gamma)
 
         # Angles ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
         elif (input_var == 'nu'):
-            self.mach: float = brentq(SOLVE_M_from_nu, 1, mach_max, args = (input_val, gamma))
+            self.mach = M_from_nu(input_val, gamma)
             data['Supersonic']['M'] = self.mach
 
         elif (input_var == 'mu'):
-            self.mach: float = brentq(SOLVE_M_from_mu, 1, mach_max, args = (input_val,))
+            self.mach = M_from_mu(input_val)
             data['Supersonic']['M'] = self.mach
 
         else:
             raise ValueError(f'Unknown input_var: {input_var}')
+        
+        
+        # Flow Regimes ----------------------------------------------------------------------------
+        if ((not is_array) and (self.mach is not None)):
+            if (math.isnan(self.mach)):
+                raise ValueError(f'{input_var} = {input_val} is outside of the physical range')
+            
+            self._mach = float(self._mach)
+        
+        if ((self.mach is not None) and (not data['Supersonic'])):
+            if (is_array):
+                subsonic = (self.mach < 1)
+                if (np.any(subsonic)):
+                    data['Subsonic']['M'] = np.where(subsonic, self.mach, np.nan)
+                if (not np.all(subsonic)):
+                    data['Supersonic']['M'] = np.where(subsonic, np.nan, self.mach)
+            else:
+                flow_regime: str = 'Subsonic' if (self.mach < 1) else 'Supersonic'
+                data[flow_regime]['M'] = self.mach
 
 
         # Data Organiztion ------------------------------------------------------------------------
+        # Only the Mach number is stored, the superclass evaluates the 'PROPERTIES' from it
+        convert = np.asarray if (is_array) else float
         for flow_regime in ['Subsonic', 'Supersonic']:
             if ('M' in data[flow_regime]):
-                data[flow_regime]['M'] = float(self.mach)
-                data[flow_regime]['A_Astar'] = float(A_Astar(self.mach, gamma))
-                data[flow_regime]['P_Pt'] = float(P_Pt(self.mach, gamma))
-                data[flow_regime]['P_Pstar'] = float(P_Pstar(self.mach, gamma))
-                data[flow_regime]['rho_rhot'] = float(rho_rhot(self.mach, gamma))
-                data[flow_regime]['rho_rhostar'] = float(rho_rhostar(self.mach, gamma))
-                data[flow_regime]['T_Tt'] = float(T_Tt(self.mach, gamma))
-                data[flow_regime]['T_Tstar'] = float(T_Tstar(self.mach, gamma))
-                data[flow_regime]['nu'] = float(nu(self.mach, gamma))
-                data[flow_regime]['mu'] = float(mu(self.mach))
+                data[flow_regime]['M'] = convert(data[flow_regime]['M'])
                 
         self.results = data
-        
-        
-        
-    def __getattr__(self, attribute_title: str) -> float:
+
+    
+    def _thermally_perfect_computation(self) -> None:
         """
-        Creates decorators for each flow property. 
+        Computes every flow property of a thermally perfect gas, split into the regimes like 'computation'.
         
-        Parameter:
-        - attribute_title (str) : Attribute title
-
         Raises:
-        - AttributeError if name not found in any regime.
-        
-        Examples:
-        >>> IF.P_Pt
-        >>> IF.T_Tt
+        - ValueError : input_var not in 'THERMALLY_PERFECT_INPUTS'
+        - ValueError : Scalar input_val outside of the physical range or of the gas tables
         """
         
-        for regime in self.results.values():
-            if (attribute_title in regime):
-                return regime[attribute_title]
+        input_var : str = self.input_var
+        input_val : float | np.ndarray = self.input_val
+        is_array  : bool = (np.ndim(input_val) > 0) or (np.ndim(self.Tt) > 0)
+        data      : dict[str, dict[str, float]] = {'Subsonic': {}, 'Supersonic': {}}
+        
+        if (input_var not in self.THERMALLY_PERFECT_INPUTS):
+            raise ValueError(f'Unknown input_var for a thermally perfect gas: {input_var}')
+        
+        if (input_var == 'A_Astar'):
+            data['Subsonic']   = isentropic_state(self.gas, input_var, input_val, self.Tt, supersonic = False)
+            data['Supersonic'] = isentropic_state(self.gas, input_var, input_val, self.Tt, supersonic = True)
+        else:
+            state    = isentropic_state(self.gas, input_var, input_val, self.Tt)
+            subsonic = (state['M'] < 1)
+            if (np.any(subsonic)):
+                data['Subsonic'] = {name: np.where(subsonic, value, np.nan) for name, value in state.items()}
+            if (not np.all(subsonic)):
+                data['Supersonic'] = {name: np.where(subsonic, np.nan, value) for name, value in state.items()}
             
-        raise AttributeError(f"'{self.__class__.__name__}' has no attribute '{attribute_title}'")
+            M = state['M'] if (is_array) else float(state['M'])
+            if ((not is_array) and np.isnan(M)):
+                raise ValueError(f'{input_var} = {input_val} is outside of the physical range')
+            self.mach = M
+        
+        
+        # Data Organiztion ------------------------------------------------------------------------
+        convert = np.asarray if (is_array) else float
+        for flow_regime in ['Subsonic', 'Supersonic']:
+            data[flow_regime] = {name: convert(value) for name, value in data[flow_regime].items()}
+        
+        self.results = data
@@ -8,41 +8,56 @@ Subclass of CompressibleFlow
 
 # Imports =========================================================================================
 # Local Imports -----------------------------------------------------------------------------------
+import math
+
 import numpy as np
-from scipy.optimize import brentq
 
 
 # Global Imports ----------------------------------------------------------------------------------
 from Flow_Solvers.compressible_flow import CompressibleFlow
+from Flow_Solvers.batch_solver import newton_bisect
+from Flow_Solvers.gas_constants import gas_constants
+from Flow_Solvers.thermally_perfect import ThermallyPerfectGas, normal_shock_state
 
 
 
 # Normal Shock Relations ==========================================================================
 def M2(M, gamma):
-    return float(np.sqrt((2 + (gamma - 1) * M**2) / (2 * gamma * M**2 - (gamma - 1))))
+    c = gas_constants(gamma)
+    return np.sqrt((2 + c.gm1 * M**2) / (2 * gamma * M**2 - c.gm1))
 
 # Pressure Ratios ---------------------------------------------------------------------------------
 def P2_P1(M, gamma):
-    return 1 + (2 * gamma / (gamma + 1)) * (M**2 - 1)
+    return 1 + gas_constants(gamma).two_g_gp1 * (M**2 - 1)
 
 def Pt1_P1(M, gamma):
-    return (1 + ((gamma - 1) / 2) * (M ** 2)) ** (gamma / (gamma - 1))
+    c = gas_constants(gamma)
+    return (1 + c.gm1_2 * (M ** 2)) ** c.g_gm1
 
 def Pt2_Pt1(M, gamma):
-    A = (((gamma + 1) / 2) * M**2) / (1 + ((gamma - 1) / 2) * M**2)
-    B = 1 / (((2 * gamma) / (gamma + 1)) * M**2 - ((gamma - 1) / (gamma + 1)))
-    return A**(gamma / (gamma - 1)) * B**(1 / (gamma - 1))
+    c = gas_constants(gamma)
+    A = (c.gp1_2 * M**2) / (1 + c.gm1_2 * M**2)
+    B = 1 / (c.two_g_gp1 * M**2 - c.gm1_gp1)
+    return A**c.g_gm1 * B**c.one_gm1
 
 def P1_Pt2(M, gamma):
     return 1 / (Pt2_Pt1(M, gamma) * Pt1_P1(M, gamma))
 
 # Density Ratios ---------------------------------------------------------------------------------
 def rho2_rho1(M, gamma):
-    return ((gamma + 1) * M**2) / ((gamma - 1) * M**2 + 2)
+    c = gas_constants(gamma)
+    return (c.gp1 * M**2) / (c.gm1 * M**2 + 2)
 
 # Temperature Ratios ---------------------------------------------------------------------------------
 def T2_T1(M, gamma):
-    return (2 + (gamma - 1) * M**2) * (2 * gamma * M**2 - (gamma - 1)) / ((gamma + 1)**2 * M**2)
+    c = gas_constants(gamma)
+    return (2 + c.gm1 * M**2) * (2 * gamma * M**2 - c.gm1) / (c.gp1**2 * M**2)
+
+def Tt2_Tt1(M, gamma):
+    if (np.ndim(M) == 0):
+        return np.nan if (math.isnan(M)) else 1.0
+    
+    return np.where(np.isnan(M), np.nan, 1.0)
 
 
 
@@ -73,6 +88,60 @@ def SOLVE_M_from_rho2_rho1(M, target, gamma):
 
 
 
+# Closed-Form Inverses ============================================================================
+# Every relation except Pt2/Pt1 and P1/Pt2 is linear or quadratic in M1^2. Results with M1 < 1 are NaN.
+def _M1_from_M1_squared(M1_squared):
+    return np.sqrt(np.where(M1_squared >= 1, M1_squared, np.nan))
+
+def M_from_M2(M2, gamma):
+    c = gas_constants(gamma)
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        M2_squared = M2**2
+        return _M1_from_M1_squared(np.where(M2 < 1, (2 + c.gm1 * M2_squared) / (2 * gamma * M2_squared - c.gm1), np.nan))
+
+# Pressure Ratios ---------------------------------------------------------------------------------
+def M_from_P2_P1(P2_P1, gamma):
+    return _M1_from_M1_squared(1 + gas_constants(gamma).gp1_2g * (P2_P1 - 1))
+
+def M_from_Pt1_P1(Pt1_P1, gamma):
+    c = gas_constants(gamma)
+    with np.errstate(invalid = 'ignore'):
+        return _M1_from_M1_squared(c.two_gm1 * (Pt1_P1 ** c.gm1_g - 1))
+
+# Density Ratios ----------------------------------------------------------------------------------
+def M_from_rho2_rho1(rho2_rho1, gamma):
+    c = gas_constants(gamma)
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        M1_squared = 2 * rho2_rho1 / (c.gp1 - c.gm1 * rho2_rho1)
+        return _M1_from_M1_squared(np.where(M1_squared > 0, M1_squared, np.nan))
+
+# Temperature Ratios ------------------------------------------------------------------------------
+def M_from_T2_T1(T2_T1, gamma):
+    # 2 gamma (gamma - 1) y^2 + (4 gamma - (gamma - 1)^2 - T2_T1 (gamma + 1)^2) y - 2 (gamma - 1) = 0, y = M1^2
+    g = gas_constants(gamma)
+    a = 2 * gamma * g.gm1
+    b = 4 * gamma - g.gm1**2 - T2_T1 * g.gp1**2
+    c = -2 * g.gm1
+    return _M1_from_M1_squared((-b + np.sqrt(b**2 - 4 * a * c)) / (2 * a))
+
+
+
+# Analytic Derivatives (d/dM) =====================================================================
+def dlnPt2_Pt1_dM(M, gamma):
+    c = gas_constants(gamma)
+    dlnA = 2 / M - c.gm1 * M / (1 + c.gm1_2 * M**2)
+    dlnB = -2 * c.two_g_gp1 * M / (c.two_g_gp1 * M**2 - c.gm1_gp1)
+    return c.g_gm1 * dlnA + c.one_gm1 * dlnB
+
+def dPt2_Pt1_dM(M, gamma):
+    return Pt2_Pt1(M, gamma) * dlnPt2_Pt1_dM(M, gamma)
+
+def dP1_Pt2_dM(M, gamma):
+    dlnPt1_P1 = gamma * M / (1 + gas_constants(gamma).gm1_2 * M**2)
+    return -P1_Pt2(M, gamma) * (dlnPt2_Pt1_dM(M, gamma) + dlnPt1_P1)
+
+
+
 # Normal Shock Subclass of Compressible Flow ======================================================
 class NormalShock(CompressibleFlow):
     """
@@ -81,121 +150,228 @@ class NormalShock(CompressibleFlow):
     
     Attributes:
     - Inherits from CompressibleFlow superclass.
+    - gas (ThermallyPerfectGas) : Optional thermally perfect gas model, replaces the constant 'gamma'
+    - T1 (float)                : Upstream static temperature [K] of the thermally perfect gas
     
     Methods:
     - computation() : Computes all isentropic flow values.
-    - __getattr__() : Creates attributes to any given varaible. 
+    - valid         : Validity mask of the upstream Mach numbers (M1 > 1)
+    - __getattr__() : Inherited, reads the flow properties from the packed results.
+    
+    Example:
+    >>> NS = NormalShock('M', np.linspace(1.0, 5.0, 1001)[:, None], gamma = np.array([1.3, 1.4]))
+    >>> NS.Pt2_Pt1    # (1001, 2) array, NaN where M1 <= 1
+    >>> NormalShock('M', 6.0, gas = gas, T1 = 220).T2_T1
     """
     
+    MACH_FIELD = 'M1'
+    PROPERTIES = {
+        'M2'        : M2,
+        'P2_P1'     : P2_P1,
+        'rho2_rho1' : rho2_rho1,
+        'T2_T1'     : T2_T1,
+        'Tt2_Tt1'   : Tt2_Tt1,
+        'Pt2_Pt1'   : Pt2_Pt1,
+        'Pt1_P1'    : Pt1_P1,
+        'P1_Pt2'    : P1_Pt2,
+    }
+    
+    def __init__(self, input_var: str, input_val: float, gamma: float = 1.4, lazy: bool = False,
+                 gas: ThermallyPerfectGas | None = None, T1: float | None = None) -> None:
+        """
+        Constructor to initialize the normal shock.
+        
+        Parameters:
+        - input_var (str)           : Name of the input variable
+        - input_val (float)         : The value of the input variable
+        - gamma (float)             : Heat capacity ratio, default at 1.4
+        - lazy (bool)               : Evaluates each property on first access, default at False
+        - gas (ThermallyPerfectGas) : Thermally perfect gas model, default at None (calorically perfect)
+        - T1 (float)                : Upstream static temperature [K], required with 'gas', or a NumPy array
+        
+        Raises:
+        - ValueError : 'gas' without an upstream temperature
+        """
+        
+        self.gas = gas
+        self.T1  = T1
+        if (gas is not None):
+            if (T1 is None):
+                raise ValueError('A thermally perfect gas needs the upstream temperature T1')
+            
+            # The properties depend on the temperature, so they are all evaluated by 'computation'
+            self.PROPERTIES = {}
+        
+        super().__init__(input_var, input_val, gamma, lazy)
+    
+    
+    def _cache_key(self) -> tuple | None:
+        """
+        Extends the cache key with the thermally perfect gas and its upstream temperature.
+        
+        Returns:
+        - (tuple) | (None) : (class, input_var, input_val, gamma, lazy[, gas, T1]) or 'None' for array inputs
+        """
+        
+        key = super()._cache_key()
+        if ((key is None) or (self.gas is None)):
+            return key
+        
+        if (np.ndim(self.T1) > 0):
+            return None
+        
+        return key + (self.gas, float(self.T1))
+    
+    
     def computation(self) -> None:
         """
         Computes flow properties from the 'input_var' and 'input_val'.
         Data is stored in the 'self.results' attribute.
         
+        When 'input_val' or 'gamma' are NumPy arrays, they are broadcast together and every property
+        is returned as an array. Entries without a valid upstream Mach number (M1 >= 1) are NaN instead of raising.
+        
+        'M2', 'P2_P1', 'Pt1_P1', 'T2_T1', and 'rho2_rho1' are inverted in closed form.
+        'Pt2_Pt1' and 'P1_Pt2' use the batched root finder.
+        With a thermally perfect 'gas', only the 'M' input is supported. The jump conditions are solved with
+        the enthalpy and entropy tables of the gas, and the static 'T1' and 'T2' are stored as well.
+        
         Raises:
         - ValueError : Unknown input_var
+        - ValueError : Scalar input_val outside of the physical range
         """
         
         gamma     : float = self.gamma
         input_var : str = self.input_var
         input_val : float = self.input_val
-        mach_min  : float = 1e-6
+        is_array  : bool = (np.ndim(input_val) > 0) or (np.ndim(gamma) > 0)
+        
+        if (self.gas is not None):
+            self._thermally_perfect_computation()
+            return
         mach_max  : float = 1e6
         data      : dict[str, dict[str, float]] = {'Normal': {}}
         
         
+        if (is_array):
+            shape     = np.broadcast(input_val, gamma).shape
+            input_val = np.broadcast_to(np.asarray(input_val, dtype = float), shape)
+        
+        
         # Flow Solvers ----------------------------------------------------------------------------
         # Mach ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
         if (input_var == 'M'):
-            self.mach = input_val
-            if (self.mach <= 1.0):
+            if ((not is_array) and (input_val <= 1.0)):
                 raise ValueError('M > 1')
             
+            self.mach = np.where(input_val > 1, input_val, np.nan) if (is_array) else input_val
+            
         elif (input_var == 'M2'):
-            if (input_val >= 1):
+            if ((not is_array) and (input_val >= 1)):
                 raise ValueError('0 < M2 < 1')
             
-            self.mach = brentq(SOLVE_M_from_M2, mach_min, mach_max, args = (input_val, gamma))        
+            self.mach = M_from_M2(input_val, gamma)
         
         # Pressure ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
         elif (input_var == 'Pt2_Pt1'):
-            if (not 0 < input_val < 1):
+            if ((not is_array) and (not 0 < input_val < 1)):
                 raise ValueError('0 < Pt2_Pt1 < 1')
             
-            self.mach = brentq(SOLVE_M_from_Pt2_Pt1, mach_min, mach_max, args = (input_val, gamma))
+            self.mach = newton_bisect(SOLVE_M_from_Pt2_Pt1, dPt2_Pt1_dM, input_val, 1, mach_max, args = (gamma,), log_step = True)
             
         elif (input_var == 'P2_P1'):
-            if (input_val < 1):
+            if ((not is_array) and (input_val < 1)):
                 raise ValueError('P2_P1 > 1')
             
-            self.mach = brentq(SOLVE_M_from_P2_P1, mach_min, mach_max, args = (input_val, gamma))
+            self.mach = M_from_P2_P1(input_val, gamma)
             
         elif (input_var == 'Pt1_P1'):
-            if (input_val < 1):
+            if ((not is_array) and (input_val < 1)):
                 raise ValueError('Pt1_P1 >= 1')
             
-            self.mach = brentq(SOLVE_M_from_Pt1_P1, mach_min, mach_max, args = (input_val, gamma))
+            self.mach = M_from_Pt1_P1(input_val, gamma)
             
         elif (input_var == 'P1_Pt2'):
-            if (input_val >= 1):
+            if ((not is_array) and (input_val >= 1)):
                 raise ValueError('0 < P1_Pt2 < 1')
             
-            self.mach = brentq(SOLVE_M_from_P1_Pt2, mach_min, mach_max, args = (input_val, gamma))    
+            self.mach = newton_bisect(SOLVE_M_from_P1_Pt2, dP1_Pt2_dM, input_val, 1, mach_max, args = (gamma,), log_step = True)
         
         # Temperature +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
         elif (input_var == 'T2_T1'):
-            if (input_val < 1):
+            if ((not is_array) and (input_val < 1)):
                 raise ValueError('T2_T1 > 1')
             
-            self.mach = brentq(SOLVE_M_from_T2_T1, mach_min, mach_max, args = (input_val, gamma))
+            self.mach = M_from_T2_T1(input_val, gamma)
             
         # Density +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
         elif (input_var == 'rho2_rho1'):
-            if (input_val < 1):
+            if ((not is_array) and (input_val < 1)):
                 raise ValueError('rho2_rho1 > 1')
             
-            self.mach = brentq(SOLVE_M_from_rho2_rho1, mach_min, mach_max, args = (input_val, gamma))
+            self.mach = M_from_rho2_rho1(input_val, gamma)
             
         else:
             raise ValueError(f'Unknown input_var: {input_var}')
+        
+        if (not is_array):
+            if (math.isnan(self.mach)):
+                raise ValueError(f'{input_var} = {input_val} is outside of the physical range')
+            
+            self._mach = float(self._mach)
 
 
         # Data Organization -----------------------------------------------------------------------
-        data['Normal']['M1'] = self.mach
-        for flow_regime in ['Normal']:
-            if ('M1' in data[flow_regime]):
-                data[flow_regime]['M1'] = float(self.mach)
-                data[flow_regime]['M2'] = float(M2(self.mach, gamma))
-                data[flow_regime]['P2_P1'] = float(P2_P1(self.mach, gamma))
-                data[flow_regime]['rho2_rho1'] = float(rho2_rho1(self.mach, gamma))
-                data[flow_regime]['T2_T1'] = float(T2_T1(self.mach, gamma))
-                data[flow_regime]['Tt2_Tt1'] = 1.0
-                data[flow_regime]['Pt2_Pt1'] = float(Pt2_Pt1(self.mach, gamma))
-                data[flow_regime]['Pt1_P1'] = float(Pt1_P1(self.mach, gamma))
-                data[flow_regime]['P1_Pt2'] = float(P1_Pt2(self.mach, gamma))
+        # Only the upstream Mach number is stored, the superclass evaluates the 'PROPERTIES' from it
+        convert = np.asarray if (is_array) else float
+        data['Normal']['M1'] = convert(self.mach)
                 
         self.results = data
-
-
-
-    def __getattr__(self, attribute_title: str) -> float:
+        
+        
+    def _thermally_perfect_computation(self) -> None:
         """
-        Creates decorators for each flow property. 
+        Computes every normal shock property of a thermally perfect gas.
         
-        Parameter:
-        - attribute_title (str) : Attribute title
-
         Raises:
-        - AttributeError if name not found in any regime.
+        - ValueError : input_var other than 'M'
+        - ValueError : Scalar M1 <= 1, or a state outside of the gas tables
+        """
+        
+        input_var : str = self.input_var
+        input_val : float = self.input_val
+        is_array  : bool = (np.ndim(input_val) > 0) or (np.ndim(self.T1) > 0)
+        
+        if (input_var != 'M'):
+            raise ValueError(f'Unknown input_var for a thermally perfect gas: {input_var}')
+        
+        if ((not is_array) and (input_val <= 1.0)):
+            raise ValueError('M > 1')
+        
+        try:
+            state = normal_shock_state(self.gas, input_val, self.T1)
+        except ValueError:
+            state = {'M2': np.nan}
+        
+        if ((not is_array) and np.isnan(state['M2'])):
+            raise ValueError(f'M = {input_val}, T1 = {self.T1} is outside of the gas tables')
+        
         
-        Examples:
-        >>> NS.M2
-        >>> NS.Pt2_Pt1
+        # Data Organization -----------------------------------------------------------------------
+        convert   = np.asarray if (is_array) else float
+        self.mach = convert(state['M1'])
+        
+        self.results = {'Normal': {name: convert(value) for name, value in state.items()}}
+    
+    
+        
+    @property
+    def valid(self) -> bool | np.ndarray:
         """
+        Validity mask of the upstream Mach numbers.
         
-        for regime in self.results.values():
-            if (attribute_title in regime):
-                return regime[attribute_title]
-            
-        raise AttributeError(f"'{self.__class__.__name__}' has no attribute '{attribute_title}'")
-    
\ No newline at end of file
+        Returns:
+        - (bool) | (np.ndarray) : True where M1 > 1 and the shock relations are defined
+        """
+        
+        return np.isfinite(self.M1)
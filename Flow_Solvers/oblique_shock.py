@@ -0,0 +1,179 @@
+"""
+Oblique Shock Solver
+Subclass of CompressibleFlow
+"""
+
+
+
+# Imports =========================================================================================
+# Local Imports -----------------------------------------------------------------------------------
+import numpy as np
+
+
+# Global Imports ----------------------------------------------------------------------------------
+from Flow_Solvers.compressible_flow import CompressibleFlow
+from Flow_Solvers.normal_shock import M2 as Mn2_from_Mn1, P2_P1, rho2_rho1, T2_T1, Pt2_Pt1
+
+
+
+# Theta-Beta-Mach Relations =======================================================================
+# Angles are in radians. Detached or undefined shocks return NaN.
+def theta_from_beta(M1, beta, gamma):
+    numerator   = 2 * (M1**2 * np.sin(beta)**2 - 1) / np.tan(beta)
+    denominator = M1**2 * (gamma + np.cos(2 * beta)) + 2
+    return np.arctan(numerator / denominator)
+
+def beta_from_theta(M1, theta, gamma, strong = False):
+    # Closed-form root of the cubic in tan(beta), delta = 1 is the weak branch and delta = 0 the strong branch
+    delta = 0 if (strong) else 1
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        term_1  = 1 + ((gamma - 1) / 2) * M1**2
+        tan_sq  = np.tan(theta)**2
+        lam     = np.sqrt((M1**2 - 1)**2 - 3 * term_1 * (1 + ((gamma + 1) / 2) * M1**2) * tan_sq)
+        chi     = ((M1**2 - 1)**3 - 9 * term_1 * (term_1 + ((gamma + 1) / 4) * M1**4) * tan_sq) / lam**3
+        tan_b   = (M1**2 - 1 + 2 * lam * np.cos((4 * np.pi * delta + np.arccos(chi)) / 3)) / (3 * term_1 * np.tan(theta))
+        beta    = np.arctan(tan_b)
+        
+        # A zero deflection is the Mach wave (weak) or a normal shock (strong)
+        beta_zero = np.pi / 2 if (strong) else np.arcsin(1 / M1)
+        beta = np.where(theta == 0, beta_zero, beta)
+        return np.where((M1 > 1) & (theta >= 0), beta, np.nan)
+
+def beta_max(M1, gamma):
+    # Wave angle of the maximum deflection, the boundary between the weak and strong branches
+    with np.errstate(invalid = 'ignore'):
+        term = ((gamma + 1) / 4) * M1**2 - 1 + np.sqrt((gamma + 1) * (((gamma + 1) / 16) * M1**4 + ((gamma - 1) / 2) * M1**2 + 1))
+        return np.arcsin(np.sqrt(term / (gamma * M1**2)))
+
+def theta_max(M1, gamma):
+    return theta_from_beta(M1, beta_max(M1, gamma), gamma)
+
+
+
+# Oblique Shock Subclass of Compressible Flow =====================================================
+class ObliqueShock(CompressibleFlow):
+    """
+    ObliqueShock is the child class of CompressibleFlow.
+    Computes the oblique shock properties from the upstream Mach number and either the deflection
+    angle 'theta' or the wave angle 'beta' [rad]. The normal shock relations are applied to Mn1.
+    
+    Attributes:
+    - Inherits from CompressibleFlow superclass.
+    - M1 (float) : Upstream Mach number, or a NumPy array broadcast against 'input_val' and 'gamma'
+    
+    Methods:
+    - computation() : Computes the weak and strong branches.
+    - __getattr__() : Inherited, reads the flow properties from the packed results.
+    
+    Example:
+    >>> OS = ObliqueShock('theta', np.radians(10), M1 = 2.0)
+    >>> OS.results['Weak']['beta']
+    >>> OS.results['Strong']['beta']
+    """
+    
+    def __init__(self, input_var: str, input_val: float, M1: float, gamma: float = 1.4) -> None:
+        """
+        Constructor to initialize the oblique shock.
+        
+        Parameters:
+        - input_var (str)   : 'theta' or 'beta'
+        - input_val (float) : The value of the angle [rad]
+        - M1 (float)        : Upstream Mach number
+        - gamma (float)     : Heat capacity ratio, default at 1.4
+        """
+        
+        self.M1 = M1
+        super().__init__(input_var, input_val, gamma)
+    
+    
+    def _cache_key(self) -> tuple | None:
+        """
+        Extends the cache key with the upstream Mach number.
+        
+        Returns:
+        - (tuple) | (None) : (class, input_var, input_val, gamma, lazy, M1) or 'None' for array inputs
+        """
+        
+        key = super()._cache_key()
+        if ((key is None) or (np.ndim(self.M1) > 0)):
+            return None
+        
+        return key + (float(self.M1),)
+    
+    
+    def computation(self) -> None:
+        """
+        Computes flow properties from the 'input_var', 'input_val', and 'M1'.
+        Data is stored in the 'self.results' attribute.
+        
+        A 'theta' input fills both the 'Weak' and 'Strong' regimes, a 'beta' input fills the regime it lies on.
+        For array inputs, detached shocks and entries outside of a regime are NaN.
+        
+        Raises:
+        - ValueError : Unknown input_var
+        - ValueError : Scalar M1 <= 1, or a detached shock / invalid wave angle
+        """
+        
+        gamma     : float = self.gamma
+        input_var : str = self.input_var
+        input_val : float = self.input_val
+        M1        : float = self.M1
+        is_array  : bool = (np.ndim(input_val) > 0) or (np.ndim(M1) > 0) or (np.ndim(gamma) > 0)
+        data      : dict[str, dict[str, float]] = {'Weak': {}, 'Strong': {}}
+        
+        if ((not is_array) and (M1 <= 1)):
+            raise ValueError('M1 > 1')
+        
+        if (is_array):
+            shape     = np.broadcast(input_val, M1, gamma).shape
+            input_val = np.broadcast_to(np.asarray(input_val, dtype = float), shape)
+            M1        = np.broadcast_to(np.asarray(M1, dtype = float), shape)
+        
+        
+        # Flow Solvers ----------------------------------------------------------------------------
+        # Deflection Angle ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+        if (input_var == 'theta'):
+            data['Weak']['beta'] = beta_from_theta(M1, input_val, gamma, strong = False)
+            data['Strong']['beta'] = beta_from_theta(M1, input_val, gamma, strong = True)
+        
+        # Wave Angle ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+        elif (input_var == 'beta'):
+            with np.errstate(invalid = 'ignore'):
+                beta = np.where((M1 > 1) & (input_val >= np.arcsin(1 / M1)) & (input_val <= np.pi / 2), input_val, np.nan)
+            
+            weak = (beta <= beta_max(M1, gamma))
+            if (is_array):
+                data['Weak']['beta'] = np.where(weak, beta, np.nan)
+                data['Strong']['beta'] = np.where(weak, np.nan, beta)
+            else:
+                data['Weak' if (weak) else 'Strong']['beta'] = beta
+        
+        else:
+            raise ValueError(f'Unknown input_var: {input_var}')
+        
+        if ((not is_array) and all(np.isnan(regime['beta']) for regime in data.values() if regime)):
+            raise ValueError(f'{input_var} = {input_val} gives a detached or invalid shock at M1 = {M1}')
+        
+        
+        # Data Organization -----------------------------------------------------------------------
+        convert = np.asarray if (is_array) else float
+        for flow_regime in ['Weak', 'Strong']:
+            if ('beta' in data[flow_regime]):
+                beta  = data[flow_regime]['beta']
+                theta = theta_from_beta(M1, beta, gamma)
+                Mn1   = M1 * np.sin(beta)
+                with np.errstate(invalid = 'ignore'):
+                    Mn2 = Mn2_from_Mn1(Mn1, gamma)
+                
+                data[flow_regime]['M1'] = convert(np.where(np.isnan(beta), np.nan, M1))
+                data[flow_regime]['theta'] = convert(theta)
+                data[flow_regime]['beta'] = convert(beta)
+                data[flow_regime]['Mn1'] = convert(Mn1)
+                data[flow_regime]['Mn2'] = convert(Mn2)
+                data[flow_regime]['M2'] = convert(Mn2 / np.sin(beta - theta))
+                data[flow_regime]['P2_P1'] = convert(P2_P1(Mn1, gamma))
+                data[flow_regime]['rho2_rho1'] = convert(rho2_rho1(Mn1, gamma))
+                data[flow_regime]['T2_T1'] = convert(T2_T1(Mn1, gamma))
+                data[flow_regime]['Pt2_Pt1'] = convert(Pt2_Pt1(Mn1, gamma))
+        
+        self.results = data
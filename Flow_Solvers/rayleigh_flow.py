@@ -8,38 +8,42 @@ Subclass of CompressibleFlow
 
 # Imports =========================================================================================
 # Local Imports -----------------------------------------------------------------------------------
-from scipy.optimize import brentq
+import numpy as np
 
 
 # Global Imports ----------------------------------------------------------------------------------
 from Flow_Solvers.compressible_flow import CompressibleFlow
+from Flow_Solvers.gas_constants import gas_constants
+from Flow_Solvers.instrumentation import brentq
 
 
 
 # Rayleigh Flow Relations ========================================================================
 def u_ustar(M, gamma):
-    return ((gamma + 1) * M**2) / (1 + gamma * M**2)
+    return (gas_constants(gamma).gp1 * M**2) / (1 + gamma * M**2)
 
 # Pressure Ratios ---------------------------------------------------------------------------------
 def P_Pstar(M, gamma):
-    return (gamma + 1) / (1 + gamma * M**2)
+    return gas_constants(gamma).gp1 / (1 + gamma * M**2)
 
 def Pt_Ptstar(M, gamma):
-    term_1 = ((gamma + 1) / (1 + gamma * M**2))
-    term_2 = ((2 / (gamma + 1)) * (1 + ((gamma - 1) / 2) * M**2))**(gamma / (gamma - 1))
+    c = gas_constants(gamma)
+    term_1 = (c.gp1 / (1 + gamma * M**2))
+    term_2 = (c.two_gp1 * (1 + c.gm1_2 * M**2))**c.g_gm1
     return term_1 * term_2
 
 # Density Ratios ----------------------------------------------------------------------------------
 def rho_rhostar(M, gamma):
-    return (1 + gamma * M**2) / ((gamma + 1) * M**2)
+    return (1 + gamma * M**2) / (gas_constants(gamma).gp1 * M**2)
 
 # Temperature Ratios ------------------------------------------------------------------------------
 def T_Tstar(M, gamma):
-    return ((gamma + 1)**2 * M**2) / (1 + gamma * M**2)**2
+    return (gas_constants(gamma).gp1**2 * M**2) / (1 + gamma * M**2)**2
 
 def Tt_Ttstar(M, gamma):
-    term_1 = ((2 * ((gamma + 1) * M**2)) / (1 + gamma * M**2)**2)
-    term_2 = (1 + ((gamma - 1) / 2) * M**2)
+    c = gas_constants(gamma)
+    term_1 = ((2 * (c.gp1 * M**2)) / (1 + gamma * M**2)**2)
+    term_2 = (1 + c.gm1_2 * M**2)
     return term_1 * term_2
 
 
@@ -68,6 +72,37 @@ def SOLVE_M_from_Tt_Ttstar(M, target, gamma):
 
 
 
+# Closed-Form Inverse =============================================================================
+def M_from_Tt_Ttstar(Tt_Ttstar_val, gamma, supersonic):
+    """
+    Inverts Tt/Tt*, which is a quadratic in M^2 with the discriminant 4 (gamma + 1)^2 (1 - Tt/Tt*).
+    The supersonic root only exists for (gamma^2 - 1) / gamma^2 < Tt/Tt* <= 1.
+    
+    Parameters:
+    - Tt_Ttstar_val (float) : Stagnation temperature ratio, or a NumPy array
+    - gamma (float)         : Heat capacity ratio
+    - supersonic (bool)     : Supersonic branch if True, subsonic branch if False
+    
+    Returns:
+    - (float) | (np.ndarray) : Mach number(s), NaN where the branch has no solution
+    """
+    
+    r = np.asarray(Tt_Ttstar_val, dtype = float)
+    c = gas_constants(gamma)
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        root  = c.gp1 * np.sqrt(1 - r)
+        base  = c.gp1 - r * gamma
+        denom = (base - root) if (supersonic) else (base + root)
+        M_squared = np.where((r > 0) & (r <= 1) & (denom > 0), r / denom, np.nan)
+        mach = np.sqrt(M_squared)
+        
+    if (mach.ndim == 0):
+        return float(mach)
+    
+    return mach
+
+
+
 # Rayleigh Flow Subclass of Compressible Flow =====================================================
 class RayleighFlow(CompressibleFlow):
     """
@@ -79,8 +114,17 @@ class RayleighFlow(CompressibleFlow):
     
     Methods:
     - computation() : Computes all Rayleigh flow values. 
-    - __getattr__() : Creates attributes to any given variable. 
+    - __getattr__() : Inherited, reads the flow properties from the packed results.
     """
+    
+    PROPERTIES = {
+        'P_Pstar'     : P_Pstar,
+        'rho_rhostar' : rho_rhostar,
+        'T_Tstar'     : T_Tstar,
+        'u_ustar'     : u_ustar,
+        'Pt_Ptstar'   : Pt_Ptstar,
+        'Tt_Ttstar'   : Tt_Ttstar,
+    }
 
     def computation(self) -> None:
         """
@@ -164,47 +208,138 @@ class RayleighFlow(CompressibleFlow):
             if (input_val <= 0):
                 raise ValueError('Tt/Tt* must be positive')
             
-            mach_subsonic: float = brentq(SOLVE_M_from_Tt_Ttstar, mach_min, 0.999999, args = (input_val, gamma))
-            mach_supersonic: float = brentq(SOLVE_M_from_Tt_Ttstar, 1.000001, mach_max, args = (input_val, gamma))
+            mach_subsonic: float = M_from_Tt_Ttstar(input_val, gamma, supersonic = False)
+            mach_supersonic: float = M_from_Tt_Ttstar(input_val, gamma, supersonic = True)
+            if (np.isnan(mach_subsonic)):
+                raise ValueError('0 < Tt/Tt* <= 1')
+            
             data['Subsonic']['M'] = mach_subsonic
-            data['Supersonic']['M'] = mach_supersonic
+            if (not np.isnan(mach_supersonic)):
+                data['Supersonic']['M'] = mach_supersonic
         
         else:
             raise ValueError(f'Unknown input_var: {input_var}')
         
         
         # Data Organiztion ------------------------------------------------------------------------
+        # Only the Mach number is stored, the superclass evaluates the 'PROPERTIES' from it
         for flow_regime in ['Subsonic', 'Supersonic']:
             if ('M' in data[flow_regime]):
-                data[flow_regime]['M'] = float(self.mach)
-                data[flow_regime]['P_Pstar'] = float(P_Pstar(self.mach, gamma))
-                data[flow_regime]['rho_rhostar'] = float(rho_rhostar(self.mach, gamma))
-                data[flow_regime]['T_Tstar'] = float(T_Tstar(self.mach, gamma))
-                data[flow_regime]['u_ustar'] = float(u_ustar(self.mach, gamma))
-                data[flow_regime]['Pt_Ptstar'] = float(Pt_Ptstar(self.mach, gamma))
-                data[flow_regime]['Tt_Ttstar'] = float(Tt_Ttstar(self.mach, gamma))
+                data[flow_regime]['M'] = float(data[flow_regime]['M'])
                 
         self.results = data
+
+
+
+# Rayleigh Heat Addition Marching =================================================================
+class RayleighDuct:
+    """
+    RayleighDuct marches frictionless, constant-area flow through a heat-release profile.
+    The stagnation temperature is accumulated from the heat increments and Tt/Tt* is inverted in
+    closed form at every state, so the whole history is computed in one vectorized pass.
+    
+    Attributes:
+    - M1 (float)         : Inlet Mach number, or a NumPy array of inlet Mach numbers (one case each)
+    - Tt1 (float)        : Inlet stagnation temperature [K]
+    - dq (np.ndarray)    : Heat added per unit mass at each step [J/kg], negative values cool the flow
+    - cp (float)         : Specific heat at constant pressure [J/(kg K)], default at 1004.5
+    - gamma (float)      : Heat capacity ratio, default at 1.4
+    - Tt (np.ndarray)    : Stagnation temperature of the inlet and after each increment
+    - M (np.ndarray)     : Mach number of each state, NaN from the first thermally choked state on
+    - Tt_Ttstar, T_Tstar, P_Pstar, Pt_Ptstar, rho_rhostar, u_ustar (np.ndarray) : Rayleigh ratios of each state
+    - T, P_P1, T_T1, Pt_Pt1 (np.ndarray) : Static temperature [K] and ratios to the inlet state
+    - q_max (float)      : Heat addition that thermally chokes the inlet state [J/kg]
+    - choked (bool)      : True where the heat release exceeds q_max at some point
+    - choking_index (int): Index of the first choked state, -1 if not choked
+    
+    Example:
+    >>> dq = np.full(1000, 500.0)
+    >>> RD = RayleighDuct(0.3, 600.0, dq)
+    >>> RD.M[-1], RD.Pt_Pt1[-1], RD.choked
+    """
+    
+    def __init__(self, M1: float, Tt1: float, dq: np.ndarray, cp: float = 1004.5, gamma: float = 1.4) -> None:
+        """
+        Constructor to march the heat release profile.
         
+        Parameters:
+        - M1 (float)      : Inlet Mach number, or a NumPy array of inlet Mach numbers
+        - Tt1 (float)     : Inlet stagnation temperature [K]
+        - dq (np.ndarray) : Heat increments [J/kg]
+        - cp (float)      : Specific heat at constant pressure [J/(kg K)], default at 1004.5
+        - gamma (float)   : Heat capacity ratio, default at 1.4
         
-        
-    def __getattr__(self, attribute_title: str) -> float:
+        Raises:
+        - ValueError : If an inlet Mach number or Tt1 is not positive
         """
-        Creates decorators for each flow property. 
         
-        Parameter:
-        - attribute_title (str) : Attribute title
-
-        Raises:
-        - AttributeError if name not found in any regime.
+        if (np.any(np.asarray(M1) <= 0)):
+            raise ValueError('M1 must be greater than 0')
+        
+        if (np.any(np.asarray(Tt1) <= 0)):
+            raise ValueError('Tt1 must be greater than 0')
         
-        Examples:
-        >>> RF.P_Pstar
-        >>> RF.Tt_Ttstar
+        self.M1    = M1
+        self.Tt1   = Tt1
+        self.dq    = np.asarray(dq, dtype = float)
+        self.cp    = cp
+        self.gamma = gamma
+        
+        self.computation()
+        
+        
+    def computation(self) -> None:
+        """
+        Accumulates Tt along the profile and inverts Tt/Tt* on the inlet branch.
         """
         
-        for regime in self.results.values():
-            if (attribute_title in regime):
-                return regime[attribute_title]
+        gamma = self.gamma
+        M1    = np.asarray(self.M1, dtype = float)[..., None]
+        Tt1   = np.asarray(self.Tt1, dtype = float)[..., None]
+        
+        
+        # Heat Addition ---------------------------------------------------------------------------
+        Tt        = Tt1 + np.concatenate(([0.0], np.cumsum(self.dq))) / self.cp
+        Tt_Ttstar_val = Tt_Ttstar(M1, gamma) * (Tt / Tt1)
+        
+        
+        # Thermal Choking -------------------------------------------------------------------------
+        choked_states = np.logical_or.accumulate(Tt_Ttstar_val > 1, axis = -1)
+        choked        = choked_states[..., -1]
+        choking_index = np.where(choked, np.argmax(choked_states, axis = -1), -1)
+        Tt_Ttstar_val = np.where(choked_states, np.nan, Tt_Ttstar_val)
+        
+        
+        # State Mach Numbers ----------------------------------------------------------------------
+        supersonic = np.broadcast_to(M1 > 1, Tt_Ttstar_val.shape)
+        M = np.where(supersonic, M_from_Tt_Ttstar(Tt_Ttstar_val, gamma, supersonic = True),
+                                 M_from_Tt_Ttstar(Tt_Ttstar_val, gamma, supersonic = False))
+        M[..., 0] = M1[..., 0]
+        
+        
+        # Data Organization -----------------------------------------------------------------------
+        T1 = Tt1 / (1 + gas_constants(gamma).gm1_2 * M1**2)
+        
+        self.Tt          = Tt
+        self.M           = M
+        self.Tt_Ttstar   = Tt_Ttstar(M, gamma)
+        self.T_Tstar     = T_Tstar(M, gamma)
+        self.P_Pstar     = P_Pstar(M, gamma)
+        self.Pt_Ptstar   = Pt_Ptstar(M, gamma)
+        self.rho_rhostar = rho_rhostar(M, gamma)
+        self.u_ustar     = u_ustar(M, gamma)
+        self.T_T1        = self.T_Tstar / T_Tstar(M1, gamma)
+        self.P_P1        = self.P_Pstar / P_Pstar(M1, gamma)
+        self.Pt_Pt1      = self.Pt_Ptstar / Pt_Ptstar(M1, gamma)
+        self.T           = T1 * self.T_T1
+        self.q_max       = self.cp * Tt1[..., 0] * (1 / Tt_Ttstar(M1[..., 0], gamma) - 1)
+        self.choked      = choked
+        self.choking_index = choking_index
+        
+        if (np.ndim(self.M1) == 0):
+            for name in ['Tt', 'M', 'Tt_Ttstar', 'T_Tstar', 'P_Pstar', 'Pt_Ptstar', 'rho_rhostar', 'u_ustar', 'T_T1', 'P_P1', 'Pt_Pt1', 'T']:
+                setattr(self, name, getattr(self, name)[0] if (getattr(self, name).ndim > 1) else getattr(self, name))
             
-        raise AttributeError(f"'{self.__class__.__name__}' has no attribute '{attribute_title}'")
+            self.q_max         = float(self.q_max)
+            self.choked        = bool(self.choked)
+            self.choking_index = int(self.choking_index)
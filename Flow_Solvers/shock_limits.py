@@ -0,0 +1,167 @@
+"""
+Oblique Shock Limits
+Cached maximum-deflection and sonic-point tables of the theta-beta-M relation
+"""
+
+
+
+# Imports =========================================================================================
+# Local Imports -----------------------------------------------------------------------------------
+from functools import lru_cache
+
+import numpy as np
+from scipy.interpolate import PchipInterpolator
+
+
+# Global Imports ----------------------------------------------------------------------------------
+from Flow_Solvers.oblique_shock import theta_from_beta, beta_max, theta_max
+
+
+
+# Sonic Point Relations ===========================================================================
+# The sonic point is the weak-branch wave angle where M2 = 1. It lies just below beta_max.
+def beta_sonic(M1, gamma):
+    with np.errstate(invalid = 'ignore'):
+        term_1 = ((gamma + 1) / 4) * M1**2 - (3 - gamma) / 4
+        term_2 = np.sqrt((gamma + 1) * (((gamma + 1) / 16) * M1**4 - ((3 - gamma) / 8) * M1**2 + (gamma + 9) / 16))
+        return np.arcsin(np.sqrt((term_1 + term_2) / (gamma * M1**2)))
+
+def theta_sonic(M1, gamma):
+    return theta_from_beta(M1, beta_sonic(M1, gamma), gamma)
+
+
+
+# Limit Tables ====================================================================================
+# Near M1 = 1 the limits grow like (M1 - 1)^(3/2), so the tables are interpolated against ln(M1 - 1).
+# Past the last grid point the limits are held at their hypersonic values.
+TABLE_POINTS    : int = 2048
+TABLE_CACHE_MAX : int = 8
+TABLE_M1_MIN    : float = 1 + 1e-6
+TABLE_M1_MAX    : float = 1 + 1e3
+
+@lru_cache(maxsize = TABLE_CACHE_MAX)
+def limit_tables(gamma: float) -> dict[str, PchipInterpolator]:
+    """
+    Builds the oblique shock limit tables for one gamma. The 'TABLE_CACHE_MAX' most recently used
+    gamma values are kept, older ones are evicted.
+    
+    Parameters:
+    - gamma (float) : Heat capacity ratio
+    
+    Returns:
+    - (dict[str, PchipInterpolator]) : 'beta_max', 'theta_max', 'beta_sonic', and 'theta_sonic' against ln(M1 - 1)
+    """
+    
+    M1 = 1 + np.geomspace(TABLE_M1_MIN - 1, TABLE_M1_MAX - 1, TABLE_POINTS)
+    x  = np.log(M1 - 1)
+    
+    return {
+        'beta_max'    : PchipInterpolator(x, beta_max(M1, gamma)),
+        'theta_max'   : PchipInterpolator(x, theta_max(M1, gamma)),
+        'beta_sonic'  : PchipInterpolator(x, beta_sonic(M1, gamma)),
+        'theta_sonic' : PchipInterpolator(x, theta_sonic(M1, gamma)),
+    }
+
+
+def _lookup(name, exact, M1, gamma):
+    """
+    Interpolates one limit from the tables. Array gamma values bypass the tables and use the exact relation.
+    """
+    
+    if (np.ndim(gamma) > 0):
+        return exact(np.asarray(M1, dtype = float), gamma)
+    
+    M1 = np.asarray(M1, dtype = float)
+    with np.errstate(invalid = 'ignore', divide = 'ignore'):
+        x = np.log(np.clip(M1, TABLE_M1_MIN, TABLE_M1_MAX) - 1)
+        value = limit_tables(float(gamma))[name](x)
+    
+    value = np.where(M1 > 1, value, np.nan)
+    if (value.ndim == 0):
+        return float(value)
+    
+    return value
+
+
+
+# Limit Lookups ===================================================================================
+def max_deflection(M1, gamma = 1.4):
+    """
+    Maximum deflection angle of an attached oblique shock.
+    
+    Parameters:
+    - M1 (float)    : Upstream Mach number, or a NumPy array
+    - gamma (float) : Heat capacity ratio, default at 1.4
+    
+    Returns:
+    - (float) | (np.ndarray) : theta_max [rad], NaN where M1 <= 1
+    """
+    
+    return _lookup('theta_max', theta_max, M1, gamma)
+
+
+def max_deflection_wave_angle(M1, gamma = 1.4):
+    """
+    Wave angle at the maximum deflection, the boundary between the weak and strong branches.
+    
+    Parameters:
+    - M1 (float)    : Upstream Mach number, or a NumPy array
+    - gamma (float) : Heat capacity ratio, default at 1.4
+    
+    Returns:
+    - (float) | (np.ndarray) : beta at theta_max [rad], NaN where M1 <= 1
+    """
+    
+    return _lookup('beta_max', beta_max, M1, gamma)
+
+
+def sonic_deflection(M1, gamma = 1.4):
+    """
+    Deflection angle at which the weak-branch downstream flow becomes sonic (M2 = 1).
+    
+    Parameters:
+    - M1 (float)    : Upstream Mach number, or a NumPy array
+    - gamma (float) : Heat capacity ratio, default at 1.4
+    
+    Returns:
+    - (float) | (np.ndarray) : theta_sonic [rad], NaN where M1 <= 1
+    """
+    
+    return _lookup('theta_sonic', theta_sonic, M1, gamma)
+
+
+def is_attached(M1, theta, gamma = 1.4):
+    """
+    Attached or detached check against the tabulated maximum deflection.
+    
+    Parameters:
+    - M1 (float)    : Upstream Mach number, or a NumPy array
+    - theta (float) : Deflection angle [rad], or a NumPy array broadcast against M1
+    - gamma (float) : Heat capacity ratio, default at 1.4
+    
+    Returns:
+    - (bool) | (np.ndarray) : True where a straight oblique shock stays attached
+    
+    Example:
+    >>> is_attached(np.linspace(1.5, 4.0, 6)[:, None], np.radians([5, 15, 25]))
+    """
+    
+    with np.errstate(invalid = 'ignore'):
+        return (theta >= 0) & (theta <= max_deflection(M1, gamma))
+
+
+def is_supersonic_downstream(M1, theta, gamma = 1.4):
+    """
+    Checks whether the weak-branch flow behind an attached shock stays supersonic.
+    
+    Parameters:
+    - M1 (float)    : Upstream Mach number, or a NumPy array
+    - theta (float) : Deflection angle [rad], or a NumPy array broadcast against M1
+    - gamma (float) : Heat capacity ratio, default at 1.4
+    
+    Returns:
+    - (bool) | (np.ndarray) : True where 0 <= theta < theta_sonic
+    """
+    
+    with np.errstate(invalid = 'ignore'):
+        return (theta >= 0) & (theta < sonic_deflection(M1, gamma))
@@ -0,0 +1,332 @@
+"""
+Thermally Perfect Gas
+Variable cp(T) relations for the isentropic and normal shock solvers
+"""
+
+
+
+# Imports =========================================================================================
+# Local Imports -----------------------------------------------------------------------------------
+import numpy as np
+from scipy.interpolate import PchipInterpolator
+
+
+# Global Imports ----------------------------------------------------------------------------------
+from Flow_Solvers.batch_solver import newton_bisect
+
+
+
+# Thermally Perfect Gas ===========================================================================
+class ThermallyPerfectGas:
+    """
+    Thermally perfect gas, P = rho R T with a temperature dependent cp(T).
+    The enthalpy h(T) = int cp dT and the entropy function phi(T) = int cp / T dT are tabulated once
+    at construction, together with their inverses, so the flow relations are table lookups instead of
+    a quadrature per point. Temperatures outside of 'T_range' return NaN.
+    
+    Attributes:
+    - R (float)                    : Specific gas constant [J/(kg K)]
+    - T_min (float) / T_max (float) : Table temperature range [K]
+    - gamma_max (float)            : Largest heat capacity ratio over the table range
+    
+    Methods:
+    - cp(), dcp_dT(), gamma(), a() : Specific heat, its slope, heat capacity ratio, and speed of sound at T
+    - h(), phi()                   : Enthalpy and entropy function at T, relative to T_min
+    - T_from_h(), T_from_phi()     : Tabulated inverses
+    
+    Example:
+    >>> gas = ThermallyPerfectGas([1047.6, -0.3727, 9.453e-4, -6.024e-7, 1.286e-10])     # cp(T) polynomial
+    >>> gas = ThermallyPerfectGas(np.array([[300, 1000, 2000], [1005, 1142, 1249]]))   # cp(T) table
+    >>> IsentropicFlow('M', np.linspace(0.1, 3, 100), gas = gas, Tt = 1800).P_Pt
+    """
+    
+    def __init__(self, cp, R: float = 287.05, T_range: tuple[float, float] = (100, 4000), points: int = 2048) -> None:
+        """
+        Constructor to build the property tables.
+        
+        Parameters:
+        - cp (array_like) : Polynomial coefficients of cp(T) in ascending powers of T [J/(kg K)],
+                            or a (2, n) table of T [K] and cp [J/(kg K)] rows, interpolated with PCHIP
+        - R (float)       : Specific gas constant [J/(kg K)], default at 287.05 (air)
+        - T_range (tuple) : Table temperature range [K], default at (100, 4000)
+        - points (int)    : Number of table points, default at 2048
+        
+        Raises:
+        - ValueError : If cp <= R anywhere in the table range
+        """
+        
+        cp = np.asarray(cp, dtype = float)
+        self.R     : float = R
+        self.T_min : float = float(T_range[0])
+        self.T_max : float = float(T_range[1])
+        T = np.geomspace(self.T_min, self.T_max, points)
+        
+        # Polynomial cp(T) integrates exactly, a table is integrated through its PCHIP interpolant
+        if (cp.ndim == 1):
+            poly     = np.polynomial.Polynomial(cp)
+            cp_T     = poly(T)
+            dcp_T    = poly.deriv()(T)
+            h_T      = poly.integ()(T)
+            phi_poly = np.polynomial.Polynomial(cp[1:]).integ() if (cp.size > 1) else np.polynomial.Polynomial([0])
+            phi_T    = cp[0] * np.log(T) + phi_poly(T)
+        else:
+            table    = PchipInterpolator(cp[0], cp[1], extrapolate = True)
+            cp_T     = table(T)
+            dcp_T    = table.derivative()(T)
+            h_T      = table.antiderivative()(T)
+            phi_T    = PchipInterpolator(T, cp_T / T).antiderivative()(T)
+        
+        if (np.any(cp_T <= R)):
+            raise ValueError('cp(T) must be larger than R over T_range')
+        
+        self.gamma_max : float = float(np.max(cp_T / (cp_T - R)))
+        h_T   = h_T - h_T[0]
+        phi_T = phi_T - phi_T[0]
+        
+        self._cp         = PchipInterpolator(T, cp_T, extrapolate = False)
+        self._dcp        = PchipInterpolator(T, dcp_T, extrapolate = False)
+        self._h          = PchipInterpolator(T, h_T, extrapolate = False)
+        self._phi        = PchipInterpolator(T, phi_T, extrapolate = False)
+        self._T_from_h   = PchipInterpolator(h_T, T, extrapolate = False)
+        self._T_from_phi = PchipInterpolator(phi_T, T, extrapolate = False)
+    
+    
+    # Property Lookups ----------------------------------------------------------------------------
+    def cp(self, T):
+        return self._cp(T)
+    
+    def dcp_dT(self, T):
+        return self._dcp(T)
+    
+    def gamma(self, T):
+        cp = self._cp(T)
+        return cp / (cp - self.R)
+    
+    def a(self, T):
+        return np.sqrt(self.gamma(T) * self.R * T)
+    
+    def h(self, T):
+        return self._h(T)
+    
+    def phi(self, T):
+        return self._phi(T)
+    
+    def T_from_h(self, h):
+        return self._T_from_h(h)
+    
+    def T_from_phi(self, phi):
+        return self._T_from_phi(phi)
+
+
+
+# Isentropic Relations ============================================================================
+# Every state is labeled by its static temperature T at the stagnation temperature Tt.
+# Along an isentrope P/Pt = exp((phi(T) - phi(Tt)) / R) and the velocity is sqrt(2 (h(Tt) - h(T))).
+def velocity(gas, T, Tt):
+    with np.errstate(invalid = 'ignore'):
+        return np.sqrt(2 * np.maximum(gas.h(Tt) - gas.h(T), 0))
+
+def M_of_T(gas, T, Tt):
+    return velocity(gas, T, Tt) / gas.a(T)
+
+def P_Pt_of_T(gas, T, Tt):
+    return np.exp((gas.phi(T) - gas.phi(Tt)) / gas.R)
+
+def rho_rhot_of_T(gas, T, Tt):
+    return P_Pt_of_T(gas, T, Tt) * Tt / T
+
+def mass_flux_of_T(gas, T, Tt):
+    # rho V / rhot, A/A* is the sonic mass flux over the local one
+    return rho_rhot_of_T(gas, T, Tt) * velocity(gas, T, Tt)
+
+# Residuals and Derivatives in T ------------------------------------------------------------------
+def SOLVE_T_from_M(T, target, gas, Tt):
+    return M_of_T(gas, T, Tt) - target
+
+def dM_dT(T, gas, Tt):
+    # d ln M / dT = -cp / V^2 - 1 / (2 T) + R cp' / (2 cp (cp - R))
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        cp = gas.cp(T)
+        V  = velocity(gas, T, Tt)
+        return (V / gas.a(T)) * (-cp / V**2 - 1 / (2 * T) + gas.R * gas.dcp_dT(T) / (2 * cp * (cp - gas.R)))
+
+def SOLVE_T_from_rho_rhot(T, target, gas, Tt):
+    return rho_rhot_of_T(gas, T, Tt) - target
+
+def drho_rhot_dT(T, gas, Tt):
+    return rho_rhot_of_T(gas, T, Tt) * (gas.cp(T) - gas.R) / (gas.R * T)
+
+def SOLVE_T_from_A_Astar(T, target, gas, Tt, G_star):
+    with np.errstate(divide = 'ignore'):
+        return G_star / mass_flux_of_T(gas, T, Tt) - target
+
+def dA_Astar_dT(T, gas, Tt, G_star):
+    # d ln(A/A*) / dT = -(cp / (R T) - 1 / T - cp / V^2)
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        cp = gas.cp(T)
+        V  = velocity(gas, T, Tt)
+        return -(G_star / mass_flux_of_T(gas, T, Tt)) * (cp / (gas.R * T) - 1 / T - cp / V**2)
+
+
+
+# Isentropic Solver ===============================================================================
+def T_from_M(gas, M, Tt):
+    """
+    Static temperature at the Mach number M and stagnation temperature Tt, NaN off the table.
+    """
+    
+    M, Tt = np.broadcast_arrays(np.asarray(M, dtype = float), np.asarray(Tt, dtype = float))
+    T = newton_bisect(SOLVE_T_from_M, dM_dT, M, gas.T_min, Tt, args = (gas, Tt))
+    return np.where(M == 0, Tt, T)
+
+
+def isentropic_state(gas, input_var, input_val, Tt, supersonic = False):
+    """
+    Isentropic state of a thermally perfect gas from one of the 'IsentropicFlow' inputs.
+    
+    Parameters:
+    - gas (ThermallyPerfectGas) : Gas model
+    - input_var (str)           : 'M', 'T_Tt', 'P_Pt', 'rho_rhot', or 'A_Astar'
+    - input_val (float)         : The value of the input variable, or a NumPy array
+    - Tt (float)                : Stagnation temperature [K], scalar or broadcastable to 'input_val'
+    - supersonic (bool)         : Branch of an 'A_Astar' input, default at False
+    
+    Returns:
+    - (dict[str, np.ndarray]) : 'M', 'T', 'T_Tt', 'P_Pt', 'rho_rhot', 'A_Astar', 'T_Tstar', 'P_Pstar',
+                                'rho_rhostar', and the local 'gamma_T'. Out of range entries are NaN.
+    
+    Raises:
+    - ValueError : Unknown input_var
+    """
+    
+    value, Tt = np.broadcast_arrays(np.asarray(input_val, dtype = float), np.asarray(Tt, dtype = float))
+    T_star    = T_from_M(gas, np.ones_like(Tt), Tt)
+    G_star    = mass_flux_of_T(gas, T_star, Tt)
+    
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        if (input_var == 'M'):
+            T = T_from_M(gas, value, Tt)
+        
+        elif (input_var == 'T_Tt'):
+            T = np.where((value > 0) & (value <= 1), value * Tt, np.nan)
+        
+        elif (input_var == 'P_Pt'):
+            T = gas.T_from_phi(gas.phi(Tt) + gas.R * np.log(np.where((value > 0) & (value <= 1), value, np.nan)))
+        
+        elif (input_var == 'rho_rhot'):
+            T = newton_bisect(SOLVE_T_from_rho_rhot, drho_rhot_dT, value, gas.T_min, Tt, args = (gas, Tt))
+            T = np.where(value == 1, Tt, T)
+        
+        elif (input_var == 'A_Astar'):
+            lower, upper = (gas.T_min, T_star) if (supersonic) else (T_star, Tt)
+            T = newton_bisect(SOLVE_T_from_A_Astar, dA_Astar_dT, value, lower, upper, args = (gas, Tt, G_star))
+            T = np.where(value == 1, T_star, T)
+        
+        else:
+            raise ValueError(f'Unknown input_var for a thermally perfect gas: {input_var}')
+        
+        P_Pt     = P_Pt_of_T(gas, T, Tt)
+        rho_rhot = rho_rhot_of_T(gas, T, Tt)
+        
+        return {
+            'M'           : M_of_T(gas, T, Tt),
+            'T'           : T,
+            'T_Tt'        : T / Tt,
+            'P_Pt'        : P_Pt,
+            'rho_rhot'    : rho_rhot,
+            'A_Astar'     : G_star / mass_flux_of_T(gas, T, Tt),
+            'T_Tstar'     : T / T_star,
+            'P_Pstar'     : P_Pt / P_Pt_of_T(gas, T_star, Tt),
+            'rho_rhostar' : rho_rhot / rho_rhot_of_T(gas, T_star, Tt),
+            'gamma_T'     : gas.gamma(T),
+        }
+
+
+
+# Normal Shock Solver =============================================================================
+# With eps = rho1 / rho2, momentum and the equation of state give T2 = eps (R T1 + u1^2 (1 - eps)) / R,
+# and the energy equation h(T2) = h(T1) + u1^2 (1 - eps^2) / 2 is solved for eps. The trivial root
+# eps = 1 is excluded by the bracket [R T1 / u1^2, eps_perfect(gamma_max)]: the lower end keeps T2 = T1,
+# and a lower gamma only compresses more, so the calorically perfect ratio at gamma_max bounds the root.
+# The upper end is widened slightly (staying below the trivial root), since with a constant cp the root
+# lies exactly on it and rounding can put both ends on the same side.
+def _T2_of_eps(eps, T1, u1_squared, R):
+    return eps * (R * T1 + u1_squared * (1 - eps)) / R
+
+def SOLVE_eps(eps, target, gas, T1, u1_squared):
+    return gas.h(_T2_of_eps(eps, T1, u1_squared, gas.R)) - gas.h(T1) - u1_squared * (1 - eps**2) / 2 - target
+
+def dSOLVE_eps(eps, gas, T1, u1_squared):
+    T2 = _T2_of_eps(eps, T1, u1_squared, gas.R)
+    return gas.cp(T2) * (gas.R * T1 + u1_squared * (1 - 2 * eps)) / gas.R + u1_squared * eps
+
+
+def normal_shock_state(gas, M1, T1):
+    """
+    Normal shock in a thermally perfect gas.
+    
+    Parameters:
+    - gas (ThermallyPerfectGas) : Gas model
+    - M1 (float)                : Upstream Mach number, or a NumPy array
+    - T1 (float)                : Upstream static temperature [K], scalar or broadcastable to M1
+    
+    Returns:
+    - (dict[str, np.ndarray]) : 'M1', 'M2', 'P2_P1', 'rho2_rho1', 'T2_T1', 'Tt2_Tt1', 'Pt2_Pt1', 'Pt1_P1', 'P1_Pt2',
+                                'T1', and 'T2'. Entries with M1 <= 1 or off the table are NaN.
+    """
+    
+    M1, T1 = np.broadcast_arrays(np.asarray(M1, dtype = float), np.asarray(T1, dtype = float))
+    
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        M1         = np.where(M1 > 1, M1, np.nan)
+        u1_squared = (M1 * gas.a(T1))**2
+        eps_lower  = gas.R * T1 / u1_squared
+        eps_upper  = ((gas.gamma_max - 1) * M1**2 + 2) / ((gas.gamma_max + 1) * M1**2)
+        eps_upper  = np.minimum(eps_upper * (1 + 1e-6), (eps_upper + 1) / 2)
+        
+        eps = newton_bisect(SOLVE_eps, dSOLVE_eps, np.zeros_like(M1), eps_lower, eps_upper, args = (gas, T1, u1_squared))
+        eps = np.where(np.isnan(M1), np.nan, eps)
+        M1  = np.where(np.isnan(eps), np.nan, M1)
+        
+        T2    = _T2_of_eps(eps, T1, u1_squared, gas.R)
+        P2_P1 = T2 / (eps * T1)
+        M2    = eps * np.sqrt(u1_squared) / gas.a(T2)
+        Tt    = gas.T_from_h(gas.h(T1) + u1_squared / 2)
+        
+        Pt1_P1  = np.exp((gas.phi(Tt) - gas.phi(T1)) / gas.R)
+        Pt2_Pt1 = P2_P1 * np.exp((gas.phi(T1) - gas.phi(T2)) / gas.R)
+        
+        return {
+            'M1'        : M1,
+            'M2'        : M2,
+            'P2_P1'     : P2_P1,
+            'rho2_rho1' : 1 / eps,
+            'T2_T1'     : T2 / T1,
+            'Tt2_Tt1'   : np.where(np.isnan(eps), np.nan, 1.0),
+            'Pt2_Pt1'   : Pt2_Pt1,
+            'Pt1_P1'    : Pt1_P1,
+            'P1_Pt2'    : 1 / (Pt2_Pt1 * Pt1_P1),
+            'T1'        : np.where(np.isnan(eps), np.nan, T1),
+            'T2'        : T2,
+        }
+
+
+
+# Given Data ======================================================================================
+# Consistency check, a constant cp must reproduce the calorically perfect shock:
+#     python -m Flow_Solvers.thermally_perfect
+if (__name__ == '__main__'):
+    from Flow_Solvers.normal_shock import NormalShock
+    
+    gas   = ThermallyPerfectGas([1004.675])
+    gamma = 1004.675 / (1004.675 - gas.R)
+    M1    = np.array([1.05, 1.5, 3.0, 6.0])
+    
+    shock   = normal_shock_state(gas, M1, 300.0)
+    perfect = NormalShock('M', M1, gamma)
+    for name in ['M2', 'P2_P1', 'rho2_rho1', 'T2_T1', 'Pt2_Pt1']:
+        error = np.max(np.abs(shock[name] / getattr(perfect, name) - 1))
+        print(f'{name:10s} : max relative error {error:.2e}')
+        assert error < 1e-9, f'{name} does not match the calorically perfect shock'
+    
+    assert np.isclose(NormalShock('M', 3.0, gamma, gas = gas, T1 = 300.0).M2, NormalShock('M', 3.0, gamma).M2, rtol = 1e-9)
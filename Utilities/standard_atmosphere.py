@@ -0,0 +1,149 @@
+
+"""
+Standard Atmosphere
+Start Date        : 10/18/2026
+Modification Date : 10/18/2026
+"""
+
+
+
+# Imports =========================================================================================
+# Local Imports -----------------------------------------------------------------------------------
+import numpy as np
+
+
+
+# Atmosphere Layers ===============================================================================
+# U.S. Standard Atmosphere 1976, the seven geopotential layers from sea level to 86 km geometric
+# (84.852 km geopotential). Every layer has a constant lapse rate, so the base temperature and pressure
+# of each layer are computed once here and an altitude only needs its layer's constants.
+# Temperatures are the molecular-scale ones, within 0.04% of the kinetic temperature up to 86 km.
+G0             : float = 9.80665
+R_AIR          : float = 8314.32 / 28.9644
+EARTH_RADIUS   : float = 6356766.0
+SEA_LEVEL      : tuple[float, float] = (288.15, 101325.0)
+ALTITUDE_RANGE : tuple[float, float] = (-5000.0, 86000.0)
+
+H_BASE = np.array([0.0, 11000.0, 20000.0, 32000.0, 47000.0, 51000.0, 71000.0])
+LAPSE  = np.array([-0.0065, 0.0, 0.001, 0.0028, 0.0, -0.0028, -0.002])
+
+def _layer_constants():
+    """
+    Base temperature and pressure of every layer, and the constants of P = Pb exp(n ln(T / Tb) + k (H - Hb)).
+    Lapse layers have n = -g0 / (R L) and k = 0, isothermal layers n = 0 and k = -g0 / (R Tb).
+    """
+    
+    T_base = np.empty(H_BASE.size)
+    P_base = np.empty(H_BASE.size)
+    T_base[0], P_base[0] = SEA_LEVEL
+    
+    isothermal = (LAPSE == 0)
+    for i in range(1, H_BASE.size):
+        dh        = H_BASE[i] - H_BASE[i - 1]
+        T_base[i] = T_base[i - 1] + LAPSE[i - 1] * dh
+        if (isothermal[i - 1]):
+            P_base[i] = P_base[i - 1] * np.exp(-G0 * dh / (R_AIR * T_base[i - 1]))
+        else:
+            P_base[i] = P_base[i - 1] * (T_base[i] / T_base[i - 1])**(-G0 / (R_AIR * LAPSE[i - 1]))
+    
+    with np.errstate(divide = 'ignore'):
+        exponent = np.where(isothermal, 0.0, -G0 / (R_AIR * LAPSE))
+    scale = np.where(isothermal, -G0 / (R_AIR * T_base), 0.0)
+    
+    return T_base, P_base, exponent, scale
+
+T_BASE, P_BASE, EXPONENT, SCALE = _layer_constants()
+
+# Lookup tables padded with a NaN layer on each side, so altitudes outside of 'ALTITUDE_RANGE' (and NaN)
+# fall into a NaN layer in the same 'searchsorted' that finds the layer of every other altitude.
+# The lower edge is in the altitude kind of the input (converted to geopotential only for geometric input),
+# the upper edge is always 86 km geometric, where the layer data ends. It is nudged up by one ulp so that
+# the top of the range stays inside the last layer.
+_H_TOP = np.nextafter(EARTH_RADIUS * ALTITUDE_RANGE[1] / (EARTH_RADIUS + ALTITUDE_RANGE[1]), np.inf)
+_EDGES = {
+    True  : np.concatenate([[EARTH_RADIUS * ALTITUDE_RANGE[0] / (EARTH_RADIUS + ALTITUDE_RANGE[0])], H_BASE[1:], [_H_TOP]]),
+    False : np.concatenate([[ALTITUDE_RANGE[0]], H_BASE[1:], [_H_TOP]]),
+}
+_TABLES = {name: np.concatenate([[np.nan], table, [np.nan]]) for name, table in
+           [('H', H_BASE), ('L', LAPSE), ('T', T_BASE), ('P', P_BASE), ('n', EXPONENT), ('k', SCALE)]}
+
+
+
+# Standard Atmosphere =============================================================================
+def geopotential_altitude(Z):
+    # H = r0 Z / (r0 + Z) [m]
+    return EARTH_RADIUS * Z / (EARTH_RADIUS + Z)
+
+
+def standard_atmosphere(altitude, gamma = 1.4, geometric = True):
+    """
+    Static state of the U.S. Standard Atmosphere 1976 over an array of altitudes.
+    Altitudes below ALTITUDE_RANGE[0] (in the altitude kind of the input) or above 86 km geometric are NaN.
+    
+    Parameters:
+    - altitude (float)  : Altitude [m], or a NumPy array of any shape
+    - gamma (float)     : Heat capacity ratio for the speed of sound, default at 1.4
+    - geometric (bool)  : True for geometric altitudes, False for geopotential ones, default at True
+    
+    Returns:
+    - (dict[str, np.ndarray]) : 'T' [K], 'P' [Pa], 'rho' [kg/m^3], and 'a' [m/s] of the altitude shape
+    
+    Example:
+    >>> air = standard_atmosphere(np.linspace(0, 86000, 1000000))
+    >>> air['P'][-1], air['a'][0]
+    """
+    
+    altitude = np.asarray(altitude, dtype = float)
+    H = geopotential_altitude(altitude) if (geometric) else altitude
+    
+    layer = np.searchsorted(_EDGES[bool(geometric)], H, side = 'right')
+    dh    = H - _TABLES['H'][layer]
+    T_b   = _TABLES['T'][layer]
+    T     = T_b + _TABLES['L'][layer] * dh
+    P     = _TABLES['n'][layer] * np.log(T / T_b)
+    P    += _TABLES['k'][layer] * dh
+    P     = _TABLES['P'][layer] * np.exp(P)
+    
+    return {'T': T, 'P': P, 'rho': P / (R_AIR * T), 'a': np.sqrt(gamma * R_AIR * T)}
+
+
+def flight_conditions(M, altitude, gamma = 1.4, geometric = True):
+    """
+    Freestream static and stagnation states of a flight Mach number x altitude envelope.
+    M and altitude broadcast against each other, so M[:, None] and altitude[None, :] give a (M, altitude) grid.
+    The stagnation ratio Tt / T = 1 + (gamma - 1) / 2 M^2 is evaluated on the M array and the atmosphere on the
+    altitude array before broadcasting.
+    
+    Parameters:
+    - M (float)         : Flight Mach number, or a NumPy array
+    - altitude (float)  : Altitude [m], or a NumPy array
+    - gamma (float)     : Heat capacity ratio, default at 1.4
+    - geometric (bool)  : True for geometric altitudes, default at True
+    
+    Returns:
+    - (dict[str, np.ndarray]) : 'M', 'T', 'P', 'rho', 'a', 'V' [m/s], 'q' (dynamic pressure [Pa]),
+                                'Tt' [K], and 'Pt' [Pa] of the broadcast shape
+    
+    Example:
+    >>> envelope = flight_conditions(np.linspace(0, 3, 301)[:, None], np.linspace(0, 20000, 201)[None, :])
+    >>> engine   = solve_cycle(envelope['M'], envelope['T'], envelope['P'], 20, 1600)
+    """
+    
+    M   = np.asarray(M, dtype = float)
+    air = standard_atmosphere(altitude, gamma, geometric)
+    
+    shape = np.broadcast_shapes(M.shape, air['T'].shape)
+    V     = M * air['a']
+    Tt_T  = 1 + (gamma - 1) / 2 * M**2
+    
+    return {
+        'M'   : np.broadcast_to(M, shape),
+        'T'   : np.broadcast_to(air['T'], shape),
+        'P'   : np.broadcast_to(air['P'], shape),
+        'rho' : np.broadcast_to(air['rho'], shape),
+        'a'   : np.broadcast_to(air['a'], shape),
+        'V'   : np.broadcast_to(V, shape),
+        'q'   : np.broadcast_to(0.5 * air['rho'] * V**2, shape),
+        'Tt'  : air['T'] * Tt_T,
+        'Pt'  : air['P'] * Tt_T**(gamma / (gamma - 1)),
+    }
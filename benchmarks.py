@@ -0,0 +1,343 @@
+"""
+Benchmarks
+Start Date        : 10/18/2026
+Modification Date : 10/18/2026
+
+Times the 'input_var' branches of the flow classes with scalar and batched inputs, and the duct chain.
+Results can be saved as a JSON baseline and compared against a previous run:
+    python benchmarks.py --save baseline.json
+    python benchmarks.py --compare baseline.json --tolerance 0.25
+"""
+
+
+
+# Imports =========================================================================================
+# Local Imports -----------------------------------------------------------------------------------
+import argparse
+import json
+import platform
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+import scipy
+
+
+# Global Imports ----------------------------------------------------------------------------------
+# Flow Solvers ------------------------------------------------------------------------------------
+from Flow_Solvers.compressible_flow import CompressibleFlow
+from Flow_Solvers.isentropic_flow import IsentropicFlow
+from Flow_Solvers.normal_shock import NormalShock
+from Flow_Solvers.fanno_flow import FannoFlow
+from Flow_Solvers.rayleigh_flow import RayleighFlow
+
+# Duct Solver -------------------------------------------------------------------------------------
+from duct_solver import solve_duct
+
+
+
+# Benchmark Cases =================================================================================
+# Inputs are sampled as the relation values of random Mach numbers, so every branch sees physical inputs.
+# Fanno and Rayleigh solve both branches of every ratio, so their samples come from a single branch whose
+# values the other branch also reaches. Their monotonic ratios are left out: Fanno P/P*, rho/rho*, T/T*,
+# and u/u*, and Rayleigh P/P*, rho/rho*, and u/u* have no root on one of the two branches, so every
+# input raises. Only the classes in 'BATCH_CLASSES' accept arrays, the others are timed with scalars only.
+GAMMA           : float = 1.4
+MACH_RANGE      : tuple[float, float] = (0.2, 3.0)
+SUPERSONIC      : tuple[float, float] = (1.2, 3.0)
+SUBSONIC        : tuple[float, float] = (0.2, 0.9)
+SUBSONIC_LOW    : tuple[float, float] = (0.2, 0.6)
+BENCH_CLASSES   : dict[type, dict[str, tuple[float, float]]] = {
+    IsentropicFlow : {'M': MACH_RANGE, 'A_Astar': MACH_RANGE, 'P_Pt': MACH_RANGE, 'P_Pstar': MACH_RANGE,
+                      'rho_rhot': MACH_RANGE, 'rho_rhostar': MACH_RANGE, 'T_Tt': MACH_RANGE, 'T_Tstar': MACH_RANGE,
+                      'nu': SUPERSONIC, 'mu': SUPERSONIC},
+    NormalShock    : {'M': SUPERSONIC, 'M2': SUPERSONIC, 'Pt2_Pt1': SUPERSONIC, 'P2_P1': SUPERSONIC,
+                      'Pt1_P1': SUPERSONIC, 'P1_Pt2': SUPERSONIC, 'T2_T1': SUPERSONIC, 'rho2_rho1': SUPERSONIC},
+    FannoFlow      : {'M': SUBSONIC, 'Pt_Ptstar': SUBSONIC, 'rhot_rhotstar': SUBSONIC, 'cfLstar_D': SUPERSONIC},
+    RayleighFlow   : {'M': SUBSONIC, 'T_Tstar': SUBSONIC_LOW, 'Pt_Ptstar': SUBSONIC, 'Tt_Ttstar': SUBSONIC},
+}
+BATCH_CLASSES   : tuple[type, ...] = (IsentropicFlow, NormalShock)
+
+SCALAR_CALLS : int = 200
+BATCH_SIZE   : int = 10000
+REPEATS      : int = 5
+TOLERANCE    : float = 0.25
+
+DUCT_SECTIONS : list[dict] = [
+    {'Section Num': 0, 'Flow Type': 'Isentropic', 'M': 1.8, 'P': 30397.5, 'T': 250},
+    {'Section Num': 1, 'Flow Type': 'Normal'},
+    {'Section Num': 2, 'Flow Type': 'Fanno', 'cfL_D': 0.2},
+    {'Section Num': 3, 'Flow Type': 'Rayleigh', 'q': 2e4},
+]
+
+
+def sample_inputs(flow_class, input_var, size, rng):
+    """
+    Random physical inputs of one 'input_var'.
+
+    Parameters:
+    - flow_class (type)          : Flow class with a 'PROPERTIES' table
+    - input_var (str)            : Input variable of the class
+    - size (int)                 : Number of samples
+    - rng (np.random.Generator)  : Random generator
+
+    Returns:
+    - (np.ndarray) : Input values
+    """
+
+    M = rng.uniform(*BENCH_CLASSES[flow_class][input_var], size)
+    if (input_var == 'M'):
+        return M
+
+    return np.asarray(flow_class.PROPERTIES[input_var](M, GAMMA), dtype = float)
+
+
+
+# Timing ==========================================================================================
+def best_time(function, repeats):
+    """
+    Best wall time of 'repeats' calls, after one warm-up call.
+
+    Returns:
+    - (float) : Seconds
+    """
+
+    function()
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+
+    return min(times)
+
+
+def _record(seconds, calls, points):
+    """
+    Latency and throughput of one benchmark.
+    """
+
+    return {
+        'seconds'    : seconds,
+        'calls'      : calls,
+        'points'     : points,
+        'latency_us' : 1e6 * seconds / calls,
+        'point_us'   : 1e6 * seconds / points,
+        'throughput' : points / seconds,
+    }
+
+
+def _selected(name, pattern):
+    return (pattern is None) or (pattern in name)
+
+
+def bench_flow(flow_class, input_var, scalar_calls, batch_size, repeats, rng, pattern = None):
+    """
+    Times one 'input_var' branch with scalar calls, and with one batched call for the 'BATCH_CLASSES'.
+    A branch that raises is reported with its error. The inputs are drawn before the filter is applied,
+    so a filtered run times the same inputs as a full one.
+
+    Returns:
+    - (dict[str, dict]) : '<Class>.<input_var>.scalar' and '<Class>.<input_var>.batch' records matching 'pattern'
+    """
+
+    name    = f'{flow_class.__name__}.{input_var}'
+    records = {}
+
+    scalars = [float(value) for value in sample_inputs(flow_class, input_var, scalar_calls, rng)]
+    batch   = sample_inputs(flow_class, input_var, batch_size, rng)
+
+    def run_scalar():
+        for value in scalars:
+            flow_class(input_var, value, GAMMA)
+
+    def run_batch():
+        flow_class(input_var, batch, GAMMA)
+
+    modes = [('scalar', run_scalar, scalar_calls, scalar_calls)]
+    if (flow_class in BATCH_CLASSES):
+        modes.append(('batch', run_batch, 1, batch_size))
+
+    for mode, function, calls, points in modes:
+        if (not _selected(f'{name}.{mode}', pattern)):
+            continue
+
+        try:
+            records[f'{name}.{mode}'] = _record(best_time(function, repeats), calls, points)
+        except (ValueError, TypeError) as error:
+            records[f'{name}.{mode}'] = {'error': f'{type(error).__name__}: {error}'}
+
+    return records
+
+
+def bench_duct(scalar_calls, batch_size, repeats, rng, pattern = None):
+    """
+    Times the duct chain of 'DUCT_SECTIONS' with scalar inlets and one batched inlet array.
+
+    Returns:
+    - (dict[str, dict]) : 'solve_duct.scalar' and 'solve_duct.batch' records matching 'pattern'
+    """
+
+    scalar_calls = max(1, scalar_calls // 10)
+    inlet_M      = rng.uniform(1.5, 3.0, batch_size)
+    scalar_M     = [float(M) for M in inlet_M[:scalar_calls]]
+
+    def run_scalar():
+        for M in scalar_M:
+            solve_duct([{**DUCT_SECTIONS[0], 'M': M}] + DUCT_SECTIONS[1:], GAMMA)
+
+    def run_batch():
+        solve_duct([{**DUCT_SECTIONS[0], 'M': inlet_M}] + DUCT_SECTIONS[1:], GAMMA)
+
+    records = {}
+    for mode, function, calls, points in [('scalar', run_scalar, scalar_calls, scalar_calls), ('batch', run_batch, 1, batch_size)]:
+        if (_selected(f'solve_duct.{mode}', pattern)):
+            records[f'solve_duct.{mode}'] = _record(best_time(function, repeats), calls, points)
+
+    return records
+
+
+def run_benchmarks(scalar_calls = SCALAR_CALLS, batch_size = BATCH_SIZE, repeats = REPEATS, seed = 0, pattern = None):
+    """
+    Runs the whole suite with the result cache turned off.
+
+    Parameters:
+    - scalar_calls (int) : Constructions per scalar benchmark, default at 'SCALAR_CALLS'
+    - batch_size (int)   : Points per batched benchmark, default at 'BATCH_SIZE'
+    - repeats (int)      : Timed repeats, the best one is kept, default at 'REPEATS'
+    - seed (int)         : Random seed of the inputs, default at 0
+    - pattern (str)      : Only benchmarks whose full name ('<Class>.<input_var>.<mode>') contains it,
+                           default at None (all)
+
+    Returns:
+    - (dict) : 'meta' (environment and settings) and 'results' (name to record)
+    """
+
+    CompressibleFlow.disable_cache()
+    rng     = np.random.default_rng(seed)
+    results = {}
+
+    for flow_class, input_vars in BENCH_CLASSES.items():
+        for input_var in input_vars:
+            results.update(bench_flow(flow_class, input_var, scalar_calls, batch_size, repeats, rng, pattern))
+
+    results.update(bench_duct(scalar_calls, batch_size, repeats, rng, pattern))
+
+    meta = {
+        'date'         : datetime.now().isoformat(timespec = 'seconds'),
+        'python'       : platform.python_version(),
+        'numpy'        : np.__version__,
+        'scipy'        : scipy.__version__,
+        'machine'      : platform.machine(),
+        'platform'     : platform.platform(),
+        'scalar_calls' : scalar_calls,
+        'batch_size'   : batch_size,
+        'repeats'      : repeats,
+        'seed'         : seed,
+    }
+
+    return {'meta': meta, 'results': results}
+
+
+
+# Baselines =======================================================================================
+def save_baseline(report, path):
+    with open(path, 'w') as file:
+        json.dump(report, file, indent = 2)
+
+
+def load_baseline(path):
+    with open(path) as file:
+        return json.load(file)
+
+
+def compare(report, baseline, tolerance = TOLERANCE):
+    """
+    Compares the per-point times against a baseline.
+
+    Parameters:
+    - report (dict)     : Current 'run_benchmarks' report
+    - baseline (dict)   : Previous report, as loaded from JSON
+    - tolerance (float) : Allowed relative slowdown, default at 'TOLERANCE'
+
+    Returns:
+    - (list[dict]) : One entry per benchmark in both reports, with 'name', 'baseline_us', 'current_us',
+                     'ratio' (current / baseline), and 'regression' (ratio > 1 + tolerance). A benchmark
+                     timed in the baseline that now errors is a regression with 'current_us' None and its 'error'.
+    """
+
+    rows = []
+    for name, record in report['results'].items():
+        previous = baseline['results'].get(name)
+        if ((previous is None) or ('point_us' not in previous)):
+            continue
+
+        if ('point_us' not in record):
+            rows.append({
+                'name'        : name,
+                'baseline_us' : previous['point_us'],
+                'current_us'  : None,
+                'ratio'       : None,
+                'regression'  : True,
+                'error'       : record.get('error'),
+            })
+            continue
+
+        ratio = record['point_us'] / previous['point_us']
+        rows.append({
+            'name'        : name,
+            'baseline_us' : previous['point_us'],
+            'current_us'  : record['point_us'],
+            'ratio'       : ratio,
+            'regression'  : bool(ratio > 1 + tolerance),
+        })
+
+    return rows
+
+
+def print_report(report, rows = None):
+    """
+    Prints the latency and throughput table, and the baseline ratios when given.
+    """
+
+    ratios = {row['name']: row for row in (rows or [])}
+    print(f"{'Benchmark':40s} {'call [us]':>12s} {'point [us]':>12s} {'points/s':>12s} {'vs base':>9s}")
+    for name, record in report['results'].items():
+        if ('error' in record):
+            line = f"{name:40s} {record['error']}"
+            if (name in ratios):
+                line += '  REGRESSION'
+            print(line)
+            continue
+
+        line = f"{name:40s} {record['latency_us']:12.2f} {record['point_us']:12.4f} {record['throughput']:12.4g}"
+        if (name in ratios):
+            row   = ratios[name]
+            line += f" {row['ratio']:8.2f}x" + ('  REGRESSION' if (row['regression']) else '')
+        print(line)
+
+
+
+# Given Data ======================================================================================
+if (__name__ == '__main__'):
+    parser = argparse.ArgumentParser(description = 'Flow solver benchmarks')
+    parser.add_argument('--save', help = 'Writes the report to this JSON file')
+    parser.add_argument('--compare', help = 'Compares against this JSON baseline, exits with 1 on a regression')
+    parser.add_argument('--tolerance', type = float, default = TOLERANCE, help = 'Allowed relative slowdown')
+    parser.add_argument('--filter', help = 'Only benchmarks whose name contains this text')
+    parser.add_argument('--scalar-calls', type = int, default = SCALAR_CALLS)
+    parser.add_argument('--batch-size', type = int, default = BATCH_SIZE)
+    parser.add_argument('--repeats', type = int, default = REPEATS)
+    parser.add_argument('--seed', type = int, default = 0)
+    args = parser.parse_args()
+
+    report = run_benchmarks(args.scalar_calls, args.batch_size, args.repeats, args.seed, args.filter)
+    rows   = compare(report, load_baseline(args.compare), args.tolerance) if (args.compare) else None
+    print_report(report, rows)
+
+    if (args.save):
+        save_baseline(report, args.save)
+
+    if (rows and any(row['regression'] for row in rows)):
+        sys.exit(1)
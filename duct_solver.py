@@ -1,129 +1,312 @@
 """
-Main Program
+Duct Solver
 Start Date        : 3/4/2025
-Modification Date : 3/14/2025
+Modification Date : 10/18/2026
 """
 
 
 
-# Local Imports ===================================================================================
+# Imports =========================================================================================
+# Local Imports -----------------------------------------------------------------------------------
+import os
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+import numpy as np
+
+
+# Global Imports ----------------------------------------------------------------------------------
 # Utilities ---------------------------------------------------------------------------------------
-from Utilities.unit_converter import unit_conversion as units
+from Utilities.standard_atmosphere import standard_atmosphere
 from Utilities.fancy_printer import section_printer as fprint
 
 # Flow Solvers ------------------------------------------------------------------------------------
-from Flow_Solvers.isentropic_flow import iscentropic_flow_solver as ifs
-from Flow_Solvers.normal_shocks import normal_shock_solver as nss
-
-
-
-# Isentropic Duct Solver ==========================================================================
-def isentropic_duct():
-    return
-
-
-
-# Given Data =======================================================================================
-# sections = [
-#     {'Section Num': 0, 'Flow Type': 'Isentropic', 'M': 1.8, 'P': units(0.3, 'atm', 'Pa'), 'T': 250},
-#     {'Section Num': 1, 'Flow Type': 'Normal'},
-#     {'Section Num': 2, 'Flow Type': 'Isentropic'}
-# ]
-
-
-sections = [
-    {'Section Num': 0, 'Flow Type': 'Isentropic', 'M': 1.8, 'P': units(0.3, 'atm', 'Pa'), 'T': 250},
-    {'Section Num': 1, 'Flow Type': 'Normal'}
-]
-
-
-
-
-
-for i, section in enumerate(sections):
-    print("=========================================================================================")
-    section_num = section.get('Section Num')
-    flow_type = section.get('Flow Type')
-    M = section.get('M') 
-    P = section.get('P')
-    T = section.get('T')
-    
-    # print(f"\n\n{sections}\n\n")
-    # fprint(section)
-    # print(section)
-    
-    fprint({'Sections': [section]})
-    
-    # Isentropic ----------------------------------------------------------------------------------
-    if (flow_type == 'Isentropic'):
-        if (M is not None):
-            # print(f"Section {section_num}: M is explicitly defined as {M}")
-            pass
-        else:
-            if ((i > 0) and (sections[i - 1].get('M') is not None)):
-                M = sections[i - 1]['M']
-                # print(f"Section {section_num}: M is inherited from the previous section as {M}")
-            else:
-                # print(f"Section {section_num}: M is not available")
-                continue  # Skip further calculations if M is not available
-                
-        if (M < 1):
-            Pt = P / ifs('M', M)["Subsonic"]["P_Pt"]
-            Tt = T / ifs('M', M)["Subsonic"]["T_Tt"]
-        else:  
-            Pt = P / ifs('M', M)["Supersonic"]["P_Pt"]
-            Tt = T / ifs('M', M)["Supersonic"]["T_Tt"]
-        
-        # Append Pt and Tt to the current section
-        section['Pt'] = Pt
-        section['Tt'] = Tt
-        
-        # print(f"\nSection {section_num}: Pt = {units(Pt, 'Pa', 'atm')} [atm], Tt = {Tt}\n")
-                
-
-    
-    # Normal Shock --------------------------------------------------------------------------------
-    elif flow_type == 'Normal':
-        if (M is not None):
-            print(f"Section {section_num}: M is explicitly defined as {M}")
-        else:
-            if ((i > 0) and (sections[i - 1].get('M') is not None)):
-                M = sections[i - 1]['M']
-                section['M'] = M  # Append M to the current section
-                # print(f"Section {section_num}: M is inherited from the previous section as {M}")
-            else:
-                # print(f"Section {section_num}: M is not available")
-                pass
-                
-        Pt0 = sections[i - 1]['Pt']
-        Tt0 = sections[i - 1]['Tt']
-        
-        Pt1 = Pt0 * nss('M', M)['Pt2_Pt1']
-        Tt1 = Tt0 * nss('M', M)['Pt2_Pt1']
-                
-        
-        # Append Pt and Tt to the current section
-        section['Pt'] = Pt1
-        section['Tt'] = Tt1
-        
-        # print(f"\n\nPt: {units(Pt, 'Pa', 'atm')} [atm], Tt: {Tt}\n\n")
-
-
-    
-    # Fanno Flow ----------------------------------------------------------------------------------
-    elif flow_type == 'Fanno':
-        print(f"Section {section_num}: Fanno flow calculations can be performed here")
-    
-    # Rayleigh Flow --------------------------------------------------------------------------------
-    elif flow_type == 'Rayleigh':
-        print(f"Section {section_num}: Rayleigh flow calculations can be performed here")
-    
-    else:
-        raise ValueError(f"Section {section_num}: Invalid flow type")
-    
-data = {
-    'Sections': [{'Section Num': 0, 'Flow Type': 'Isentropic', 'M': 1.8, 'P': 30397.5, 'T': 250, 'Pt': 174657.8432082955, 'Tt': 411.99999999999994}, {'Section Num': 1, 'Flow Type': 'Normal', 'M': 1.8, 'Pt': 141941.59964822943, 'Tt': 334.82572543465926}]
+from Flow_Solvers.isentropic_flow import IsentropicFlow, M_from_A_Astar
+from Flow_Solvers.normal_shock import NormalShock
+from Flow_Solvers.fanno_flow import cfLstar_D, M_from_cfLstar_D, Pt_Ptstar as fanno_Pt_Ptstar
+from Flow_Solvers.rayleigh_flow import Tt_Ttstar, M_from_Tt_Ttstar, Pt_Ptstar as rayleigh_Pt_Ptstar
+
+
+
+# Section Solvers =================================================================================
+# Every solver takes the incoming (M, Pt, Tt) arrays and returns the outgoing ones.
+# Entries that choke or have no solution become NaN and stay NaN downstream.
+def _same_branch(inverse, target, M, gamma):
+    """
+    Inverts a two-branch relation on the branch of the incoming Mach number.
+    """
+
+    supersonic = (M > 1)
+    return np.where(supersonic, inverse(target, gamma, supersonic = True), inverse(target, gamma, supersonic = False))
+
+
+def isentropic_section(section, M, Pt, Tt, gamma, cp):
+    """
+    Isentropic section. 'A_ratio' (exit area / inlet area) changes the Mach number on the same
+    branch, an explicit 'M' overrides it, and no input carries the flow through unchanged.
+    """
+
+    if ('A_ratio' in section):
+        A_Astar_exit = IsentropicFlow('M', M, gamma).A_Astar * np.asarray(section['A_ratio'], dtype = float)
+        M = _same_branch(M_from_A_Astar, A_Astar_exit, M, gamma)
+
+    elif (section.get('M') is not None):
+        M = np.broadcast_to(np.asarray(section['M'], dtype = float), M.shape)
+
+    return M, Pt, Tt
+
+
+def normal_section(section, M, Pt, Tt, gamma, cp):
+    """
+    Normal shock at the incoming Mach number. Subsonic inflow has no shock and becomes NaN.
+    """
+
+    NS = NormalShock('M', M, gamma)
+    return NS.M2, Pt * NS.Pt2_Pt1, Tt
+
+
+def fanno_section(section, M, Pt, Tt, gamma, cp):
+    """
+    Fanno section with the friction parameter 'cfL_D' (cf L / D). Sections longer than L* choke.
+    """
+
+    remaining = cfLstar_D(M, gamma) - np.asarray(section['cfL_D'], dtype = float)
+    M_exit = _same_branch(M_from_cfLstar_D, np.where(remaining >= 0, remaining, np.nan), M, gamma)
+    return M_exit, Pt * fanno_Pt_Ptstar(M_exit, gamma) / fanno_Pt_Ptstar(M, gamma), Tt
+
+
+def rayleigh_section(section, M, Pt, Tt, gamma, cp):
+    """
+    Rayleigh section with the heat addition 'q' [J/kg] or the exit stagnation temperature 'Tt' [K].
+    Heat addition past Tt/Tt* = 1 thermally chokes.
+    """
+
+    Tt_exit = np.asarray(section['Tt'], dtype = float) if ('Tt' in section) else Tt + np.asarray(section['q'], dtype = float) / cp
+    M_exit  = _same_branch(M_from_Tt_Ttstar, Tt_Ttstar(M, gamma) * Tt_exit / Tt, M, gamma)
+    return M_exit, Pt * rayleigh_Pt_Ptstar(M_exit, gamma) / rayleigh_Pt_Ptstar(M, gamma), Tt_exit
+
+
+SECTION_SOLVERS = {
+    'Isentropic' : isentropic_section,
+    'Normal'     : normal_section,
+    'Fanno'      : fanno_section,
+    'Rayleigh'   : rayleigh_section,
 }
-    
-fprint(data)
 
+
+
+# Duct Network Solver =============================================================================
+def solve_duct(sections, gamma = 1.4, cp = 1004.5):
+    """
+    Chains the duct sections and carries M, Pt, and Tt from one section to the next.
+    Any section input can be a NumPy array, in which case every entry is a separate duct
+    configuration and the whole batch is solved in one pass per section.
+
+    The first section must be 'Isentropic' with the static inlet state 'M', 'P' [Pa], and 'T' [K].
+    Section inputs:
+    - 'Isentropic' : optional 'A_ratio' (exit / inlet area) or 'M'
+    - 'Normal'     : none, the shock stands at the incoming Mach number
+    - 'Fanno'      : 'cfL_D', the friction parameter of the section
+    - 'Rayleigh'   : 'q' [J/kg] or the exit 'Tt' [K]
+
+    Parameters:
+    - sections (list[dict]) : Section dictionaries with 'Section Num' and 'Flow Type'
+    - gamma (float)         : Heat capacity ratio, default at 1.4
+    - cp (float)            : Specific heat at constant pressure [J/(kg K)], default at 1004.5
+
+    Returns:
+    - (list[dict]) : One dictionary per section with 'Section Num', 'Flow Type', 'M', 'Pt', 'Tt', 'P', and 'T'
+                     at the section exit. Values are floats for scalar inputs and arrays for batches.
+
+    Raises:
+    - ValueError : If the inlet section is missing its state or a flow type is invalid
+
+    Example:
+    >>> sections = [
+    >>>     {'Section Num': 0, 'Flow Type': 'Isentropic', 'M': np.linspace(1.5, 3.0, 1000), 'P': 30397.5, 'T': 250},
+    >>>     {'Section Num': 1, 'Flow Type': 'Normal'},
+    >>>     {'Section Num': 2, 'Flow Type': 'Rayleigh', 'q': 2e5},
+    >>> ]
+    >>> solve_duct(sections)[-1]['Pt']
+    """
+
+    inlet = sections[0]
+    if ((inlet.get('Flow Type') != 'Isentropic') or any(inlet.get(key) is None for key in ['M', 'P', 'T'])):
+        raise ValueError("Section 0 must be 'Isentropic' with 'M', 'P', and 'T'")
+
+    # Batch Shape ---------------------------------------------------------------------------------
+    values   = [value for section in sections for value in section.values() if isinstance(value, (int, float, np.ndarray))]
+    shape    = np.broadcast_shapes(*[np.shape(value) for value in values])
+    is_batch = (len(shape) > 0)
+    shape    = shape if (is_batch) else (1,)
+
+    # Inlet State ---------------------------------------------------------------------------------
+    M  = np.broadcast_to(np.asarray(inlet['M'], dtype = float), shape)
+    IF = IsentropicFlow('M', M, gamma)
+    Pt = np.asarray(inlet['P'], dtype = float) / IF.P_Pt
+    Tt = np.asarray(inlet['T'], dtype = float) / IF.T_Tt
+
+    # Section Marching ----------------------------------------------------------------------------
+    results = []
+    for section in sections:
+        section_num = section.get('Section Num')
+        flow_type   = section.get('Flow Type')
+        if (flow_type not in SECTION_SOLVERS):
+            raise ValueError(f"Section {section_num}: Invalid flow type")
+
+        if (section is not inlet):
+            M, Pt, Tt = SECTION_SOLVERS[flow_type](section, M, Pt, Tt, gamma, cp)
+
+        with np.errstate(invalid = 'ignore'):
+            IF = IsentropicFlow('M', np.where(M > 0, M, np.nan), gamma)
+
+        state = {'M': M, 'Pt': Pt, 'Tt': Tt, 'P': Pt * IF.P_Pt, 'T': Tt * IF.T_Tt}
+        state = {key: np.broadcast_to(value, shape) for key, value in state.items()}
+        if (not is_batch):
+            state = {key: float(value[0]) for key, value in state.items()}
+
+        results.append({'Section Num': section_num, 'Flow Type': flow_type, **state})
+
+    return results
+
+
+
+# Batch Configuration Solver ======================================================================
+# Configurations are grouped by their layout (flow types and input names of every section), so each
+# chunk is solved with one vectorized 'solve_duct' call per layout instead of one call per configuration.
+STATE_KEYS : tuple[str, ...] = ('M', 'Pt', 'Tt', 'P', 'T')
+
+def _layout(sections):
+    """
+    Hashable layout of a configuration, the flow types and the names of the section inputs.
+    """
+
+    return tuple((section.get('Flow Type'), tuple(sorted(key for key in section if (key not in ['Section Num', 'Flow Type']))))
+                 for section in sections)
+
+
+def _solve_chunk(start, configs, gamma, cp):
+    """
+    Solves one chunk of configurations. Runs inside the worker processes.
+
+    Returns:
+    - (tuple) : (start, states) with 'states' of shape (len(STATE_KEYS), len(configs), max sections)
+    """
+
+    n_sections = max(len(sections) for sections in configs)
+    states     = np.full((len(STATE_KEYS), len(configs), n_sections), np.nan)
+
+    groups = {}
+    for index, sections in enumerate(configs):
+        groups.setdefault(_layout(sections), []).append(index)
+
+    for layout, indices in groups.items():
+        # Stack the section inputs of the group into one array per input
+        stacked = []
+        for section_index, (flow_type, keys) in enumerate(layout):
+            section = {'Section Num': section_index, 'Flow Type': flow_type}
+            for key in keys:
+                section[key] = np.array([configs[index][section_index][key] for index in indices], dtype = float)
+            stacked.append(section)
+
+        results = solve_duct(stacked, gamma, cp)
+        for section_index, result in enumerate(results):
+            for key_index, key in enumerate(STATE_KEYS):
+                states[key_index, indices, section_index] = result[key]
+
+    return start, states
+
+
+def solve_duct_batch(configs, gamma = 1.4, cp = 1004.5, max_workers = None, chunk_size = None, cancel_event = None):
+    """
+    Solves many independent duct configurations across a process pool.
+    The configurations are split into chunks, every chunk is solved in a worker process, and the results
+    are gathered back in input order. Configurations can have different numbers and types of sections.
+
+    Parameters:
+    - configs (list[list[dict]]) : Section lists in the 'solve_duct' format with scalar inputs
+    - gamma (float)              : Heat capacity ratio, default at 1.4
+    - cp (float)                 : Specific heat at constant pressure [J/(kg K)], default at 1004.5
+    - max_workers (int)          : Number of worker processes, default at the CPU count. 1 solves in this process.
+    - chunk_size (int)           : Configurations per chunk, default spreads about 4 chunks over each worker
+    - cancel_event (Event)       : Optional threading/multiprocessing Event. Once set, pending chunks are
+                                   cancelled and the results finished so far are returned.
+
+    Returns:
+    - (dict[str, np.ndarray]) : 'M', 'Pt', 'Tt', 'P', and 'T' of shape (configs, max sections) at each section exit,
+                                NaN past the end of shorter configurations, for choked entries, and for cancelled chunks.
+                                'n_sections' (configs,) and 'completed' (configs,) mark the valid entries.
+
+    Example:
+    >>> configs = [[
+    >>>     {'Section Num': 0, 'Flow Type': 'Isentropic', 'M': M, 'P': 30397.5, 'T': 250},
+    >>>     {'Section Num': 1, 'Flow Type': 'Normal'},
+    >>>     {'Section Num': 2, 'Flow Type': 'Fanno', 'cfL_D': cfL_D},
+    >>> ] for M, cfL_D in zip(np.linspace(1.5, 3.0, 100000), np.linspace(0, 0.1, 100000))]
+    >>> solve_duct_batch(configs)['Pt'][:, -1]
+    """
+
+    n_configs   = len(configs)
+    n_sections  = np.array([len(sections) for sections in configs], dtype = int)
+    max_workers = max_workers or os.cpu_count() or 1
+    chunk_size  = chunk_size or max(1, -(-n_configs // (4 * max_workers)))
+
+    states    = np.full((len(STATE_KEYS), n_configs, n_sections.max(initial = 0)), np.nan)
+    completed = np.zeros(n_configs, dtype = bool)
+
+    def store(start, chunk_states):
+        stop = start + chunk_states.shape[1]
+        states[:, start:stop, :chunk_states.shape[2]] = chunk_states
+        completed[start:stop] = True
+
+    chunks = [(start, configs[start:start + chunk_size]) for start in range(0, n_configs, chunk_size)]
+
+    # Serial Path ---------------------------------------------------------------------------------
+    if ((max_workers == 1) or (len(chunks) <= 1)):
+        for start, chunk in chunks:
+            if ((cancel_event is not None) and cancel_event.is_set()):
+                break
+            store(*_solve_chunk(start, chunk, gamma, cp))
+
+    # Process Pool --------------------------------------------------------------------------------
+    # The cancel event is checked before every submission and every wait, and a cancel drops the
+    # queued chunks at once. Chunks already running in a worker still finish and are stored.
+    elif ((cancel_event is None) or (not cancel_event.is_set())):
+        cancelled = lambda: (cancel_event is not None) and cancel_event.is_set()
+        with ProcessPoolExecutor(max_workers = min(max_workers, len(chunks))) as executor:
+            pending = set()
+            try:
+                for start, chunk in chunks:
+                    if (cancelled()):
+                        break
+                    pending.add(executor.submit(_solve_chunk, start, chunk, gamma, cp))
+
+                while (pending and (not cancelled())):
+                    done, pending = wait(pending, timeout = 0.1, return_when = FIRST_COMPLETED)
+                    for future in done:
+                        store(*future.result())
+            finally:
+                for future in pending:
+                    future.cancel()
+                executor.shutdown(wait = True, cancel_futures = True)
+                for future in pending:
+                    if (future.done() and (not future.cancelled()) and (future.exception() is None)):
+                        store(*future.result())
+
+    results = {key: states[key_index] for key_index, key in enumerate(STATE_KEYS)}
+    results['n_sections'] = n_sections
+    results['completed']  = completed
+    return results
+
+
+
+# Given Data ======================================================================================
+if (__name__ == '__main__'):
+    air = standard_atmosphere(9000)
+    sections = [
+        {'Section Num': 0, 'Flow Type': 'Isentropic', 'M': 1.8, 'P': float(air['P']), 'T': float(air['T'])},
+        {'Section Num': 1, 'Flow Type': 'Normal'},
+        {'Section Num': 2, 'Flow Type': 'Fanno', 'cfL_D': 0.2},
+        {'Section Num': 3, 'Flow Type': 'Rayleigh', 'q': 2e4},
+    ]
+
+    fprint({'Sections': solve_duct(sections)})
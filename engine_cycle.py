@@ -0,0 +1,412 @@
+"""
+Engine Cycle
+Start Date        : 10/18/2026
+Modification Date : 10/18/2026
+"""
+
+
+
+# Imports =========================================================================================
+# Local Imports -----------------------------------------------------------------------------------
+import numpy as np
+
+
+# Global Imports ----------------------------------------------------------------------------------
+# Utilities ---------------------------------------------------------------------------------------
+from Utilities.standard_atmosphere import standard_atmosphere
+
+# Flow Solvers ------------------------------------------------------------------------------------
+from Flow_Solvers.isentropic_flow import IsentropicFlow, A_Astar, P_Pt, M_from_P_Pt
+from Flow_Solvers.normal_shock import NormalShock
+from Flow_Solvers.rayleigh_flow import Tt_Ttstar, M_from_Tt_Ttstar, Pt_Ptstar as rayleigh_Pt_Ptstar
+
+
+
+# Engine Stations =================================================================================
+# 0 freestream, 2 compressor face, 3 burner entry, 4 turbine entry, 5 turbine exit, 9 nozzle exit
+CYCLE_STATIONS : tuple[str, ...] = ('0', '2', '3', '4', '5', '9')
+HEATING_VALUE  : float = 42.8e6
+
+
+
+def _inlet(M0, T0, P0, gamma, R, pi_d, inlet_shock):
+    """
+    Freestream totals, flight velocity, and the compressor face stagnation pressure from one array
+    'IsentropicFlow' (and 'NormalShock' for a pitot inlet).
+
+    Returns:
+    - (tuple) : (Tt0, Pt0, V0, Pt2) with the shape of M0
+    """
+
+    shape      = M0.shape
+    freestream = IsentropicFlow('M', np.where(M0 > 0, M0, np.nan).ravel(), gamma, lazy = True)
+    Tt0 = T0 / freestream.T_Tt.reshape(shape)
+    Pt0 = P0 / freestream.P_Pt.reshape(shape)
+    V0  = M0 * np.sqrt(gamma * R * T0)
+    Pt2 = Pt0 * pi_d
+
+    if (inlet_shock):
+        shock = NormalShock('M', M0.ravel(), gamma, lazy = True)
+        Pt2   = Pt2 * np.where(M0 > 1, shock.Pt2_Pt1.reshape(shape), 1)
+
+    return Tt0, Pt0, V0, Pt2
+
+
+
+# On-Design Cycle =================================================================================
+def solve_cycle(M0, T0, P0, pi_c, Tt4, gamma = 1.4, cp = 1004.5, hPR = HEATING_VALUE, M_burner = 0.15,
+                pi_d = 1.0, inlet_shock = False, eta_c = 1.0, eta_t = 1.0, eta_b = 1.0, pi_n = 1.0):
+    """
+    On-design turbojet cycle over whole parameter grids. A compressor pressure ratio of 1 is a ramjet.
+    Every input broadcasts against the others, so carpet plots are one call:
+    M0[:, None, None], pi_c[None, :, None], and Tt4[None, None, :] give a (M0, pi_c, Tt4) grid.
+
+    The freestream totals and the inlet shock come from one array 'IsentropicFlow' and 'NormalShock'.
+    The burner is a constant-area Rayleigh section entered at 'M_burner', and its heat addition past the
+    thermal choking point is NaN. The nozzle expands isentropically to the ambient pressure (P9 = P0).
+    The gas is calorically perfect with one 'gamma' and 'cp' throughout.
+
+    Parameters:
+    - M0 (float)          : Flight Mach number (M0 > 0), or a NumPy array
+    - T0 (float)          : Ambient static temperature [K]
+    - P0 (float)          : Ambient static pressure [Pa]
+    - pi_c (float)        : Compressor stagnation pressure ratio, 1 for a ramjet
+    - Tt4 (float)         : Turbine entry (burner exit) stagnation temperature [K]
+    - gamma (float)       : Heat capacity ratio, default at 1.4
+    - cp (float)          : Specific heat at constant pressure [J/(kg K)], default at 1004.5
+    - hPR (float)         : Fuel heating value [J/kg], default at 'HEATING_VALUE'
+    - M_burner (float)    : Burner entry Mach number, default at 0.15
+    - pi_d (float)        : Diffuser stagnation pressure ratio, default at 1
+    - inlet_shock (bool)  : Normal shock ahead of the diffuser when M0 > 1 (pitot inlet), default at False
+    - eta_c (float)       : Compressor isentropic efficiency, default at 1
+    - eta_t (float)       : Turbine isentropic efficiency, default at 1
+    - eta_b (float)       : Burner efficiency, default at 1
+    - pi_n (float)        : Nozzle stagnation pressure ratio, default at 1
+
+    Returns:
+    - (dict[str, np.ndarray]) : Arrays of the broadcast input shape, NaN where the cycle has no solution
+        - 'F_mdot'       : Specific thrust F / mdot0 [N s/kg]
+        - 'TSFC'         : Thrust specific fuel consumption [kg/(N s)]
+        - 'f'            : Fuel to air ratio
+        - 'eta_thermal', 'eta_propulsive', 'eta_overall' : Cycle efficiencies
+        - 'V0', 'V9', 'M9' : Flight and exhaust velocities [m/s], exhaust Mach number
+        - 'Pt', 'Tt'     : Dictionaries of the station stagnation pressures [Pa] and temperatures [K]
+        - 'M4'           : Burner exit Mach number
+        - 'valid'        : True where the cycle closes with positive thrust
+
+    Example:
+    >>> M0   = np.linspace(0.5, 3.0, 100)[:, None, None]
+    >>> pi_c = np.linspace(1, 40, 100)[None, :, None]
+    >>> Tt4  = np.linspace(1400, 2000, 100)[None, None, :]
+    >>> cycle = solve_cycle(M0, 216.7, 22632, pi_c, Tt4)      # 10^6 points
+    >>> cycle['TSFC'].shape
+    """
+
+    M0, T0, P0, pi_c, Tt4 = np.broadcast_arrays(*[np.asarray(value, dtype = float) for value in [M0, T0, P0, pi_c, Tt4]])
+    shape = M0.shape
+    R     = cp * (gamma - 1) / gamma
+    g_gm1 = gamma / (gamma - 1)
+
+    with np.errstate(divide = 'ignore', invalid = 'ignore', over = 'ignore'):
+        # Freestream and Diffuser -----------------------------------------------------------------
+        Tt0, Pt0, V0, Pt2 = _inlet(M0, T0, P0, gamma, R, pi_d, inlet_shock)
+        Tt2 = Tt0
+
+        # Compressor ------------------------------------------------------------------------------
+        Pt3 = Pt2 * pi_c
+        Tt3 = Tt2 * (1 + (pi_c**(1 / g_gm1) - 1) / eta_c)
+
+        # Burner ----------------------------------------------------------------------------------
+        # Subsonic Rayleigh heating from M_burner, f from the energy balance of the burner
+        f     = cp * (Tt4 - Tt3) / (eta_b * hPR - cp * Tt4)
+        M4    = M_from_Tt_Ttstar(Tt_Ttstar(M_burner, gamma) * Tt4 / Tt3, gamma, supersonic = False)
+        Pt4   = Pt3 * rayleigh_Pt_Ptstar(M4, gamma) / rayleigh_Pt_Ptstar(M_burner, gamma)
+
+        # Turbine ---------------------------------------------------------------------------------
+        # The turbine drives the compressor, (1 + f) cp (Tt4 - Tt5) = cp (Tt3 - Tt2)
+        Tt5 = Tt4 - (Tt3 - Tt2) / (1 + f)
+        Pt5 = Pt4 * (1 - (1 - Tt5 / Tt4) / eta_t)**g_gm1
+
+        # Nozzle ----------------------------------------------------------------------------------
+        Pt9     = Pt5 * pi_n
+        Tt9     = Tt5
+        P0_Pt9  = (P0 / Pt9).ravel()
+        expands = (P0_Pt9 > 0) & (P0_Pt9 < 1)
+        nozzle  = IsentropicFlow('P_Pt', np.where(expands, P0_Pt9, 0.5), gamma, lazy = True)
+        M9      = np.where(expands, nozzle.M, np.nan).reshape(shape)
+        T9      = Tt9 * np.where(expands, nozzle.T_Tt, np.nan).reshape(shape)
+        V9      = M9 * np.sqrt(gamma * R * T9)
+
+        # Performance -----------------------------------------------------------------------------
+        F_mdot = (1 + f) * V9 - V0
+        valid  = (f > 0) & np.isfinite(M4) & (Tt5 > 0) & np.isfinite(V9) & (F_mdot > 0)
+
+        kinetic        = 0.5 * ((1 + f) * V9**2 - V0**2)
+        eta_thermal    = kinetic / (f * hPR)
+        eta_propulsive = F_mdot * V0 / kinetic
+        invalid        = lambda value: np.where(valid, value, np.nan)
+
+        return {
+            'F_mdot'         : invalid(F_mdot),
+            'TSFC'           : invalid(f / F_mdot),
+            'f'              : invalid(f),
+            'eta_thermal'    : invalid(eta_thermal),
+            'eta_propulsive' : invalid(eta_propulsive),
+            'eta_overall'    : invalid(eta_thermal * eta_propulsive),
+            'V0'             : V0,
+            'V9'             : invalid(V9),
+            'M9'             : invalid(M9),
+            'M4'             : invalid(M4),
+            'Pt'             : {'0': Pt0, '2': Pt2, '3': Pt3, '4': invalid(Pt4), '5': invalid(Pt5), '9': invalid(Pt9)},
+            'Tt'             : {'0': Tt0, '2': Tt2, '3': Tt3, '4': Tt4, '5': invalid(Tt5), '9': invalid(Tt9)},
+            'valid'          : valid,
+        }
+
+
+
+# Off-Design Matching =============================================================================
+# A choked turbine inlet (station 4) and a fixed nozzle throat (station 8) pass the same corrected flow:
+#     pi_t pi_n / (A_Astar(M8) sqrt(tau_t)) = A4 / A8
+# With the compressor-turbine work balance (1 + f) Tt4 (1 - tau_t) = Tt2 (tau_c - 1), this closes the
+# cycle in (tau_c, tau_t) at every flight condition. M8 = 1 while the nozzle is choked, otherwise it
+# follows from P0 / Pt9 through the isentropic relations.
+def _mass_flow_parameter(gamma, R):
+    # mdot sqrt(Tt) / (Pt A) at M = 1
+    return np.sqrt(gamma / R) * (2 / (gamma + 1))**((gamma + 1) / (2 * (gamma - 1)))
+
+
+def _throat_mach(P0_Pt9, gamma):
+    with np.errstate(invalid = 'ignore'):
+        return np.where(P0_Pt9 <= P_Pt(1.0, gamma), 1.0, M_from_P_Pt(P0_Pt9, gamma))
+
+
+def _match_state(tau_c, tau_t, point, gamma, cp, hPR, M_burner, eta_c, eta_t, eta_b, pi_n):
+    """
+    Engine state of one (tau_c, tau_t) guess at every flight condition of 'point'.
+    """
+
+    g_gm1 = gamma / (gamma - 1)
+    Tt3   = point['Tt2'] * tau_c
+    pi_c  = (1 + eta_c * (tau_c - 1))**g_gm1
+    f     = cp * (point['Tt4'] - Tt3) / (eta_b * hPR - cp * point['Tt4'])
+    M4    = M_from_Tt_Ttstar(Tt_Ttstar(M_burner, gamma) * point['Tt4'] / Tt3, gamma, supersonic = False)
+    pi_b  = rayleigh_Pt_Ptstar(M4, gamma) / rayleigh_Pt_Ptstar(M_burner, gamma)
+    pi_t  = (1 - (1 - tau_t) / eta_t)**g_gm1
+    Pt4   = point['Pt2'] * pi_c * pi_b
+    Pt9   = Pt4 * pi_t * pi_n
+    M8    = _throat_mach(point['P0'] / Pt9, gamma)
+
+    return {'pi_c': pi_c, 'f': f, 'M4': M4, 'pi_t': pi_t, 'Pt4': Pt4, 'Pt9': Pt9, 'M8': M8}
+
+
+def _match_residuals(x, point, A4_A8, components):
+    tau_c, tau_t = x[:, 0], x[:, 1]
+    state = _match_state(tau_c, tau_t, point, **components)
+    work  = (1 + state['f']) * point['Tt4'] * (1 - tau_t) / point['Tt2'] - (tau_c - 1)
+    flow  = np.log(state['pi_t'] * components['pi_n'] / (A_Astar(state['M8'], components['gamma']) * np.sqrt(tau_t))) - np.log(A4_A8)
+    return np.stack([work, flow], axis = 1)
+
+
+def _batched_newton(x, residuals, lower, upper, tol, max_iter):
+    """
+    Newton iterations on every row of x at once, with a forward-difference 2x2 Jacobian.
+    Steps are cut back to stay inside (lower, upper), and only the unconverged rows are evaluated.
+
+    Returns:
+    - (tuple) : (x, iterations), rows that do not converge are NaN
+    """
+
+    x          = x.copy()
+    iterations = np.zeros(len(x), dtype = int)
+    active     = np.all(np.isfinite(x), axis = 1)
+    x[~active] = np.nan
+
+    with np.errstate(divide = 'ignore', invalid = 'ignore', over = 'ignore'):
+        for _ in range(max_iter):
+            index = np.flatnonzero(active)
+            if (index.size == 0):
+                break
+
+            xi = x[index]
+            F  = residuals(xi, index)
+            J  = np.empty((index.size, 2, 2))
+            for column in range(2):
+                h  = 1e-7 * np.maximum(np.abs(xi[:, column]), 1)
+                xh = xi.copy()
+                xh[:, column] += h
+                J[:, :, column] = (residuals(xh, index) - F) / h[:, None]
+
+            det  = J[:, 0, 0] * J[:, 1, 1] - J[:, 0, 1] * J[:, 1, 0]
+            step = np.stack([(-F[:, 0] * J[:, 1, 1] + F[:, 1] * J[:, 0, 1]) / det,
+                             (-F[:, 1] * J[:, 0, 0] + F[:, 0] * J[:, 1, 0]) / det], axis = 1)
+
+            # Fraction to the boundary, so tau_c and tau_t stay physical
+            room  = np.where(step < 0, (lower - xi) / step, (upper - xi) / step)
+            alpha = np.minimum(1, 0.9 * np.min(np.where(step != 0, room, np.inf), axis = 1))
+            x_new = xi + alpha[:, None] * step
+
+            x[index] = x_new
+            iterations[index] += 1
+            failed    = ~np.all(np.isfinite(x_new), axis = 1)
+            converged = np.all(np.abs(alpha[:, None] * step) <= tol * np.maximum(np.abs(x_new), 1), axis = 1)
+            x[index[failed]] = np.nan
+            active[index[failed | converged]] = False
+
+    x[active] = np.nan
+    return x, iterations
+
+
+def solve_off_design(M0, T0, P0, Tt4, design, mdot_design = 1.0, stride = 8, tol = 1e-10, max_iter = 30, **components):
+    """
+    Off-design performance of the 'solve_cycle' engine along a flight schedule.
+    The turbine inlet is choked and the nozzle throat area is fixed at their design values, and the
+    nozzle exit still expands to P0. Every schedule point is matched in (tau_c, tau_t) with batched
+    Newton iterations.
+
+    Neighbouring schedule points have neighbouring solutions, so the schedule is solved coarse to fine:
+    every 'stride'^k-th point first, from the design point, then each finer level from the linear
+    interpolation of the converged points around it. A 10,000-point schedule takes 5 vectorized sweeps
+    with the default stride. Points that fail from the interpolated seed are retried from the design point.
+
+    Parameters:
+    - M0 (np.ndarray)    : Flight Mach number of each schedule point, in schedule order
+    - T0 (np.ndarray)    : Ambient static temperature [K], broadcast against M0
+    - P0 (np.ndarray)    : Ambient static pressure [Pa], broadcast against M0
+    - Tt4 (np.ndarray)   : Throttle setting, turbine entry stagnation temperature [K], broadcast against M0
+    - design (dict)      : Design point, scalar 'M0', 'T0', 'P0', 'pi_c', and 'Tt4' of 'solve_cycle'
+    - mdot_design (float) : Design air mass flow [kg/s], default at 1
+    - stride (int)       : Coarsening factor of the warm-start levels, default at 8
+    - tol (float)        : Relative tolerance on tau_c and tau_t, default at 1e-10
+    - max_iter (int)     : Newton iterations per level, default at 30
+    - components         : 'solve_cycle' component keywords (gamma, cp, hPR, M_burner, pi_d, inlet_shock,
+                           eta_c, eta_t, eta_b, pi_n), shared by the design and off-design points
+
+    Returns:
+    - (dict[str, np.ndarray]) : (points,) arrays, NaN where the engine cannot be matched
+        - 'pi_c', 'tau_c', 'tau_t', 'f', 'M8' : Matched cycle, M8 = 1 while the nozzle is choked
+        - 'mdot0', 'mdot0_ratio'             : Air mass flow [kg/s] and its ratio to the design one
+        - 'mdot_c2'                          : Corrected mass flow at the compressor face [kg/s]
+        - 'F', 'F_mdot', 'TSFC'              : Thrust [N], specific thrust [N s/kg], TSFC [kg/(N s)]
+        - 'iterations' (np.ndarray)          : Newton iterations of each point
+        - 'sweeps' (int)                     : Number of vectorized Newton sweeps
+
+    Raises:
+    - ValueError : If the design point does not close
+
+    Example:
+    >>> design = {'M0': 0.8, 'T0': 216.7, 'P0': 22632, 'pi_c': 20, 'Tt4': 1600}
+    >>> M0  = np.linspace(0.3, 0.9, 10000)
+    >>> run = solve_off_design(M0, 250.0, 50000.0, np.linspace(1300, 1650, 10000), design, mdot_design = 50)
+    >>> run['F'], run['sweeps']
+    """
+
+    components = {'gamma': 1.4, 'cp': 1004.5, 'hPR': HEATING_VALUE, 'M_burner': 0.15, 'pi_d': 1.0,
+                  'inlet_shock': False, 'eta_c': 1.0, 'eta_t': 1.0, 'eta_b': 1.0, 'pi_n': 1.0, **components}
+    gamma, cp = components['gamma'], components['cp']
+    R         = cp * (gamma - 1) / gamma
+    MFP_star  = _mass_flow_parameter(gamma, R)
+    inlet     = {key: components.pop(key) for key in ['pi_d', 'inlet_shock']}
+
+
+    # Design Point --------------------------------------------------------------------------------
+    reference = solve_cycle(**design, **components, **inlet)
+    if (not reference['valid']):
+        raise ValueError('The design point does not close')
+
+    tau_c_R = float(reference['Tt']['3'] / reference['Tt']['2'])
+    tau_t_R = float(reference['Tt']['5'] / reference['Tt']['4'])
+    pi_t_R  = (1 - (1 - tau_t_R) / components['eta_t'])**(gamma / (gamma - 1))
+    M8_R    = _throat_mach(design['P0'] / reference['Pt']['9'], gamma)
+    A4_A8   = float(pi_t_R * components['pi_n'] / (A_Astar(M8_R, gamma) * np.sqrt(tau_t_R)))
+    A4      = float(mdot_design * (1 + reference['f']) * np.sqrt(design['Tt4']) / (reference['Pt']['4'] * MFP_star))
+
+
+    # Flight Schedule -----------------------------------------------------------------------------
+    M0, T0, P0, Tt4 = np.broadcast_arrays(*[np.atleast_1d(np.asarray(value, dtype = float)) for value in [M0, T0, P0, Tt4]])
+    M0, T0, P0, Tt4 = [value.ravel() for value in [M0, T0, P0, Tt4]]
+    n = M0.size
+
+    with np.errstate(divide = 'ignore', invalid = 'ignore', over = 'ignore'):
+        Tt0, Pt0, V0, Pt2 = _inlet(M0, T0, P0, gamma, R, **inlet)
+        point = {'Tt2': Tt0, 'Pt2': Pt2, 'Tt4': Tt4, 'P0': P0}
+
+        lower = np.array([1.0, 1 - components['eta_t']])
+        upper = np.array([np.inf, 1.0])
+        def residuals(x, index):
+            return _match_residuals(x, {key: value[index] for key, value in point.items()}, A4_A8, components)
+
+
+        # Coarse to Fine Warm Starts --------------------------------------------------------------
+        x          = np.full((n, 2), np.nan)
+        iterations = np.zeros(n, dtype = int)
+        solved     = np.zeros(n, dtype = bool)
+        design_x   = np.array([tau_c_R, tau_t_R])
+
+        step = 1
+        while (step * stride < n):
+            step *= stride
+
+        sweeps = 0
+        while (step >= 1):
+            level = np.arange(0, n, step)
+            new   = level[~solved[level]]
+            known = np.flatnonzero(solved & np.isfinite(x[:, 0]))
+
+            if (known.size == 0):
+                seed = np.broadcast_to(design_x, (new.size, 2))
+            else:
+                seed = np.stack([np.interp(new, known, x[known, column]) for column in range(2)], axis = 1)
+
+            x[new], iterations[new] = _batched_newton(seed, lambda xi, index: residuals(xi, new[index]), lower, upper, tol, max_iter)
+            sweeps += 1
+
+            retry = new[np.isnan(x[new, 0])]
+            if ((retry.size > 0) and (known.size > 0)):
+                x[retry], extra = _batched_newton(np.broadcast_to(design_x, (retry.size, 2)), lambda xi, index: residuals(xi, retry[index]),
+                                                  lower, upper, tol, max_iter)
+                iterations[retry] += extra
+                sweeps += 1
+
+            solved[new] = True
+            step //= stride
+
+
+        # Performance -----------------------------------------------------------------------------
+        tau_c, tau_t = x[:, 0], x[:, 1]
+        state = _match_state(tau_c, tau_t, point, **components)
+        f     = state['f']
+        mdot0 = state['Pt4'] * A4 * MFP_star / (np.sqrt(Tt4) * (1 + f))
+
+        P0_Pt9 = P0 / state['Pt9']
+        Tt9    = Tt4 * tau_t
+        V9     = np.sqrt(2 * cp * Tt9 * (1 - P0_Pt9**((gamma - 1) / gamma)))
+        F_mdot = (1 + f) * V9 - V0
+
+    return {
+        'pi_c'        : state['pi_c'],
+        'tau_c'       : tau_c,
+        'tau_t'       : tau_t,
+        'f'           : f,
+        'M8'          : state['M8'],
+        'mdot0'       : mdot0,
+        'mdot0_ratio' : mdot0 / mdot_design,
+        'mdot_c2'     : mdot0 * np.sqrt(Tt0 / 288.15) / (Pt2 / 101325),
+        'F'           : mdot0 * F_mdot,
+        'F_mdot'      : F_mdot,
+        'TSFC'        : f / F_mdot,
+        'iterations'  : iterations,
+        'sweeps'      : sweeps,
+    }
+
+
+
+# Given Data ======================================================================================
+if (__name__ == '__main__'):
+    M0   = np.array([0.3, 0.8, 2.0, 3.0])[:, None]
+    pi_c = np.array([1.0, 10.0, 25.0])[None, :]
+
+    air   = standard_atmosphere(11000)
+    cycle = solve_cycle(M0, air['T'], air['P'], pi_c, 1600)
+    for i, M in enumerate(M0[:, 0]):
+        for j, pi in enumerate(pi_c[0]):
+            print(f"M0 = {M:3.1f}   pi_c = {pi:4.1f}   F/mdot = {cycle['F_mdot'][i, j]:8.2f} N s/kg   TSFC = {1e6 * cycle['TSFC'][i, j]:7.2f} mg/(N s)")
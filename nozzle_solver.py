@@ -0,0 +1,221 @@
+"""
+Nozzle Solver
+Start Date        : 10/18/2026
+Modification Date : 10/18/2026
+"""
+
+
+
+# Imports =========================================================================================
+# Local Imports -----------------------------------------------------------------------------------
+import numpy as np
+
+
+# Global Imports ----------------------------------------------------------------------------------
+# Flow Solvers ------------------------------------------------------------------------------------
+from Flow_Solvers.isentropic_flow import A_Astar, P_Pt, T_Tt, M_from_A_Astar, M_from_P_Pt
+from Flow_Solvers.normal_shock import P2_P1, SOLVE_M_from_Pt2_Pt1, dPt2_Pt1_dM
+from Flow_Solvers.batch_solver import newton_bisect
+
+
+
+# Nozzle Regimes ==================================================================================
+# Ordered from the highest to the lowest back pressure. 'regime_code' indexes this tuple.
+NOZZLE_REGIMES : tuple[str, ...] = ('Subsonic', 'Choked', 'Shock', 'Overexpanded', 'Design', 'Underexpanded')
+REGIME_RTOL    : float = 1e-9
+
+def critical_pressures(Ae_At, gamma):
+    """
+    Back pressure ratios Pb/Pt0 that separate the nozzle regimes.
+
+    Parameters:
+    - Ae_At (float) : Exit to throat area ratio
+    - gamma (float) : Heat capacity ratio
+
+    Returns:
+    - (dict[str, float]) : 'choked' (subsonic exit with a sonic throat), 'shock_exit' (normal shock at the exit),
+                           and 'design' (shock-free supersonic exit)
+    """
+
+    Me_sup = M_from_A_Astar(Ae_At, gamma, supersonic = True)
+    design = P_Pt(Me_sup, gamma)
+
+    return {
+        'choked'     : P_Pt(M_from_A_Astar(Ae_At, gamma, supersonic = False), gamma),
+        'shock_exit' : design * P2_P1(Me_sup, gamma),
+        'design'     : design,
+    }
+
+
+def _M_exit_after_shock(Pb_Ae_Pt_At, gamma):
+    """
+    Subsonic exit Mach number behind a shock in the divergent section.
+    Mass conservation gives (Pe / Pt2)(Ae / A2*) = Pb Ae / (Pt0 At), which is quadratic in M^2.
+    """
+
+    C = (2 / (gamma + 1)) ** ((gamma + 1) / (2 * (gamma - 1)))
+    return np.sqrt((np.sqrt(1 + 2 * (gamma - 1) * (C / Pb_Ae_Pt_At)**2) - 1) / (gamma - 1))
+
+
+
+# Nozzle Solver ===================================================================================
+def solve_nozzle(x, A, Pb_Pt, gamma = 1.4):
+    """
+    Solves the quasi-1D flow through a converging-diverging nozzle for one or many back pressures.
+    The throat is the station of minimum area. The divergent area must increase monotonically so that a
+    shock area maps to a single location.
+
+    Regimes, from the highest to the lowest back pressure:
+    - 'Subsonic'      : Subsonic throughout, the throat is not sonic
+    - 'Choked'        : Sonic throat, subsonic divergent flow
+    - 'Shock'         : Normal shock in the divergent section, subsonic exit
+    - 'Overexpanded'  : Supersonic exit, Pe < Pb (oblique shocks outside of the nozzle)
+    - 'Design'        : Supersonic exit, Pe = Pb
+    - 'Underexpanded' : Supersonic exit, Pe > Pb (expansion fans outside of the nozzle)
+
+    Station Mach numbers use the tabulated A/A* inverse. The geometry-only branches are inverted once
+    and shared by every back pressure, only the subsonic and post-shock stations depend on Pb.
+
+    Parameters:
+    - x (np.ndarray)     : Axial stations, increasing
+    - A (np.ndarray)     : Area at each station
+    - Pb_Pt (float)      : Back pressure over the inlet stagnation pressure, or a NumPy array of them
+    - gamma (float)      : Heat capacity ratio, default at 1.4
+
+    Returns:
+    - (dict) : Scalar 'Pb_Pt' returns floats and (stations,) profiles, array 'Pb_Pt' returns (back pressures,) values
+               and (back pressures, stations) profiles
+        - 'regime' (str) / 'regime_code' (int) : Regime name and its index in 'NOZZLE_REGIMES'
+        - 'x_shock', 'A_shock', 'M_shock'      : Shock location, area, and upstream Mach number, NaN without a shock
+        - 'Me', 'Pe_Pt', 'Pt_exit_Pt'          : Exit Mach number, exit static and stagnation pressure ratios
+        - 'M', 'P_Pt', 'T_Tt', 'Pt_Pt'         : Profiles along x, ratios against the inlet stagnation state
+        - 'critical' (dict)                    : The 'critical_pressures' of the nozzle
+
+    Raises:
+    - ValueError : If a scalar Pb/Pt0 is outside of 0 < Pb/Pt0 <= 1
+
+    Example:
+    >>> x = np.linspace(0, 1, 201)
+    >>> A = 1 + 2 * (x - 0.3)**2
+    >>> solve_nozzle(x, A, np.linspace(0.1, 0.99, 500))['x_shock']
+    """
+
+    x         = np.asarray(x, dtype = float)
+    A         = np.asarray(A, dtype = float)
+    is_scalar = (np.ndim(Pb_Pt) == 0)
+    Pb        = np.atleast_1d(np.asarray(Pb_Pt, dtype = float))
+
+    if (is_scalar and (not 0 < Pb[0] <= 1)):
+        raise ValueError('0 < Pb_Pt <= 1')
+
+    Pb     = np.where((Pb > 0) & (Pb <= 1), Pb, np.nan)
+    throat = int(np.argmin(A))
+    At     = A[throat]
+    Ae_At  = A[-1] / At
+    limits = critical_pressures(Ae_At, gamma)
+
+
+    # Regime Classification -----------------------------------------------------------------------
+    near = lambda value: np.isclose(Pb, value, rtol = REGIME_RTOL, atol = 0)
+    code = np.select(
+        [near(limits['choked']), Pb > limits['choked'], near(limits['design']), Pb >= limits['shock_exit'],
+         Pb > limits['design'], Pb < limits['design']],
+        [1, 0, 4, 2, 3, 5], default = -1)
+
+    # A nozzle without a divergent section has no shock or overexpanded range
+    if (Ae_At == 1):
+        code = np.where(np.isin(code, [2, 3, 4]), 1, code)
+
+
+    # Geometry Branches ---------------------------------------------------------------------------
+    # With a sonic throat, the stations upstream of it are subsonic and the ones downstream supersonic
+    r         = A / At
+    divergent = (np.arange(A.size) > throat)
+    M_sub     = M_from_A_Astar(r, gamma, supersonic = False)
+    M_sup     = np.where(divergent, M_from_A_Astar(r, gamma, supersonic = True), M_sub)
+
+    M      = np.broadcast_to(M_sup, (Pb.size, A.size)).copy()
+    Pt_Pt0 = np.ones((Pb.size, A.size))
+
+
+    # Subsonic Nozzle -----------------------------------------------------------------------------
+    # The exit Mach number follows from Pe = Pb, and it sets a virtual A* larger than the throat.
+    subsonic = (code == 0)
+    if (np.any(subsonic)):
+        with np.errstate(divide = 'ignore'):
+            Me        = M_from_P_Pt(Pb[subsonic], gamma)
+            Astar     = A[-1] / A_Astar(Me, gamma)
+            M_virtual = M_from_A_Astar(A[None, :] / Astar[:, None], gamma, supersonic = False)
+        M[subsonic] = np.where(Me[:, None] > 0, M_virtual, 0)
+
+    # Choked Subsonic Nozzle ----------------------------------------------------------------------
+    M[code == 1] = M_sub
+
+
+    # Shock in the Divergent Section --------------------------------------------------------------
+    # Pt2/Pt0 follows from the subsonic exit Mach number, and it fixes the upstream shock Mach number.
+    x_shock = np.full(Pb.size, np.nan)
+    A_shock = np.full(Pb.size, np.nan)
+    M_shock = np.full(Pb.size, np.nan)
+
+    shock = (code == 2)
+    if (np.any(shock)):
+        Me_shock       = _M_exit_after_shock(Pb[shock] * Ae_At, gamma)
+        Pt2_Pt0        = np.minimum(Pb[shock] / P_Pt(Me_shock, gamma), 1)
+        M_shock[shock] = newton_bisect(SOLVE_M_from_Pt2_Pt1, dPt2_Pt1_dM, Pt2_Pt0, 1, 1e6, args = (gamma,), log_step = True)
+        A_shock[shock] = At * A_Astar(M_shock[shock], gamma)
+        x_shock[shock] = np.interp(A_shock[shock], A[throat:], x[throat:])
+
+        # Behind the shock the flow is subsonic with A2* = At Pt0 / Pt2
+        behind = divergent[None, :] & (x[None, :] > x_shock[shock, None])
+        rows, cols = np.nonzero(behind)
+        Pt_behind  = Pt2_Pt0[rows]
+
+        M_shocked = M[shock]
+        M_shocked[rows, cols] = M_from_A_Astar(r[cols] * Pt_behind, gamma, supersonic = False)
+        M[shock] = M_shocked
+
+        Pt_shocked = Pt_Pt0[shock]
+        Pt_shocked[rows, cols] = Pt_behind
+        Pt_Pt0[shock] = Pt_shocked
+
+
+    # Data Organization ---------------------------------------------------------------------------
+    invalid = (code < 0)
+    M[invalid]      = np.nan
+    Pt_Pt0[invalid] = np.nan
+
+    P_Pt0 = P_Pt(M, gamma) * Pt_Pt0
+    T_Tt0 = T_Tt(M, gamma)
+
+    results = {
+        'regime'      : np.array([NOZZLE_REGIMES[c] if (c >= 0) else '' for c in code]),
+        'regime_code' : code,
+        'x_shock'     : x_shock,
+        'A_shock'     : A_shock,
+        'M_shock'     : M_shock,
+        'Me'          : M[:, -1],
+        'Pe_Pt'       : P_Pt0[:, -1],
+        'Pt_exit_Pt'  : Pt_Pt0[:, -1],
+        'M'           : M,
+        'P_Pt'        : P_Pt0,
+        'T_Tt'        : T_Tt0,
+        'Pt_Pt'       : Pt_Pt0,
+    }
+
+    if (is_scalar):
+        results = {key: (value[0].item() if (value.ndim == 1) else value[0]) for key, value in results.items()}
+
+    results['critical'] = limits
+    return results
+
+
+
+# Given Data ======================================================================================
+if (__name__ == '__main__'):
+    x = np.linspace(0, 1, 11)
+    A = 1 + 2 * (x - 0.3)**2
+
+    for Pb_Pt in [0.99, 0.8, 0.3, 0.1]:
+        nozzle = solve_nozzle(x, A, Pb_Pt)
+        print(f"Pb/Pt0 = {Pb_Pt:<5} {nozzle['regime']:<14} x_shock = {nozzle['x_shock']:.4f}   Me = {nozzle['Me']:.4f}   Pe/Pt0 = {nozzle['Pe_Pt']:.4f}")
@@ -0,0 +1,150 @@
+"""
+Rocket Performance
+Start Date        : 10/18/2026
+Modification Date : 10/18/2026
+"""
+
+
+
+# Imports =========================================================================================
+# Local Imports -----------------------------------------------------------------------------------
+import numpy as np
+
+
+# Global Imports ----------------------------------------------------------------------------------
+# Flow Solvers ------------------------------------------------------------------------------------
+from Flow_Solvers.isentropic_flow import P_Pt, M_from_A_Astar
+
+
+
+# Rocket Definitions ==============================================================================
+# The definitions of 'RPE Notes/RPENotes.tex', all of them broadcast over NumPy arrays
+# G0 is standard gravity [m/s^2], SUMMERFIELD the Pe / Pa below which the nozzle flow is expected to separate
+G0          : float = 9.80665
+SUMMERFIELD : float = 0.4
+
+
+def specific_impulse(I_t, m_p, g0 = G0):
+    # I_S = I_t / (m_p g0) [s]
+    return I_t / (m_p * g0)
+
+def effective_exhaust_velocity(I_S, g0 = G0):
+    # c = I_S g0 = F / mdot [m/s]
+    return I_S * g0
+
+def mass_ratio(m_f, m_0):
+    # MR = m_f / m_0
+    return m_f / m_0
+
+def propellant_mass_fraction(m_p, m_0):
+    # zeta = m_p / m_0
+    return m_p / m_0
+
+def impulse_to_weight(I_t, m_f, m_p, g0 = G0):
+    # I_t / w_0 = I_t / ((m_f + m_p) g0)
+    return I_t / ((m_f + m_p) * g0)
+
+def delta_v(c, MR):
+    # Ideal rocket equation, dV = c ln(1 / MR) = c ln(m_0 / m_f)
+    return -c * np.log(MR)
+
+
+
+# Nozzle Performance ==============================================================================
+def characteristic_velocity(Tc, R, gamma):
+    """
+    Characteristic velocity c* = sqrt(gamma R Tc) / (gamma (2 / (gamma + 1))^((gamma + 1) / (2 (gamma - 1)))) [m/s].
+    """
+
+    return np.sqrt(gamma * R * Tc) / (gamma * (2 / (gamma + 1))**((gamma + 1) / (2 * (gamma - 1))))
+
+
+def thrust_coefficient(Pe_Pc, Pa_Pc, eps, gamma):
+    """
+    Thrust coefficient C_F of an ideal nozzle, the momentum term plus the pressure thrust (Pe - Pa) Ae / (Pc At).
+    """
+
+    Gamma = np.sqrt(gamma) * (2 / (gamma + 1))**((gamma + 1) / (2 * (gamma - 1)))
+    with np.errstate(invalid = 'ignore'):
+        momentum = Gamma * np.sqrt((2 * gamma / (gamma - 1)) * (1 - Pe_Pc**((gamma - 1) / gamma)))
+    return momentum + (Pe_Pc - Pa_Pc) * eps
+
+
+def rocket_performance(Pc, eps, Pa, Tc, R, gamma = 1.2, MR = None, g0 = G0):
+    """
+    Ideal rocket nozzle performance, vectorized over chamber pressure, expansion ratio, and ambient pressure.
+    The inputs broadcast against each other, so Pc[:, None, None], eps[None, :, None], and Pa[None, None, :]
+    give a (Pc, eps, Pa) sweep. The exit Mach number and Pe/Pc are evaluated on the 'eps' array alone,
+    through the tabulated supersonic A/A* inverse and P/Pt, before they are broadcast.
+
+    Parameters:
+    - Pc (float)    : Chamber (stagnation) pressure [Pa], or a NumPy array
+    - eps (float)   : Nozzle expansion ratio Ae / At, or a NumPy array
+    - Pa (float)    : Ambient pressure [Pa], or a NumPy array
+    - Tc (float)    : Chamber temperature [K]
+    - R (float)     : Specific gas constant of the combustion products [J/(kg K)]
+    - gamma (float) : Heat capacity ratio of the combustion products, default at 1.2
+    - MR (float)    : Mass ratio m_f / m_0 for the ideal velocity increment, default at None (no 'delta_v')
+    - g0 (float)    : Standard gravity [m/s^2], default at 'G0'
+
+    Returns:
+    - (dict[str, np.ndarray]) : Arrays of the broadcast input shape
+        - 'Me', 'Pe' : Exit Mach number and exit pressure [Pa]
+        - 'C_F'      : Thrust coefficient F / (Pc At)
+        - 'c_star'   : Characteristic velocity [m/s]
+        - 'c'        : Effective exhaust velocity C_F c* [m/s]
+        - 'Isp'      : Specific impulse [s]
+        - 'mdot_At'  : Propellant mass flow per throat area Pc / c* [kg/(s m^2)]
+        - 'separated': True where Pe < 'SUMMERFIELD' Pa, the flow likely separates and C_F is optimistic
+        - 'delta_v'  : Ideal velocity increment [m/s], only with 'MR'
+
+    Example:
+    >>> Pc  = np.linspace(2e6, 20e6, 100)[:, None, None]
+    >>> eps = np.linspace(4, 80, 100)[None, :, None]
+    >>> Pa  = np.linspace(0, 101325, 10)[None, None, :]
+    >>> rocket_performance(Pc, eps, Pa, Tc = 3500, R = 8314.46 / 22, MR = 0.1)['Isp']
+    """
+
+    Pc  = np.asarray(Pc, dtype = float)
+    eps = np.asarray(eps, dtype = float)
+    Pa  = np.asarray(Pa, dtype = float)
+
+    # Nozzle Exit ---------------------------------------------------------------------------------
+    Me    = M_from_A_Astar(eps, gamma, supersonic = True)
+    Pe_Pc = P_Pt(Me, gamma)
+
+    # Performance ---------------------------------------------------------------------------------
+    C_F    = thrust_coefficient(Pe_Pc, Pa / Pc, eps, gamma)
+    c_star = characteristic_velocity(Tc, R, gamma)
+    c      = C_F * c_star
+    shape  = np.broadcast_shapes(Pc.shape, eps.shape, Pa.shape)
+    Pe     = Pe_Pc * Pc
+
+    results = {
+        'Me'        : np.broadcast_to(Me, shape),
+        'Pe'        : np.broadcast_to(Pe, shape),
+        'C_F'       : np.broadcast_to(C_F, shape),
+        'c_star'    : np.broadcast_to(c_star, shape),
+        'c'         : np.broadcast_to(c, shape),
+        'Isp'       : np.broadcast_to(c / g0, shape),
+        'mdot_At'   : np.broadcast_to(Pc / c_star, shape),
+        'separated' : np.broadcast_to(Pe < SUMMERFIELD * Pa, shape),
+    }
+
+    if (MR is not None):
+        results['delta_v'] = np.broadcast_to(delta_v(c, MR), np.broadcast_shapes(shape, np.shape(MR)))
+
+    return results
+
+
+
+# Given Data ======================================================================================
+if (__name__ == '__main__'):
+    Pc  = 7e6
+    eps = np.array([10, 40, 80])
+    Pa  = np.array([101325, 0])[:, None]
+
+    rocket = rocket_performance(Pc, eps, Pa, Tc = 3500, R = 8314.46 / 22, gamma = 1.2, MR = 0.15)
+    for i, ambient in enumerate(['Sea Level', 'Vacuum']):
+        for j, ratio in enumerate(eps):
+            print(f"{ambient:9s}  eps = {ratio:3d}   C_F = {rocket['C_F'][i, j]:.4f}   Isp = {rocket['Isp'][i, j]:6.1f} s   dV = {rocket['delta_v'][i, j]:7.1f} m/s")
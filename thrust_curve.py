@@ -0,0 +1,323 @@
+"""
+Thrust Curve
+Start Date        : 10/18/2026
+Modification Date : 10/18/2026
+
+Streams static fire logs (time, thrust, and optionally propellant mass flow) in fixed size chunks and
+integrates them incrementally, so multi-gigabyte traces are reduced with bounded memory:
+    python thrust_curve.py firing.csv --mdot-col 2
+    python thrust_curve.py firing.bin --binary-columns 3 --dtype <f4 --mdot-col 2
+"""
+
+
+
+# Imports =========================================================================================
+# Local Imports -----------------------------------------------------------------------------------
+import argparse
+from itertools import chain, islice
+
+import numpy as np
+
+
+# Global Imports ----------------------------------------------------------------------------------
+# Rocket Performance ------------------------------------------------------------------------------
+from rocket_performance import G0, specific_impulse, effective_exhaust_velocity
+
+
+
+# Chunk Readers ===================================================================================
+CHUNK_ROWS         : int = 1000000
+THRESHOLD_FRACTION : float = 0.05
+METHODS            : tuple[str, ...] = ('trapezoid', 'simpson')
+
+
+def iter_csv_chunks(path, columns, chunk_rows = CHUNK_ROWS, delimiter = ',', skip_header = 0):
+    """
+    Reads the given columns of a delimited text file, 'chunk_rows' lines at a time.
+
+    Parameters:
+    - path (str)         : Text file
+    - columns (tuple)    : Column indices to keep
+    - chunk_rows (int)   : Rows per chunk, default at 'CHUNK_ROWS'
+    - delimiter (str)    : Column delimiter, default at ','
+    - skip_header (int)  : Leading lines to skip, default at 0
+
+    Returns:
+    - (generator) : Arrays of shape (rows, len(columns))
+    """
+
+    with open(path) as file:
+        for _ in range(skip_header):
+            next(file, None)
+
+        while (True):
+            lines = islice(file, chunk_rows)
+            first = next(lines, None)
+            if (first is None):
+                return
+            yield np.loadtxt(chain([first], lines), delimiter = delimiter, usecols = columns, ndmin = 2)
+
+
+def iter_binary_chunks(path, columns, n_columns, dtype = '<f8', chunk_rows = CHUNK_ROWS, offset = 0):
+    """
+    Reads the given columns of a headerless row-major binary file through a memory map, 'chunk_rows' rows at a time.
+
+    Parameters:
+    - path (str)         : Binary file of 'n_columns' values per row
+    - columns (tuple)    : Column indices to keep
+    - n_columns (int)    : Values per row
+    - dtype (str)        : Value type, default at '<f8'
+    - chunk_rows (int)   : Rows per chunk, default at 'CHUNK_ROWS'
+    - offset (int)       : Header bytes to skip, default at 0
+
+    Returns:
+    - (generator) : Arrays of shape (rows, len(columns))
+    """
+
+    data = np.memmap(path, dtype = dtype, mode = 'r', offset = offset)
+    data = data[:data.size - data.size % n_columns].reshape(-1, n_columns)
+    for start in range(0, data.shape[0], chunk_rows):
+        yield np.array(data[start:start + chunk_rows, list(columns)], dtype = float)
+
+
+
+# Impulse Integrator ==============================================================================
+def _simpson_pairs(t, y):
+    """
+    Composite Simpson rule over consecutive interval pairs of an unevenly spaced series (odd number of samples).
+    """
+
+    h0 = t[1:-1:2] - t[:-2:2]
+    h1 = t[2::2] - t[1:-1:2]
+    return np.sum((h0 + h1) / 6 * ((2 - h1 / h0) * y[:-2:2] + (h0 + h1)**2 / (h0 * h1) * y[1:-1:2] + (2 - h0 / h1) * y[2::2]))
+
+
+def _trapezoid(t, y):
+    return np.sum(0.5 * (y[1:] + y[:-1]) * np.diff(t))
+
+
+class ImpulseIntegrator:
+    """
+    Running integrals of thrust and propellant mass flow over a time series fed in chunks.
+    Only the last one or two samples are carried between chunks, so memory is bounded by the chunk size.
+    With 'simpson', the samples are integrated in interval pairs and a pending single interval is closed
+    with the trapezoid rule when the results are read.
+
+    Attributes:
+    - method (str)       : 'trapezoid' or 'simpson'
+    - threshold (float)  : Thrust [N] bounding the burn, None to skip the burn time
+    - samples (int)      : Samples seen
+
+    Methods:
+    - update()  : Adds one chunk of (t, F, mdot)
+    - results() : I_t, m_p, Is, c, and the burn time statistics so far
+    """
+
+    def __init__(self, method = 'trapezoid', threshold = None):
+        """
+        Constructor of an empty integrator.
+
+        Parameters:
+        - method (str)      : 'trapezoid' or 'simpson', default at 'trapezoid'
+        - threshold (float) : Thrust [N] above which the motor is burning, default at None (no burn time)
+
+        Raises:
+        - ValueError : If the method is not in 'METHODS'
+        """
+
+        if (method not in METHODS):
+            raise ValueError(f"Invalid method '{method}'. Must be one of {METHODS}.")
+
+        self.method    = method
+        self.threshold = threshold
+        self.samples   = 0
+
+        self._I_t  = 0.0
+        self._m_p  = 0.0
+        self._tail = np.empty((0, 3))
+
+        self._t_first    = np.nan
+        self._peak       = -np.inf
+        self._peak_time  = np.nan
+        self._burn_start = np.nan
+        self._burn_end   = np.nan
+
+
+    def update(self, t, F, mdot = None):
+        """
+        Adds one chunk of samples, continuing the integrals from the previous chunk.
+
+        Parameters:
+        - t (np.ndarray)    : Strictly increasing times [s]
+        - F (np.ndarray)    : Thrust [N]
+        - mdot (np.ndarray) : Propellant mass flow [kg/s], default at None (zero)
+
+        Raises:
+        - ValueError : If the time does not increase, within the chunk or from the previous one
+        """
+
+        t = np.asarray(t, dtype = float)
+        if (t.size == 0):
+            return
+
+        F    = np.asarray(F, dtype = float)
+        mdot = np.zeros_like(t) if (mdot is None) else np.asarray(mdot, dtype = float)
+
+        series = np.concatenate([self._tail, np.column_stack([t, F, mdot])])
+        if (np.any(np.diff(series[:, 0]) <= 0)):
+            raise ValueError('Time samples must be strictly increasing.')
+
+        # Chunk Statistics ------------------------------------------------------------------------
+        if (self.samples == 0):
+            self._t_first = t[0]
+        self.samples += t.size
+
+        peak = np.argmax(F)
+        if (F[peak] > self._peak):
+            self._peak, self._peak_time = F[peak], t[peak]
+
+        if (self.threshold is not None):
+            burning = np.flatnonzero(F >= self.threshold)
+            if (burning.size):
+                if (np.isnan(self._burn_start)):
+                    self._burn_start = t[burning[0]]
+                self._burn_end = t[burning[-1]]
+
+        # Running Integrals -----------------------------------------------------------------------
+        if (self.method == 'trapezoid'):
+            used = series.shape[0]
+            self._I_t += _trapezoid(series[:, 0], series[:, 1])
+            self._m_p += _trapezoid(series[:, 0], series[:, 2])
+        else:
+            used = series.shape[0] - (series.shape[0] - 1) % 2
+            if (used >= 3):
+                self._I_t += _simpson_pairs(series[:used, 0], series[:used, 1])
+                self._m_p += _simpson_pairs(series[:used, 0], series[:used, 2])
+
+        self._tail = series[max(used - 1, 0):].copy()
+
+
+    def results(self, m_p = None, g0 = G0):
+        """
+        Integrals and burn statistics of every sample added so far.
+
+        Parameters:
+        - m_p (float) : Propellant mass [kg], default at None (the integrated mass flow)
+        - g0 (float)  : Standard gravity [m/s^2], default at 'G0'
+
+        Returns:
+        - (dict[str, float]) :
+            - 'I_t'                 : Total impulse [N s]
+            - 'm_p'                 : Propellant mass [kg]
+            - 'Is', 'c'             : Specific impulse [s] and effective exhaust velocity [m/s], NaN without a propellant mass
+            - 'peak_thrust', 'peak_time' : Maximum thrust [N] and its time [s]
+            - 'duration', 'samples' : Time span [s] and number of samples
+            - 'burn_start', 'burn_end', 'burn_time' : Times bounding F >= threshold [s], NaN without a threshold
+            - 'average_thrust'      : I_t / burn_time [N]
+        """
+
+        I_t, m_dot_int = self._I_t, self._m_p
+        if (self._tail.shape[0] == 2):
+            I_t       += _trapezoid(self._tail[:, 0], self._tail[:, 1])
+            m_dot_int += _trapezoid(self._tail[:, 0], self._tail[:, 2])
+
+        m_p = m_dot_int if (m_p is None) else m_p
+        Is  = specific_impulse(I_t, m_p, g0) if (m_p > 0) else np.nan
+        t_last    = self._tail[-1, 0] if (self._tail.shape[0]) else np.nan
+        burn_time = self._burn_end - self._burn_start
+
+        return {
+            'I_t'            : I_t,
+            'm_p'            : m_p,
+            'Is'             : Is,
+            'c'              : effective_exhaust_velocity(Is, g0),
+            'peak_thrust'    : self._peak if (self.samples) else np.nan,
+            'peak_time'      : self._peak_time,
+            'duration'       : t_last - self._t_first,
+            'samples'        : self.samples,
+            'burn_start'     : self._burn_start,
+            'burn_end'       : self._burn_end,
+            'burn_time'      : burn_time,
+            'average_thrust' : I_t / burn_time if (burn_time > 0) else np.nan,
+        }
+
+
+
+# File Integration ================================================================================
+def integrate_file(path, time_col = 0, thrust_col = 1, mdot_col = None, binary_columns = None, dtype = '<f8',
+                   chunk_rows = CHUNK_ROWS, method = 'trapezoid', threshold = None,
+                   threshold_fraction = THRESHOLD_FRACTION, m_p = None, g0 = G0, **reader_kwargs):
+    """
+    Streams a static fire log through an 'ImpulseIntegrator'.
+    An absolute 'threshold' is a single pass. A 'threshold_fraction' of the peak thrust needs the peak first,
+    so the time and thrust columns are streamed a second time for the burn bounds.
+
+    Parameters:
+    - path (str)                  : CSV / text log, or a headerless binary log when 'binary_columns' is given
+    - time_col (int)              : Time column [s], default at 0
+    - thrust_col (int)            : Thrust column [N], default at 1
+    - mdot_col (int)              : Propellant mass flow column [kg/s], default at None
+    - binary_columns (int)        : Values per row of a binary log, default at None (text log)
+    - dtype (str)                 : Value type of a binary log, default at '<f8'
+    - chunk_rows (int)            : Rows per chunk, default at 'CHUNK_ROWS'
+    - method (str)                : 'trapezoid' or 'simpson', default at 'trapezoid'
+    - threshold (float)           : Absolute burn threshold [N], default at None
+    - threshold_fraction (float)  : Burn threshold as a fraction of the peak thrust when 'threshold' is None,
+                                    default at 'THRESHOLD_FRACTION', None to skip the burn time
+    - m_p (float)                 : Propellant mass [kg], default at None (the integrated mass flow)
+    - g0 (float)                  : Standard gravity [m/s^2], default at 'G0'
+    - reader_kwargs               : 'delimiter' and 'skip_header' of a text log, or 'offset' of a binary log
+
+    Returns:
+    - (dict[str, float]) : 'ImpulseIntegrator.results'
+
+    Example:
+    >>> integrate_file('firing.csv', mdot_col = 2, skip_header = 1, method = 'simpson')['Is']
+    """
+
+    def chunks(columns):
+        if (binary_columns is None):
+            return iter_csv_chunks(path, columns, chunk_rows, **reader_kwargs)
+        return iter_binary_chunks(path, columns, binary_columns, dtype, chunk_rows, **reader_kwargs)
+
+    columns    = (time_col, thrust_col) + (() if (mdot_col is None) else (mdot_col,))
+    integrator = ImpulseIntegrator(method, threshold)
+    for chunk in chunks(columns):
+        integrator.update(chunk[:, 0], chunk[:, 1], chunk[:, 2] if (mdot_col is not None) else None)
+
+    if ((threshold is None) and (threshold_fraction is not None) and (integrator.samples)):
+        burn = ImpulseIntegrator(method, threshold_fraction * integrator.results()['peak_thrust'])
+        for chunk in chunks((time_col, thrust_col)):
+            burn.update(chunk[:, 0], chunk[:, 1])
+        integrator.threshold = burn.threshold
+        integrator._burn_start, integrator._burn_end = burn._burn_start, burn._burn_end
+
+    return integrator.results(m_p, g0)
+
+
+
+# Given Data ======================================================================================
+if (__name__ == '__main__'):
+    parser = argparse.ArgumentParser(description = 'Total and specific impulse of a static fire log')
+    parser.add_argument('path', help = 'CSV / text log, or a binary log with --binary-columns')
+    parser.add_argument('--time-col', type = int, default = 0)
+    parser.add_argument('--thrust-col', type = int, default = 1)
+    parser.add_argument('--mdot-col', type = int, help = 'Propellant mass flow column')
+    parser.add_argument('--binary-columns', type = int, help = 'Values per row of a headerless binary log')
+    parser.add_argument('--dtype', default = '<f8', help = 'Value type of a binary log')
+    parser.add_argument('--skip-header', type = int, default = 0, help = 'Header lines of a text log')
+    parser.add_argument('--delimiter', default = ',')
+    parser.add_argument('--chunk-rows', type = int, default = CHUNK_ROWS)
+    parser.add_argument('--method', choices = METHODS, default = 'trapezoid')
+    parser.add_argument('--threshold', type = float, help = 'Absolute burn threshold [N]')
+    parser.add_argument('--threshold-fraction', type = float, default = THRESHOLD_FRACTION)
+    parser.add_argument('--propellant-mass', type = float, help = 'Propellant mass [kg] when there is no mass flow column')
+    args = parser.parse_args()
+
+    reader = ({'skip_header': args.skip_header, 'delimiter': args.delimiter} if (args.binary_columns is None) else {})
+    results = integrate_file(args.path, args.time_col, args.thrust_col, args.mdot_col, args.binary_columns, args.dtype,
+                             args.chunk_rows, args.method, args.threshold, args.threshold_fraction,
+                             args.propellant_mass, **reader)
+
+    for key, value in results.items():
+        print(f'{key:15s} : {value:.6g}')